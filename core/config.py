@@ -6,6 +6,12 @@ READ_CHUNK_SIZE = 1024 * 1024  # 読み取りチャンクサイズ
 FLUSH_INTERVAL_SEC = 5  # 定期フラッシュ間隔
 DEFAULT_AUTO_ENABLED = False  # 自動録画の既定有効状態
 DEFAULT_AUTO_CHECK_INTERVAL_SEC = 10  # 自動監視の既定間隔秒
+AUTO_CHECK_MAX_WORKERS = 8  # 自動監視でURLを並行して確認する最大数
+AUTO_CHECK_MAX_ABANDONED_PROBES = 8  # 停止後も応答待ちで残る確認の上限 (超えている間は次の監視を始めない)
+AUTO_CHECK_LIVE_CACHE_INTERVALS = 1.5  # 配信中と確認したURLを再確認せずに扱う期間 (監視間隔の倍数、次の周期まで有効)
+AUTO_CHECK_LOG_BATCH_LINES = 16  # 自動監視のログをまとめて画面へ送る行数
+AUTO_CHECK_LOG_BATCH_SEC = 0.1  # 自動監視のログを溜め始めてから画面へ送るまでの秒数
+AUTO_CHECK_STOP_POLL_SEC = 0.2  # 自動監視の確認待ち中に停止要求を確認する間隔
 DEFAULT_RECORDING_QUALITY = DEFAULT_QUALITY  # 録画画質の既定値
 DEFAULT_RECORDING_MAX_SIZE_MB = 0  # 録画ファイルの最大サイズ(MB)の既定値
 DEFAULT_RECORDING_SIZE_MARGIN_MB = 50  # 録画サイズ切替の余裕(MB)
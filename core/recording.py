@@ -55,6 +55,12 @@ def find_ffmpeg_path() -> Optional[str]:  # ffmpegのパスを解決
         return str(preferred)
     return shutil.which("ffmpeg")  # PATHを検索
 
+def _file_size(path: Path) -> Optional[int]:  # ファイルサイズを取得 (存在しない場合はNone)
+    try:
+        return path.stat().st_size  # exists()とstat()を分けずに1回で問い合わせる
+    except OSError:
+        return None
+
 def find_ffprobe_path() -> Optional[str]:  # ffprobeのパスを解決
     env_path = os.environ.get("FFMPEG_PATH", "").strip()
     if env_path:
@@ -100,6 +106,113 @@ def _probe_media_duration(input_path: Path) -> Optional[float]:
         return None
     return duration
 
+HW_H264_ENCODER_ARGS: dict[str, tuple[str, ...]] = {  # 優先順のハードウェアH.264エンコーダ
+    "h264_nvenc": ("-c:v", "h264_nvenc", "-preset", "p1", "-tune", "ll", "-b:v", "2M"),
+    "h264_qsv": ("-c:v", "h264_qsv", "-preset", "veryfast", "-b:v", "2M"),
+    "h264_amf": ("-c:v", "h264_amf", "-quality", "speed", "-b:v", "2M"),
+    "h264_videotoolbox": ("-c:v", "h264_videotoolbox", "-realtime", "1", "-b:v", "2M"),
+}
+_HW_H264_ENCODER_STATE: dict[str, Optional[str]] = {}  # 検出結果のキャッシュ
+_HW_H264_ENCODER_LOCK = threading.Lock()  # 検出処理の排他
+
+def _h264_encoder_works(ffmpeg_path: str, name: str) -> bool:  # 短い試し書きで実際にエンコードできるか確認
+    # -encodersはビルドに含まれるエンコーダを列挙するだけで、対応GPUの有無までは分からない
+    try:
+        result = subprocess.run(
+            [
+                ffmpeg_path,
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-f",
+                "lavfi",
+                "-i",
+                "nullsrc=s=320x240",
+                "-t",
+                "0.1",
+                *HW_H264_ENCODER_ARGS[name],
+                "-pix_fmt",
+                "yuv420p",
+                "-f",
+                "null",
+                "-",
+            ],
+            capture_output=True,
+            check=False,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+def detect_hardware_h264_encoder() -> Optional[str]:  # 利用可能なHWエンコーダを一度だけ検出 (待機を伴うためワーカーで呼ぶ)
+    with _HW_H264_ENCODER_LOCK:
+        if "encoder" in _HW_H264_ENCODER_STATE:
+            return _HW_H264_ENCODER_STATE["encoder"]
+        _HW_H264_ENCODER_STATE["encoder"] = None
+        ffmpeg_path = find_ffmpeg_path()
+        if not ffmpeg_path:
+            return None
+        try:
+            result = subprocess.run(
+                [ffmpeg_path, "-hide_banner", "-encoders"],
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                check=False,
+                timeout=10,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        names = {parts[1] for parts in map(str.split, result.stdout.splitlines()) if len(parts) >= 2}
+        for name in HW_H264_ENCODER_ARGS:
+            if name in names and _h264_encoder_works(ffmpeg_path, name):
+                _HW_H264_ENCODER_STATE["encoder"] = name
+                break
+        return _HW_H264_ENCODER_STATE["encoder"]
+
+def get_detected_hardware_h264_encoder() -> Optional[str]:  # 検出済みのHWエンコーダを返す (検出前はNone、待たない)
+    return _HW_H264_ENCODER_STATE.get("encoder")
+
+def disable_hardware_h264_encoder() -> None:  # 実行に失敗したHWエンコーダを以後使わない
+    # 検出中のロックを待たない (失敗したエンコーダは検出完了後にしか使われない)
+    _HW_H264_ENCODER_STATE["encoder"] = None
+
+def probe_audio_codec(input_path: Path) -> Optional[str]:  # 先頭音声ストリームのコーデック名を取得
+    ffprobe_path = find_ffprobe_path()
+    if not ffprobe_path:
+        return None
+    try:
+        result = subprocess.run(
+            [
+                ffprobe_path,
+                "-v",
+                "error",
+                "-select_streams",
+                "a:0",
+                "-show_entries",
+                "stream=codec_name",
+                "-of",
+                "default=nokey=1:noprint_wrappers=1",
+                str(input_path),
+            ],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            check=False,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    codec = result.stdout.strip().splitlines()
+    return codec[0].strip().lower() if codec else None
+
 def _run_ffmpeg_command(
     command: list[str],
     input_path: Path,
@@ -270,6 +383,7 @@ def resolve_output_path(  # 出力パス決定
     url: Optional[str],  # 配信URL
     channel_label: Optional[str] = None,  # 配信者ラベル
 ) -> Path:  # 出力パスを返却
+    default_label = ""  # URLから生成した配信者ラベル (URLの解析は1回だけ行う)
     if channel_label:  # ラベルが指定されている場合
         safe_label = safe_filename_component(channel_label)  # ラベルを安全化
         output_dir = output_dir / safe_label  # 配信者ごとのフォルダを作成
@@ -285,7 +399,7 @@ def resolve_output_path(  # 出力パス決定
     else:  # 自動生成する場合
         name = build_default_recording_name()  # 既定の録画名を生成
         if load_bool_setting("output_filename_with_channel", False):
-            label_source = channel_label or (derive_channel_label(url) if url else "")
+            label_source = channel_label or default_label  # フォルダ用に生成済みのラベルを再利用
             safe_label = safe_filename_component(label_source)
             if safe_label:
                 name = f"{safe_label}_{name}"
@@ -361,12 +475,13 @@ def _apply_text_watermark(
     status_cb: Optional[Callable[[str], None]] = None,
     progress_cb: Optional[Callable[[int], None]] = None,
 ) -> Optional[Path]:
-    if not input_path.exists():
+    input_size = _file_size(input_path)  # 有無とサイズを1回で取得
+    if input_size is None:
         message = f"透かし対象ファイルが存在しません: {input_path}"
         if status_cb is not None:
             status_cb(message)
         return None
-    if input_path.stat().st_size == 0:
+    if input_size == 0:
         message = f"透かし対象ファイルが空です: {input_path}"
         if status_cb is not None:
             status_cb(message)
@@ -462,9 +577,8 @@ def _apply_text_watermark(
         if status_cb is not None:
             status_cb(message)
         return None
-    if not temp_output.exists() or temp_output.stat().st_size == 0:
-        if temp_output.exists():
-            temp_output.unlink(missing_ok=True)
+    if not _file_size(temp_output):  # 出力が無いか空の場合
+        temp_output.unlink(missing_ok=True)
         if status_cb is not None:
             status_cb("透かし合成の出力が空のため失敗扱いにします。")
         return None
@@ -499,12 +613,13 @@ def _apply_watermark(  # 透かし合成
     status_cb: Optional[Callable[[str], None]] = None,
     progress_cb: Optional[Callable[[int], None]] = None,
 ) -> Optional[Path]:
-    if not input_path.exists():
+    input_size = _file_size(input_path)  # 有無とサイズを1回で取得
+    if input_size is None:
         message = f"透かし対象ファイルが存在しません: {input_path}"
         if status_cb is not None:
             status_cb(message)
         return None
-    if input_path.stat().st_size == 0:
+    if input_size == 0:
         message = f"透かし対象ファイルが空です: {input_path}"
         if status_cb is not None:
             status_cb(message)
@@ -601,9 +716,8 @@ def _apply_watermark(  # 透かし合成
         if status_cb is not None:
             status_cb(message)
         return None
-    if not temp_output.exists() or temp_output.stat().st_size == 0:
-        if temp_output.exists():
-            temp_output.unlink(missing_ok=True)
+    if not _file_size(temp_output):  # 出力が無いか空の場合
+        temp_output.unlink(missing_ok=True)
         if status_cb is not None:
             status_cb("透かし合成の出力が空のため失敗扱いにします。")
         return None
@@ -653,12 +767,13 @@ def convert_to_mp4(  # MP4変換処理
     status_cb: Optional[Callable[[str], None]] = None,  # 状態通知コールバック
     progress_cb: Optional[Callable[[int], None]] = None,  # 進捗通知コールバック
 ) -> Optional[Path]:  # 返り値は出力パス
-    if not input_path.exists():  # 入力ファイルが無い場合
+    input_size = _file_size(input_path)  # 有無とサイズを1回で取得
+    if input_size is None:  # 入力ファイルが無い場合
         message = f"変換対象ファイルが存在しません: {input_path}"  # 通知文
         if status_cb is not None:  # コールバックが指定されている場合
             status_cb(message)  # 状態通知
         return None  # 変換不可
-    if input_path.stat().st_size == 0:  # サイズがゼロの場合
+    if input_size == 0:  # サイズがゼロの場合
         message = f"変換対象ファイルが空です: {input_path}"  # 通知文
         if status_cb is not None:  # コールバックが指定されている場合
             status_cb(message)  # 状態通知
@@ -749,12 +864,13 @@ def convert_to_mp4_light(  # MP4軽量変換処理
     status_cb: Optional[Callable[[str], None]] = None,  # 状態通知コールバック
     progress_cb: Optional[Callable[[int], None]] = None,  # 進捗通知コールバック
 ) -> Optional[Path]:  # 返り値は出力パス
-    if not input_path.exists():  # 入力ファイルが無い場合
+    input_size = _file_size(input_path)  # 有無とサイズを1回で取得
+    if input_size is None:  # 入力ファイルが無い場合
         message = f"変換対象ファイルが存在しません: {input_path}"  # 通知文
         if status_cb is not None:  # コールバックが指定されている場合
             status_cb(message)  # 状態通知
         return None  # 変換不可
-    if input_path.stat().st_size == 0:  # サイズがゼロの場合
+    if input_size == 0:  # サイズがゼロの場合
         message = f"変換対象ファイルが空です: {input_path}"  # 通知文
         if status_cb is not None:  # コールバックが指定されている場合
             status_cb(message)  # 状態通知
@@ -811,12 +927,13 @@ def convert_to_container_copy(  # コンテナ変換（コピー）
     status_cb: Optional[Callable[[str], None]] = None,  # 状態通知コールバック
     progress_cb: Optional[Callable[[int], None]] = None,  # 進捗通知コールバック
 ) -> Optional[Path]:  # 返り値は出力パス
-    if not input_path.exists():  # 入力ファイルが無い場合
+    input_size = _file_size(input_path)  # 有無とサイズを1回で取得
+    if input_size is None:  # 入力ファイルが無い場合
         message = f"変換対象ファイルが存在しません: {input_path}"
         if status_cb is not None:
             status_cb(message)
         return None
-    if input_path.stat().st_size == 0:  # サイズがゼロの場合
+    if input_size == 0:  # サイズがゼロの場合
         message = f"変換対象ファイルが空です: {input_path}"
         if status_cb is not None:
             status_cb(message)
@@ -859,12 +976,13 @@ def convert_to_audio(  # 音声変換処理
     status_cb: Optional[Callable[[str], None]] = None,  # 状態通知コールバック
     progress_cb: Optional[Callable[[int], None]] = None,  # 進捗通知コールバック
 ) -> Optional[Path]:  # 返り値は出力パス
-    if not input_path.exists():
+    input_size = _file_size(input_path)  # 有無とサイズを1回で取得
+    if input_size is None:
         message = f"変換対象ファイルが存在しません: {input_path}"
         if status_cb is not None:
             status_cb(message)
         return None
-    if input_path.stat().st_size == 0:
+    if input_size == 0:
         message = f"変換対象ファイルが空です: {input_path}"
         if status_cb is not None:
             status_cb(message)
@@ -956,8 +1074,14 @@ def convert_recording(  # 出力形式に合わせた変換
                     return watermarked_path
                 if status_cb is not None:
                     status_cb("透かし合成に失敗したため通常変換を続行します。")
-    if normalized_format == OUTPUT_FORMAT_MP4_COPY and input_path.suffix.lower() == ".mp4":
-        message = f"MP4形式のため変換をスキップします: {input_path}"
+    copy_suffix = {  # コンテナ変換のみの形式と拡張子
+        OUTPUT_FORMAT_MP4_COPY: ".mp4",
+        OUTPUT_FORMAT_MOV: ".mov",
+        OUTPUT_FORMAT_FLV: ".flv",
+        OUTPUT_FORMAT_MKV: ".mkv",
+    }.get(normalized_format)
+    if copy_suffix is not None and input_path.suffix.lower() == copy_suffix:  # 既に目的のコンテナの場合
+        message = f"{copy_suffix[1:].upper()}形式のため変換をスキップします: {input_path}"
         if status_cb is not None:
             status_cb(message)
         return input_path
@@ -980,12 +1104,13 @@ def compress_recording(  # 録画後の自動圧縮
     status_cb: Optional[Callable[[str], None]] = None,  # 状態通知コールバック
     progress_cb: Optional[Callable[[int], None]] = None,  # 進捗通知コールバック
 ) -> Optional[Path]:  # 返り値は出力パス
-    if not input_path.exists():
+    input_size = _file_size(input_path)  # 有無とサイズを1回で取得
+    if input_size is None:
         message = f"圧縮対象ファイルが存在しません: {input_path}"
         if status_cb is not None:
             status_cb(message)
         return None
-    if input_path.stat().st_size == 0:
+    if input_size == 0:
         message = f"圧縮対象ファイルが空です: {input_path}"
         if status_cb is not None:
             status_cb(message)
@@ -1,13 +1,23 @@
 # -*- coding: utf-8 -*-  # 文字コード指定
 from __future__ import annotations  # 型ヒントの将来互換対応
 import threading  # 停止フラグ制御
+import time  # 確認結果の有効期限
+from concurrent.futures import ThreadPoolExecutor, wait  # URL監視の並行確認
 from pathlib import Path  # パス操作
+from urllib.parse import urlsplit  # URLのホスト判定
 from PyQt6 import QtCore  # PyQt6のコア機能
-from streamlink import Streamlink  # Streamlink本体
+from streamlink import Streamlink  # Streamlink本体 (型ヒント用)
 from streamlink.exceptions import StreamlinkError  # Streamlink例外
 from apis.api_twitch import fetch_twitch_live_urls  # Twitch API処理
 from apis.api_youtube import fetch_youtube_live_urls_with_fallback  # YouTube API処理
 from utils.platform_utils import normalize_twitch_login  # Twitch入力の正規化
+from core.config import (  # 自動監視の確認設定
+    AUTO_CHECK_LOG_BATCH_LINES,  # ログをまとめて送る行数
+    AUTO_CHECK_LOG_BATCH_SEC,  # ログを溜めてから送るまでの秒数
+    AUTO_CHECK_MAX_ABANDONED_PROBES,  # 停止後に残る確認の上限
+    AUTO_CHECK_MAX_WORKERS,  # 並行確認数
+    AUTO_CHECK_STOP_POLL_SEC,  # 停止要求を確認する間隔
+)
 from core.recording import (
     OUTPUT_FORMAT_TS,
     OUTPUT_FORMAT_MP3,
@@ -20,12 +30,51 @@ from core.recording import (
 )  # 録画処理を読み込み
 from utils.streamlink_utils import (  # Streamlinkヘッダー調整
     apply_streamlink_options_for_url,  # URL別オプション調整
-    restore_streamlink_headers,  # ヘッダー復元
+    create_streamlink_session,  # タイムアウト設定済みセッション生成
+    restore_streamlink_headers,  # URL別ヘッダー復元
+    restore_streamlink_options,  # URL別オプション復元
     set_streamlink_headers_for_url,  # URL別ヘッダー設定
 )
-from utils.ytdlp_utils import fetch_stream_url_with_ytdlp, is_ytdlp_available  # yt-dlp補助
+from utils.ytdlp_utils import YTDLP_PROBE_TIMEOUT_SEC, fetch_stream_url_with_ytdlp, is_ytdlp_available  # yt-dlp補助
 from utils.settings_store import load_bool_setting, load_setting_value  # 設定入出力
 
+_LIVE_PROBE_CACHE: dict[str, float] = {}  # URL -> 配信中と確認した時刻 (監視周期をまたいで保持)
+_LIVE_PROBE_CACHE_LOCK = threading.Lock()  # 並行確認からの更新を排他
+_ACTIVE_PROBES: list[int] = [0]  # 実行中のURL確認数 (停止後に応答待ちで残った確認を含む)
+_ACTIVE_PROBES_CONDITION = threading.Condition()  # 実行中の確認数の更新と終了待ち
+_PROBE_EXECUTOR: list[ThreadPoolExecutor] = []  # URL確認用の常駐スレッド (監視周期をまたいで使い回す)
+_PROBE_EXECUTOR_LOCK = threading.Lock()  # 常駐スレッドの生成・終了を排他
+_PROBE_SESSIONS = threading.local()  # 確認用スレッドごとのStreamlinkセッション (スレッドと共に周期をまたいで残る)
+_YTDLP_FIRST_DOMAINS = frozenset({"whowatch.tv"})  # Streamlinkより先にyt-dlpで確認するドメイン
+_YTDLP_EMPTY_FALLBACK_DOMAINS = frozenset({"bigo.tv", "bigo.live", "whowatch.tv"})  # ストリームが空ならyt-dlpで再確認するドメイン
+
+def invalidate_live_probe_cache(url: str) -> None:  # URLの配信中の確認結果を破棄
+    # 録画の開始・終了で配信状態が変わりうるため、次の監視では改めて確認する
+    with _LIVE_PROBE_CACHE_LOCK:  # 確認結果を排他更新
+        _LIVE_PROBE_CACHE.pop(url, None)  # 確認結果を破棄
+
+def _probe_executor() -> ThreadPoolExecutor:  # URL確認用の常駐スレッドを取得
+    with _PROBE_EXECUTOR_LOCK:  # 生成を排他
+        if not _PROBE_EXECUTOR:  # 未生成の場合
+            _PROBE_EXECUTOR.append(ThreadPoolExecutor(max_workers=AUTO_CHECK_MAX_WORKERS, thread_name_prefix="auto-check"))  # 常駐スレッドを生成
+        return _PROBE_EXECUTOR[0]  # 常駐スレッドを返却
+
+def shutdown_auto_check_probes() -> None:  # アプリ終了時にURL確認用の常駐スレッドを止める
+    with _PROBE_EXECUTOR_LOCK:  # 終了を排他
+        if _PROBE_EXECUTOR:  # 生成済みの場合
+            _PROBE_EXECUTOR.pop().shutdown(wait=False, cancel_futures=True)  # 未着手を取り消し、通信中の確認は待たない
+
+def _url_host(url: str) -> str:  # URLのホスト名を取得
+    target = url if "://" in url else f"//{url}"  # スキーム無しの入力もホストとして解析
+    return urlsplit(target).hostname or ""  # 小文字化済みのホスト名を返却
+
+def _host_in_domains(host: str, domains: frozenset[str]) -> bool:  # ホストが対象ドメイン(サブドメイン含む)か判定
+    while host:  # 上位のドメインへ順にたどる
+        if host in domains:  # 対象ドメインに一致する場合
+            return True  # 対象
+        host = host.partition(".")[2]  # 先頭のラベルを外す
+    return False  # 対象外
+
 class RecorderWorker(QtCore.QObject):  # 録画ワーカー定義
     log_signal = QtCore.pyqtSignal(str)  # ログ通知シグナル
     conversion_started = QtCore.pyqtSignal(str)  # 変換開始通知シグナル
@@ -60,9 +109,8 @@ class RecorderWorker(QtCore.QObject):  # 録画ワーカー定義
         self.stream_timeout = stream_timeout  # ストリームタイムアウトを保存
         self.stop_event = stop_event  # 停止フラグを保存
     def run(self) -> None:  # 録画処理実行
-        session = Streamlink()  # Streamlinkセッション生成
-        session.set_option("http-timeout", self.http_timeout)  # HTTPタイムアウト設定
-        session.set_option("stream-timeout", self.stream_timeout)  # ストリームタイムアウト設定
+        # プラグインがヘッダーやCookieを書き換えるため、録画ごとに専用のセッションを使う
+        session = create_streamlink_session(self.http_timeout, self.stream_timeout)  # Streamlinkセッション生成
         apply_streamlink_options_for_url(session, self.url)  # URL別のStreamlinkオプションを反映
         set_streamlink_headers_for_url(session, self.url)  # URLに合わせてヘッダー調整
         def status_cb(message: str) -> None:  # 状態通知用コールバック
@@ -135,7 +183,7 @@ class RecorderWorker(QtCore.QObject):  # 録画ワーカー定義
         self.finished_signal.emit(exit_code)  # 終了シグナル送信
 
 class AutoCheckWorker(QtCore.QObject):  # 自動監視ワーカー定義
-    log_signal = QtCore.pyqtSignal(str)  # ログ通知シグナル
+    log_batch_signal = QtCore.pyqtSignal(list)  # ログ通知シグナル (複数行をまとめて送る)
     notify_signal = QtCore.pyqtSignal(str)  # 通知用シグナル
     finished_signal = QtCore.pyqtSignal(list, list)  # 完了通知シグナル
     def __init__(  # 初期化処理
@@ -151,8 +199,11 @@ class AutoCheckWorker(QtCore.QObject):  # 自動監視ワーカー定義
         fallback_notify_urls: list[str],  # 通知のみのURL監視一覧
         http_timeout: int,  # HTTPタイムアウト
         stream_timeout: int,  # ストリームタイムアウト
+        live_cache_ttl_sec: float = 0.0,  # 配信中の確認結果を使い回す秒数 (0で無効)
     ) -> None:  # 返り値なし
         super().__init__()  # 親クラス初期化
+        self.live_cache_ttl_sec = live_cache_ttl_sec  # 確認結果の有効期限を保存
+        self.ytdlp_available = False  # yt-dlpの利用可否 (run開始時に1回だけ確認)
         self.youtube_api_key = youtube_api_key  # YouTube APIキーを保存
         self.youtube_channels = youtube_channels  # YouTube配信者一覧を保存
         self.youtube_notify_channels = youtube_notify_channels  # YouTube通知のみ一覧を保存
@@ -165,137 +216,259 @@ class AutoCheckWorker(QtCore.QObject):  # 自動監視ワーカー定義
         self.http_timeout = http_timeout  # HTTPタイムアウトを保存
         self.stream_timeout = stream_timeout  # ストリームタイムアウトを保存
         self.stop_event = threading.Event()  # 停止フラグを生成
+        self._log_buffer: list[str] = []  # 未送信のログ
+        self._log_timer: threading.Timer | None = None  # 溜めたログを一定時間後に送るタイマー
+        self._log_lock = threading.Lock()  # 並行確認からの追記を排他
     def stop(self) -> None:  # 停止処理
         self.stop_event.set()  # 停止フラグを設定
+        with _LIVE_PROBE_CACHE_LOCK:  # 確認結果を排他更新
+            _LIVE_PROBE_CACHE.clear()  # 再開時は改めて確認する
+    def _log(self, message: str) -> None:  # ログを溜めて一定量・一定時間ごとに送る
+        # 1行ごとにシグナルを送るとメインスレッドへのイベントが行数分積まれるため、まとめて1回で送る
+        if self.stop_event.is_set():  # 停止後に残った確認からのログの場合 (画面との接続は解除済みで、ワーカーは破棄されうる)
+            return  # 溜めない
+        with self._log_lock:  # 追記を排他
+            self._log_buffer.append(message)  # ログを溜める
+            if len(self._log_buffer) >= AUTO_CHECK_LOG_BATCH_LINES:  # 行数が上限に達した場合
+                self._flush_log_locked()  # まとめて送信
+            elif self._log_timer is None:  # 送信予定が無い場合
+                # 次のログを待たずに送るため、溜め始めた時点から一定時間後の送信を予約する
+                self._log_timer = threading.Timer(AUTO_CHECK_LOG_BATCH_SEC, self._flush_log)  # 送信タイマー
+                self._log_timer.daemon = True  # 終了時に待たない
+                self._log_timer.start()  # 送信を予約
+    def _flush_log(self) -> None:  # 溜めたログを全て送る
+        with self._log_lock:  # 送信を排他
+            self._flush_log_locked()  # まとめて送信
+    def _flush_log_locked(self) -> None:  # 溜めたログを送る (ロック取得済みで呼ぶ)
+        if self._log_timer is not None:  # 送信予定がある場合
+            self._log_timer.cancel()  # 予約を取り消し (タイマーから呼ばれた場合は何もしない)
+            self._log_timer = None  # 予約を破棄
+        if self._log_buffer:  # 未送信がある場合
+            self.log_batch_signal.emit(self._log_buffer)  # まとめて送信
+            self._log_buffer = []  # 送信済みの一覧は受信側に渡すため作り直す
+    def _probe_session(self) -> Streamlink:  # 確認用スレッドごとのStreamlinkセッション
+        # プラグインがヘッダーやCookieを書き換えるため、セッションはスレッド間で共有しない
+        key = (int(self.http_timeout), int(self.stream_timeout))  # タイムアウト設定
+        entry = getattr(_PROBE_SESSIONS, "entry", None)  # このスレッドの(設定, セッション)
+        if entry is None or entry[0] != key:  # 未生成または設定が変わった場合
+            entry = (key, create_streamlink_session(self.http_timeout, self.stream_timeout))  # Streamlinkセッション生成
+            _PROBE_SESSIONS.entry = entry  # スレッドに保持 (次の周期もこのスレッドの接続を使い回す)
+        return entry[1]  # セッションを返却
+    def _is_recently_live(self, url: str) -> bool:  # 直前の周期で配信中と確認済みか
+        with _LIVE_PROBE_CACHE_LOCK:  # 確認結果を排他参照
+            checked_at = _LIVE_PROBE_CACHE.get(url)  # 配信中と確認した時刻
+        return checked_at is not None and time.monotonic() - checked_at < self.live_cache_ttl_sec  # 有効期限内か
+    def _probe_fallback_url(self, url: str, log_prefix: str) -> bool:  # 1件のURLの配信有無を確認
+        # 配信中の結果だけを短時間使い回す (配信なしは使い回さず、配信開始の検知を遅らせない)
+        if self._is_recently_live(url):  # 有効期限内に配信中と確認済みの場合
+            self._log(f"{log_prefix}: 配信検知 {url}")  # 配信検知ログ
+            return True  # 配信中
+        with _ACTIVE_PROBES_CONDITION:  # 実行中の確認数を排他更新
+            _ACTIVE_PROBES[0] += 1  # 確認開始を記録
+        try:  # 確認処理
+            live = self._probe_fallback_url_uncached(url, log_prefix)  # 実際に確認
+        finally:  # 後始末
+            with _ACTIVE_PROBES_CONDITION:  # 実行中の確認数を排他更新
+                _ACTIVE_PROBES[0] -= 1  # 確認終了を記録
+                _ACTIVE_PROBES_CONDITION.notify_all()  # 終了待ちの監視へ通知
+        with _LIVE_PROBE_CACHE_LOCK:  # 確認結果を排他更新
+            if self.stop_event.is_set():  # 停止後に応答した場合 (stopで破棄した結果を書き戻さない)
+                return live  # 記録しない
+            if live:  # 配信中の場合
+                _LIVE_PROBE_CACHE[url] = time.monotonic()  # 確認時刻を記録
+            else:  # 配信なしの場合
+                _LIVE_PROBE_CACHE.pop(url, None)  # 古い結果を破棄
+        return live  # 確認結果を返却
+    def _check_fallback_urls(self, urls: list[str], log_prefix: str) -> list[str]:  # URL監視の一括確認
+        if not urls:  # 対象が無い場合
+            return []  # 何もしない
+        # 1件ずつの通信待ちが積み上がらないよう並行して確認し、結果は入力順に反映する
+        # 確認用スレッドは常駐させ、スレッドごとのセッションが張った接続を次の確認・次の周期へ引き継ぐ
+        executor = _probe_executor()  # 常駐の確認用スレッド
+        futures = {url: executor.submit(self._probe_fallback_url, url, log_prefix) for url in dict.fromkeys(urls)}  # URLごとに投入
+        if not self._wait_unless_stopped(futures.values()):  # 停止された場合
+            for future in futures.values():  # 未着手の確認を取り消し (通信中の確認は待たない)
+                future.cancel()  # 取り消し
+            return []  # 結果は使わない
+        return [url for url, future in futures.items() if future.result()]  # 配信中のURLを入力順に返却
+    def _wait_for_abandoned_probes(self) -> bool:  # 前回までの残った確認が上限未満になるまで待つ
+        # 停止と再開を繰り返しても、応答待ちのまま残ったスレッドが積み上がらないようにする
+        with _ACTIVE_PROBES_CONDITION:  # 実行中の確認数を排他参照
+            while _ACTIVE_PROBES[0] >= AUTO_CHECK_MAX_ABANDONED_PROBES:  # 上限に達している場合
+                if self.stop_event.is_set():  # 停止要求の確認
+                    return False  # 待機を打ち切る
+                _ACTIVE_PROBES_CONDITION.wait(AUTO_CHECK_STOP_POLL_SEC)  # 一定間隔で停止要求を確認
+        return True  # 監視を開始できる
+    def _wait_unless_stopped(self, futures) -> bool:  # 全件の完了を待つ (停止要求があれば待たずに戻る)
+        pending = {future for future in futures if future is not None}  # 未完了の処理
+        while pending:  # 未完了がある間
+            if self.stop_event.is_set():  # 停止要求の確認
+                return False  # 待機を打ち切る
+            pending = wait(pending, timeout=AUTO_CHECK_STOP_POLL_SEC).not_done  # 一定間隔で停止要求を確認
+        return True  # 全件完了
+    def _check_all_fallback_urls(self) -> tuple[list[str], list[str]]:  # 録画対象と通知のみのURL監視
+        live = self._check_fallback_urls(self.fallback_urls, "自動監視")  # 録画対象を確認
+        live_set = set(live)  # 録画対象で検知したURL
+        notify_candidates = [url for url in self.fallback_notify_urls if url not in live_set]  # 録画対象が優先
+        return live, self._check_fallback_urls(notify_candidates, "自動監視(通知のみ)")  # 通知のみを確認
+    def _fetch_twitch_live(self, entries: list[str]) -> list[str]:  # Twitch APIでライブURLを取得
+        return fetch_twitch_live_urls(  # Twitchライブ取得
+            client_id=self.twitch_client_id,  # Client ID指定
+            client_secret=self.twitch_client_secret,  # Client Secret指定
+            entries=entries,  # 配信者一覧指定
+            log_cb=self._log,  # ログ出力
+        )  # 取得終了
+    def _notify_youtube_multi(self, entry: str, live_ids: list[str]) -> None:  # 複数配信通知
+        if self.stop_event.is_set():  # 停止後に残った取得からの通知の場合
+            return  # 通知しない
+        message = (  # 通知メッセージを組み立て
+            "YouTubeで複数の配信枠を検知しましたが、"  # 先頭文
+            "APIキーが未設定のため録画を開始しません。 "  # 条件説明
+            f"対象: {entry}"  # 対象情報
+        )  # メッセージ生成の終了
+        self.notify_signal.emit(message)  # ポップアップ通知
+        self._log(f"自動監視: {message}")  # ログにも記録
+    def _phase_result(self, future, default):  # 並行取得の結果を受け取る
+        if future is None:  # 取得しなかった場合
+            return default  # 空の結果を返却
+        try:  # 例外処理開始
+            return future.result()  # 取得結果を返却
+        except Exception as exc:  # 予期しない例外の捕捉 (他の取得結果は生かす)
+            self._log(f"自動監視: 予期しないエラー {exc}")  # 失敗ログ通知
+            return default  # 空の結果を返却
+    def _probe_fallback_url_uncached(self, url: str, log_prefix: str) -> bool:  # 1件のURLを実際に確認
+        if self.stop_event.is_set():  # 停止要求の確認
+            return False  # 確認しない
+        host = _url_host(url)  # ホスト名を1回だけ解析
+        if self.ytdlp_available and _host_in_domains(host, _YTDLP_FIRST_DOMAINS):  # ふわっちはyt-dlp優先
+            stream_url = fetch_stream_url_with_ytdlp(url, self._log, timeout=YTDLP_PROBE_TIMEOUT_SEC)  # yt-dlpで確認
+            if stream_url:  # URLが取れる場合
+                self._log(f"{log_prefix}: yt-dlpで配信検知 {url}")  # 検知ログ
+                return True  # 配信中
+            self._log(f"{log_prefix}: yt-dlpで配信なし {url}")  # 配信なしログ
+            return False  # Streamlinkには回さない
+        self._log(f"{log_prefix}: チェック開始 {url}")  # 監視開始ログ
+        session = self._probe_session()  # このスレッドのセッション (同じスレッドの確認間で接続を使い回す)
+        original_options = apply_streamlink_options_for_url(session, url)  # URL別のStreamlinkオプションを反映 (書き換えたキーのみ記録)
+        original_headers = set_streamlink_headers_for_url(session, url)  # ヘッダー調整 (書き換えたキーのみ記録)
+        try:  # 例外処理開始
+            streams = session.streams(url)  # ストリーム一覧を取得
+        except StreamlinkError as exc:  # Streamlink例外の捕捉
+            self._log(f"{log_prefix}: 取得失敗 {url} - {exc}")  # 失敗ログ通知
+            if self.ytdlp_available:  # yt-dlpが使える場合
+                stream_url = fetch_stream_url_with_ytdlp(url, self._log, timeout=YTDLP_PROBE_TIMEOUT_SEC)  # yt-dlpで確認
+                if stream_url:  # URLが取れる場合
+                    self._log(f"{log_prefix}: yt-dlpで配信検知 {url}")  # 検知ログ
+                    return True  # 配信中
+            return False  # 次のURLへ
+        finally:  # 後始末
+            restore_streamlink_headers(session, original_headers)  # ヘッダーを復元 (Connectionなど他のキーは触らない)
+            restore_streamlink_options(session, original_options)  # Twitch向けオプションを後続のURLへ持ち越さない
+        if streams:  # ストリームが取得できた場合
+            self._log(f"{log_prefix}: 配信検知 {url}")  # 配信検知ログ
+            return True  # 配信中
+        if self.ytdlp_available and _host_in_domains(host, _YTDLP_EMPTY_FALLBACK_DOMAINS):  # yt-dlp優先対象
+            stream_url = fetch_stream_url_with_ytdlp(url, self._log, timeout=YTDLP_PROBE_TIMEOUT_SEC)  # yt-dlpで確認
+            if stream_url:  # URLが取れる場合
+                self._log(f"{log_prefix}: yt-dlpで配信検知 {url}")  # 検知ログ
+                return True  # 配信中
+        self._log(f"{log_prefix}: 配信なし {url}")  # 配信なしログ
+        return False  # 配信なし
+    def _new_twitch_fallback_urls(  # URL監視へ追加するTwitch URLを生成
+        self,
+        entries: list[str],  # Twitch配信者一覧
+        existing_urls: list[str],  # 登録済みURL一覧
+        login_cache: dict[str, str],  # 正規化結果の控え
+    ) -> list[str]:  # 未登録のURL一覧
+        existing = set(existing_urls)  # 登録済みURLの重複確認用
+        new_urls: list[str] = []  # 追加するURL一覧
+        for entry in entries:  # 入力ごとに処理
+            login = login_cache.get(entry)  # 正規化済みの結果を参照
+            if login is None:  # 未正規化の場合
+                login = login_cache[entry] = normalize_twitch_login(entry)  # ログイン名を正規化して控える
+            if not login:  # ログイン名が空の場合
+                continue  # 次の入力へ
+            url = f"https://www.twitch.tv/{login}"  # Twitch URLを生成
+            if url not in existing:  # 重複確認
+                existing.add(url)  # 登録済みとして記録
+                new_urls.append(url)  # 追加対象へ
+        return new_urls  # 追加するURLを返却
     def run(self) -> None:  # 監視処理実行
         live_urls: list[str] = []  # ライブURL一覧
         notify_urls: list[str] = []  # 通知のみURL一覧
+        live_seen: set[str] = set()  # ライブURLの重複確認用
+        notify_seen: set[str] = set()  # 通知のみURLの重複確認用
+        self.ytdlp_available = is_ytdlp_available()  # 各URLの確認で使い回す
+        twitch_logins: dict[str, str] = {}  # 入力 -> 正規化済みログイン名 (録画対象と通知のみで共用)
         try:  # 例外処理開始
-            if self.youtube_channels:  # YouTube配信者がある場合
-                def _notify_youtube_multi(entry: str, live_ids: list[str]) -> None:  # 複数配信通知
-                    message = (  # 通知メッセージを組み立て
-                        "YouTubeで複数の配信枠を検知しましたが、"  # 先頭文
-                        "APIキーが未設定のため録画を開始しません。 "  # 条件説明
-                        f"対象: {entry}"  # 対象情報
-                    )  # メッセージ生成の終了
-                    self.notify_signal.emit(message)  # ポップアップ通知
-                    self.log_signal.emit(f"自動監視: {message}")  # ログにも記録
-                youtube_live = fetch_youtube_live_urls_with_fallback(  # YouTubeライブ取得
-                    api_key=self.youtube_api_key,  # APIキー指定
-                    entries=self.youtube_channels,  # 配信者一覧指定
-                    log_cb=self.log_signal.emit,  # ログ出力
-                    multi_detect_cb=_notify_youtube_multi,  # 複数配信検知通知
-                )  # 取得終了
-                for live_url in youtube_live:  # ライブURLごとに処理
-                    if live_url not in live_urls:  # 重複確認
+            if not self._wait_for_abandoned_probes():  # 停止後に残った確認が多いまま停止された場合
+                return  # 監視しない
+            twitch_api = bool(self.twitch_client_id and self.twitch_client_secret)  # Twitch APIキーがあるか
+            if not twitch_api:  # APIキーが不足の場合はURL監視へ回す
+                if self.twitch_channels:  # Twitch配信者がある場合
+                    self._log("自動監視: Twitch APIキー未設定のためURL監視に切り替えます。")  # 監視方法ログ
+                    self.fallback_urls.extend(  # フォールバックへまとめて追加
+                        self._new_twitch_fallback_urls(self.twitch_channels, self.fallback_urls, twitch_logins)  # 未登録のURLのみ
+                    )  # 追加終了
+                if self.twitch_notify_channels:  # Twitch通知のみ一覧がある場合
+                    self.fallback_notify_urls.extend(  # 通知のみへまとめて追加
+                        self._new_twitch_fallback_urls(self.twitch_notify_channels, self.fallback_notify_urls, twitch_logins)  # 未登録のURLのみ
+                    )  # 追加終了
+            # YouTube・Twitchの取得とURL監視は互いに独立した通信待ちのため並行して行い、結果は従来の順に反映する
+            executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="auto-check-phase")  # 取得の種類ごとのスレッド
+            try:  # 取得処理
+                youtube_live = (  # YouTubeライブ取得
+                    executor.submit(
+                        fetch_youtube_live_urls_with_fallback,
+                        api_key=self.youtube_api_key,  # APIキー指定
+                        entries=self.youtube_channels,  # 配信者一覧指定
+                        log_cb=self._log,  # ログ出力
+                        multi_detect_cb=self._notify_youtube_multi,  # 複数配信検知通知
+                    )
+                    if self.youtube_channels else None
+                )
+                youtube_notify = (  # YouTube通知のみ取得
+                    executor.submit(
+                        fetch_youtube_live_urls_with_fallback,
+                        api_key=self.youtube_api_key,  # APIキー指定
+                        entries=self.youtube_notify_channels,  # 配信者一覧指定
+                        log_cb=self._log,  # ログ出力
+                        multi_detect_cb=None,  # 通知のみは追加通知を行わない
+                    )
+                    if self.youtube_notify_channels else None
+                )
+                twitch_live = (  # Twitchライブ取得
+                    executor.submit(self._fetch_twitch_live, self.twitch_channels)
+                    if twitch_api and self.twitch_channels else None
+                )
+                twitch_notify = (  # Twitch通知のみ取得
+                    executor.submit(self._fetch_twitch_live, self.twitch_notify_channels)
+                    if twitch_api and self.twitch_notify_channels else None
+                )
+                fallback = (  # URL監視
+                    executor.submit(self._check_all_fallback_urls)
+                    if self.fallback_urls or self.fallback_notify_urls else None
+                )
+                finished = self._wait_unless_stopped((youtube_live, youtube_notify, twitch_live, twitch_notify, fallback))  # 全取得を待つ
+            finally:  # 後始末
+                executor.shutdown(wait=False, cancel_futures=True)  # 停止時は通信中の取得を待たない
+            if not finished:  # 停止された場合
+                return  # 途中までの結果は使わない (finallyで完了通知)
+            fallback_live, fallback_notify = self._phase_result(fallback, ([], []))  # URL監視の結果
+            for results in (self._phase_result(youtube_live, []), self._phase_result(twitch_live, []), fallback_live):  # 録画対象を順に反映
+                for live_url in results:  # ライブURLごとに処理
+                    if live_url not in live_seen:  # 重複確認
+                        live_seen.add(live_url)  # 登録済みとして記録
                         live_urls.append(live_url)  # ライブURLを追加
-            if self.youtube_notify_channels:  # YouTube通知のみ一覧がある場合
-                youtube_notify = fetch_youtube_live_urls_with_fallback(  # YouTubeライブ取得
-                    api_key=self.youtube_api_key,  # APIキー指定
-                    entries=self.youtube_notify_channels,  # 配信者一覧指定
-                    log_cb=self.log_signal.emit,  # ログ出力
-                    multi_detect_cb=None,  # 通知のみは追加通知を行わない
-                )  # 取得終了
-                for live_url in youtube_notify:  # ライブURLごとに処理
-                    if live_url in live_urls:  # 録画対象が優先
+            for results in (self._phase_result(youtube_notify, []), self._phase_result(twitch_notify, []), fallback_notify):  # 通知のみを順に反映
+                for live_url in results:  # ライブURLごとに処理
+                    if live_url in live_seen:  # 録画対象が優先
                         continue
-                    if live_url not in notify_urls:  # 重複確認
+                    if live_url not in notify_seen:  # 重複確認
+                        notify_seen.add(live_url)  # 登録済みとして記録
                         notify_urls.append(live_url)  # 通知URLを追加
-            if self.twitch_channels:  # Twitch配信者がある場合
-                if not self.twitch_client_id or not self.twitch_client_secret:  # APIキーが不足の場合
-                    self.log_signal.emit("自動監視: Twitch APIキー未設定のためURL監視に切り替えます。")  # 監視方法ログ
-                    for entry in self.twitch_channels:  # 入力ごとに処理
-                        login = normalize_twitch_login(entry)  # ログイン名を正規化
-                        if not login:  # ログイン名が空の場合
-                            continue  # 次の入力へ
-                        url = f"https://www.twitch.tv/{login}"  # Twitch URLを生成
-                        if url not in self.fallback_urls:  # 重複確認
-                            self.fallback_urls.append(url)  # フォールバックへ追加
-                else:  # APIキーがある場合
-                    twitch_live = fetch_twitch_live_urls(  # Twitchライブ取得
-                        client_id=self.twitch_client_id,  # Client ID指定
-                        client_secret=self.twitch_client_secret,  # Client Secret指定
-                        entries=self.twitch_channels,  # 配信者一覧指定
-                        log_cb=self.log_signal.emit,  # ログ出力
-                    )  # 取得終了
-                    for live_url in twitch_live:  # ライブURLごとに処理
-                        if live_url not in live_urls:  # 重複確認
-                            live_urls.append(live_url)  # ライブURLを追加
-            if self.twitch_notify_channels:  # Twitch通知のみ一覧がある場合
-                if not self.twitch_client_id or not self.twitch_client_secret:  # APIキーが不足の場合
-                    for entry in self.twitch_notify_channels:  # 入力ごとに処理
-                        login = normalize_twitch_login(entry)  # ログイン名を正規化
-                        if not login:  # ログイン名が空の場合
-                            continue  # 次の入力へ
-                        url = f"https://www.twitch.tv/{login}"  # Twitch URLを生成
-                        if url not in self.fallback_notify_urls:  # 重複確認
-                            self.fallback_notify_urls.append(url)  # 通知のみへ追加
-                else:  # APIキーがある場合
-                    twitch_notify = fetch_twitch_live_urls(  # Twitchライブ取得
-                        client_id=self.twitch_client_id,  # Client ID指定
-                        client_secret=self.twitch_client_secret,  # Client Secret指定
-                        entries=self.twitch_notify_channels,  # 配信者一覧指定
-                        log_cb=self.log_signal.emit,  # ログ出力
-                    )  # 取得終了
-                    for live_url in twitch_notify:  # ライブURLごとに処理
-                        if live_url in live_urls:  # 録画対象が優先
-                            continue
-                        if live_url not in notify_urls:  # 重複確認
-                            notify_urls.append(live_url)  # 通知URLを追加
-            if self.fallback_urls or self.fallback_notify_urls:  # フォールバックURLがある場合
-                session = Streamlink()  # Streamlinkセッション生成
-                session.set_option("http-timeout", self.http_timeout)  # HTTPタイムアウト設定
-                session.set_option("stream-timeout", self.stream_timeout)  # ストリームタイムアウト設定
-                def _check_fallback_urls(urls: list[str], target_list: list[str], log_prefix: str) -> None:
-                    for url in urls:  # URLごとにチェック
-                        if self.stop_event.is_set():  # 停止要求の確認
-                            break  # ループを中断
-                        if "whowatch.tv" in url and is_ytdlp_available():  # ふわっちはyt-dlp優先
-                            stream_url = fetch_stream_url_with_ytdlp(url, self.log_signal.emit)  # yt-dlpで確認
-                            if stream_url:  # URLが取れる場合
-                                if url not in target_list:  # 重複確認
-                                    target_list.append(url)  # ライブURLとして追加
-                                self.log_signal.emit(f"{log_prefix}: yt-dlpで配信検知 {url}")  # 検知ログ
-                            else:
-                                self.log_signal.emit(f"{log_prefix}: yt-dlpで配信なし {url}")  # 配信なしログ
-                            continue  # Streamlinkには回さない
-                        self.log_signal.emit(f"{log_prefix}: チェック開始 {url}")  # 監視開始ログ
-                        apply_streamlink_options_for_url(session, url)  # URL別のStreamlinkオプションを反映
-                        original_headers = set_streamlink_headers_for_url(session, url)  # ヘッダー調整
-                        try:  # 例外処理開始
-                            streams = session.streams(url)  # ストリーム一覧を取得
-                        except StreamlinkError as exc:  # Streamlink例外の捕捉
-                            self.log_signal.emit(f"{log_prefix}: 取得失敗 {url} - {exc}")  # 失敗ログ通知
-                            if is_ytdlp_available():  # yt-dlpが使える場合
-                                stream_url = fetch_stream_url_with_ytdlp(url, self.log_signal.emit)  # yt-dlpで確認
-                                if stream_url:  # URLが取れる場合
-                                    if url not in target_list:  # 重複確認
-                                        target_list.append(url)  # ライブURLとして追加
-                                    self.log_signal.emit(f"{log_prefix}: yt-dlpで配信検知 {url}")  # 検知ログ
-                            continue  # 次のURLへ
-                        finally:  # 後始末
-                            restore_streamlink_headers(session, original_headers)  # ヘッダーを復元
-                        if streams:  # ストリームが取得できた場合
-                            if url not in target_list:  # 重複確認
-                                target_list.append(url)  # ライブURLとして追加
-                            self.log_signal.emit(f"{log_prefix}: 配信検知 {url}")  # 配信検知ログ
-                        else:  # ストリームが無い場合
-                            if (
-                                ("bigo.tv" in url or "bigo.live" in url or "whowatch.tv" in url)
-                                and is_ytdlp_available()
-                            ):  # yt-dlp優先対象
-                                stream_url = fetch_stream_url_with_ytdlp(url, self.log_signal.emit)  # yt-dlpで確認
-                                if stream_url:  # URLが取れる場合
-                                    if url not in target_list:  # 重複確認
-                                        target_list.append(url)  # ライブURLとして追加
-                                    self.log_signal.emit(f"{log_prefix}: yt-dlpで配信検知 {url}")  # 検知ログ
-                                    continue  # 次のURLへ
-                            self.log_signal.emit(f"{log_prefix}: 配信なし {url}")  # 配信なしログ
-                if self.fallback_urls:
-                    _check_fallback_urls(self.fallback_urls, live_urls, "自動監視")
-                if self.fallback_notify_urls:
-                    notify_candidates = [url for url in self.fallback_notify_urls if url not in live_urls]
-                    _check_fallback_urls(notify_candidates, notify_urls, "自動監視(通知のみ)")
         except Exception as exc:  # 予期しない例外の捕捉
-            self.log_signal.emit(f"自動監視: 予期しないエラー {exc}")  # 失敗ログ通知
-        self.finished_signal.emit(live_urls, notify_urls)  # 完了通知
+            self._log(f"自動監視: 予期しないエラー {exc}")  # 失敗ログ通知
+        finally:  # 停止時も含めて必ず完了を通知
+            self._flush_log()  # 完了通知より先に残りのログを送る
+            self.finished_signal.emit(live_urls, notify_urls)  # 完了通知
@@ -44,7 +44,6 @@ class MainWindow(  # メインウィンドウ定義
         self.auto_timer = QtCore.QTimer(self)  # 自動監視タイマー
         self.auto_timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)  # タイマー種別設定
         self.auto_timer.timeout.connect(self._on_auto_timer)  # タイマーイベント接続
-        self.auto_check_thread: QtCore.QThread | None = None  # 自動監視スレッド参照
         self.auto_check_worker: AutoCheckWorker | None = None  # 自動監視ワーカー参照
         self.auto_check_in_progress = False  # 自動監視中フラグ
         self.auto_paused_by_user = False  # 自動録画の手動停止フラグ
@@ -71,6 +71,15 @@ class MainWindowLoggingMixin:  # MainWindowLoggingMixin定義
         if not category or not body:  # 空のログの場合
             return  # 追記しない
         self.log_output.append(f"{timestamp} | {category} | {body}")  # ログを追記
+    def _append_logs(self, messages: list[str]) -> None:  # 複数ログの一括追加処理
+        timestamp = QtCore.QDateTime.currentDateTime().toString("HH:mm:ss")  # 時刻のみのタイムスタンプ生成
+        lines = []  # 追記する行一覧
+        for message in messages:  # ログごとに整形
+            category, body = self._format_log_message(message)  # ログを整形
+            if category and body:  # 空のログでない場合
+                lines.append(f"{timestamp} | {category} | {body}")  # 追記対象へ
+        if lines:  # 追記する行がある場合
+            self.log_output.append("\n".join(lines))  # 1回の追記でまとめて反映
     def _show_tray_notification(self, title: str, message: str) -> None:  # タスクトレイ通知を表示
         if not QtWidgets.QSystemTrayIcon.isSystemTrayAvailable():  # トレイ非対応の場合
             self._append_log(message)  # ログへ出力
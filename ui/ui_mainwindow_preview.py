@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 from PyQt6 import QtCore, QtGui, QtMultimedia, QtMultimediaWidgets, QtWidgets
-from streamlink import Streamlink
 from streamlink.exceptions import StreamlinkError
 from apis.api_fuwatch import fetch_fuwatch_display_name_by_scraping
 from apis.api_niconico import fetch_niconico_display_name_by_scraping
@@ -41,12 +40,12 @@ from core.recording import find_ffmpeg_path, resolve_output_path, select_stream
 from utils.settings_store import load_setting_value
 from utils.streamlink_utils import (
     apply_streamlink_options_for_url,
-    restore_streamlink_headers,
+    create_streamlink_session,
     set_streamlink_headers_for_url,
 )
 from utils.ytdlp_utils import fetch_stream_url_with_ytdlp, is_ytdlp_available
 from utils.url_utils import derive_channel_label, safe_filename_component
-from ui.ui_preview import PreviewPipeProxy, StreamlinkPreviewWorker, TimeShiftWindow
+from ui.ui_preview import PreviewPipeProxy, StreamlinkPreviewWorker, TimeShiftWindow, get_preview_reader_pool
 
 
 class MainWindowPreviewMixin:
@@ -65,19 +64,14 @@ class MainWindowPreviewMixin:
         quality = DEFAULT_QUALITY
         http_timeout = load_setting_value("http_timeout", 20, int)
         stream_timeout = load_setting_value("stream_timeout", 60, int)
-        session = Streamlink()
-        session.set_option("http-timeout", int(http_timeout))
-        session.set_option("stream-timeout", int(stream_timeout))
-        apply_streamlink_options_for_url(session, url)
-        original_headers = dict(session.http.headers)
         try:
-            original_headers = set_streamlink_headers_for_url(session, url)
+            session = create_streamlink_session(http_timeout, stream_timeout)
+            apply_streamlink_options_for_url(session, url)
+            set_streamlink_headers_for_url(session, url)
             streams = session.streams(url)
         except StreamlinkError as exc:
             self._append_log(f"プレビュー用ストリーム取得に失敗しました: {exc}")
             return None
-        finally:
-            restore_streamlink_headers(session, original_headers)
         if not streams:
             self._append_log("プレビュー用ストリームが見つかりませんでした。")
             return None
@@ -410,11 +404,6 @@ class MainWindowPreviewMixin:
             stop_event = session.get("pipe_stop_event")
             if isinstance(stop_event, threading.Event):
                 stop_event.set()
-            pipe_thread = session.get("pipe_thread")
-            if isinstance(pipe_thread, QtCore.QThread):
-                pipe_thread.quit()
-                pipe_thread.wait(2000)
-                pipe_thread.deleteLater()
             pipe_proxy = session.get("pipe_proxy")
             if isinstance(pipe_proxy, PreviewPipeProxy):
                 pipe_proxy.close()
@@ -426,7 +415,6 @@ class MainWindowPreviewMixin:
             
             session["process"] = None
             session["pipe_stop_event"] = None
-            session["pipe_thread"] = None
             session["pipe_worker"] = None
             session["pipe_proxy"] = None
             session["preview_url"] = None
@@ -468,7 +456,6 @@ class MainWindowPreviewMixin:
             "tab_index": tab_index,
             "process": None,
             "pipe_stop_event": None,
-            "pipe_thread": None,
             "pipe_worker": None,
             "pipe_proxy": None,
             "preview_url": None,
@@ -515,7 +502,6 @@ class MainWindowPreviewMixin:
         use_ytdlp_preview = False
         process: QtCore.QProcess | None = None
         pipe_stop_event: threading.Event | None = None
-        pipe_thread: QtCore.QThread | None = None
         pipe_worker: StreamlinkPreviewWorker | None = None
         pipe_proxy: PreviewPipeProxy | None = None
         stream_url = None
@@ -554,18 +540,15 @@ class MainWindowPreviewMixin:
             if process is None:
                 return
             pipe_stop_event = threading.Event()
-            pipe_thread = QtCore.QThread()
             pipe_worker = StreamlinkPreviewWorker(url, pipe_stop_event)
-            pipe_worker.moveToThread(pipe_thread)
             pipe_proxy = PreviewPipeProxy(process)
-            pipe_worker.data_signal.connect(pipe_proxy.write_data)
+            pipe_proxy.set_source_ring(pipe_worker.ring)
+            pipe_worker.data_ready.connect(pipe_proxy.drain_ring)
             pipe_worker.log_signal.connect(self._append_log)
             pipe_worker.finished_signal.connect(pipe_proxy.close)
-            pipe_worker.finished_signal.connect(pipe_thread.quit)
+            # 停止時にここで破棄するとプールで実行中のrunから触れてしまうため、run終了の通知を待って破棄する
             pipe_worker.finished_signal.connect(pipe_worker.deleteLater)
-            pipe_thread.finished.connect(pipe_thread.deleteLater)
-            pipe_thread.started.connect(pipe_worker.run)
-            pipe_thread.start()
+            get_preview_reader_pool().start(pipe_worker.run)
         else:
             if stream_url is None:
                 stream_url = self._resolve_stream_url(url)
@@ -600,11 +583,6 @@ class MainWindowPreviewMixin:
             old_stop_event = session.get("pipe_stop_event")
             if isinstance(old_stop_event, threading.Event):
                 old_stop_event.set()
-            old_thread = session.get("pipe_thread")
-            if isinstance(old_thread, QtCore.QThread):
-                old_thread.quit()
-                old_thread.wait(2000)
-                old_thread.deleteLater()
             old_proxy = session.get("pipe_proxy")
             if isinstance(old_proxy, PreviewPipeProxy):
                 old_proxy.close()
@@ -614,7 +592,6 @@ class MainWindowPreviewMixin:
                 self._start_player_with_source(player, preview_url, start_delay_ms)
                 session["process"] = process
                 session["pipe_stop_event"] = pipe_stop_event
-                session["pipe_thread"] = pipe_thread
                 session["pipe_worker"] = pipe_worker
                 session["pipe_proxy"] = pipe_proxy
                 session["preview_url"] = preview_url
@@ -626,7 +603,6 @@ class MainWindowPreviewMixin:
                 player.setSource(QtCore.QUrl(stream_url))
                 session["process"] = None
                 session["pipe_stop_event"] = None
-                session["pipe_thread"] = None
                 session["pipe_worker"] = None
                 session["pipe_proxy"] = None
                 session["preview_url"] = None
@@ -670,7 +646,6 @@ class MainWindowPreviewMixin:
             "tab_index": tab_index,
             "process": process,
             "pipe_stop_event": pipe_stop_event,
-            "pipe_thread": pipe_thread,
             "pipe_worker": pipe_worker,
             "pipe_proxy": pipe_proxy,
             "preview_url": preview_url,
@@ -747,7 +722,6 @@ class MainWindowPreviewMixin:
             "tab_index": tab_index,
             "process": None,
             "pipe_stop_event": None,
-            "pipe_thread": None,
             "pipe_worker": None,
             "pipe_proxy": None,
             "preview_url": None,
@@ -809,11 +783,6 @@ class MainWindowPreviewMixin:
         stop_event = session.get("pipe_stop_event")
         if isinstance(stop_event, threading.Event):
             stop_event.set()
-        pipe_thread = session.get("pipe_thread")
-        if isinstance(pipe_thread, QtCore.QThread):
-            pipe_thread.quit()
-            pipe_thread.wait(2000)
-            pipe_thread.deleteLater()
         pipe_proxy = session.get("pipe_proxy")
         if isinstance(pipe_proxy, PreviewPipeProxy):
             pipe_proxy.close()
@@ -6,6 +6,7 @@ from pathlib import Path  # パス操作
 from urllib.parse import urlparse  # URL解析
 from PyQt6 import QtCore, QtGui, QtMultimedia, QtMultimediaWidgets, QtWidgets  # PyQt6の主要モジュール
 from core.config import (  # 定数群
+    AUTO_CHECK_LIVE_CACHE_INTERVALS,  # 配信中の確認結果を使い回す期間
     DEFAULT_AUTO_CHECK_INTERVAL_SEC,  # 自動監視間隔
     DEFAULT_AUTO_ENABLED,  # 自動録画の既定
     DEFAULT_ABEMA_ENTRIES,  # AbemaTV既定
@@ -45,7 +46,12 @@ from utils.platform_utils import (  # 配信サービスURL処理
 from core.recording import resolve_output_path, select_stream  # 録画系ユーティリティ
 from utils.settings_store import load_bool_setting, load_setting_value  # 設定入出力
 from utils.url_utils import derive_channel_label, merge_unique_urls, parse_auto_url_list  # URL関連ユーティリティ
-from core.workers import AutoCheckWorker, RecorderWorker  # ワーカー処理
+from core.workers import (  # ワーカー処理
+    AutoCheckWorker,  # 自動監視ワーカー
+    RecorderWorker,  # 録画ワーカー
+    invalidate_live_probe_cache,  # 配信中の確認結果の破棄
+    shutdown_auto_check_probes,  # URL確認用スレッドの終了
+)
 from utils.streamlink_utils import (  # Streamlinkヘッダー調整
     apply_streamlink_options_for_url,  # URL別オプション調整
     restore_streamlink_headers,  # ヘッダー復元
@@ -750,7 +756,7 @@ class MainWindowRecordingMixin:  # MainWindowRecordingMixin定義
         youtube_api_key = load_setting_value("youtube_api_key", "", str).strip()  # YouTube APIキー取得
         twitch_client_id = load_setting_value("twitch_client_id", "", str).strip()  # Twitch Client ID取得
         twitch_client_secret = load_setting_value("twitch_client_secret", "", str).strip()  # Twitch Client Secret取得
-        self.auto_check_thread = QtCore.QThread()  # 監視スレッドを生成
+        interval = load_setting_value("auto_check_interval", DEFAULT_AUTO_CHECK_INTERVAL_SEC, int)  # 間隔設定を取得
         self.auto_check_worker = AutoCheckWorker(  # 監視ワーカー生成
             youtube_api_key=youtube_api_key,  # YouTube APIキー指定
             youtube_channels=youtube_channels,  # YouTube配信者指定
@@ -763,13 +769,14 @@ class MainWindowRecordingMixin:  # MainWindowRecordingMixin定義
             fallback_notify_urls=notify_urls,  # 通知のみURL指定
             http_timeout=int(http_timeout),  # HTTPタイムアウト指定
             stream_timeout=int(stream_timeout),  # ストリームタイムアウト指定
+            live_cache_ttl_sec=int(interval) * AUTO_CHECK_LIVE_CACHE_INTERVALS,  # 次の周期まで確認結果を使い回す
         )  # ワーカー生成終了
-        self.auto_check_worker.moveToThread(self.auto_check_thread)  # ワーカーをスレッドへ移動
-        self.auto_check_thread.started.connect(self.auto_check_worker.run)  # 開始イベント接続
-        self.auto_check_worker.log_signal.connect(self._append_log)  # ログ接続
+        self.auto_check_worker.log_batch_signal.connect(self._append_logs)  # ログ接続 (まとめて追記)
         self.auto_check_worker.notify_signal.connect(self._show_info)  # 通知ポップアップを接続
         self.auto_check_worker.finished_signal.connect(self._on_auto_check_finished)  # 完了イベント接続
-        self.auto_check_thread.start()  # 監視スレッド開始
+        self.auto_check_worker.finished_signal.connect(self.auto_check_worker.deleteLater)  # run終了後に破棄 (停止後も実行中のrunとは重ならない)
+        # 監視は周期ごとの短い処理のため、専用スレッドを毎回作らず共有スレッドプールで実行する
+        QtCore.QThreadPool.globalInstance().start(self.auto_check_worker.run)  # 監視処理を開始
     def _on_auto_check_finished(self, live_urls: list[str], notify_urls: list[str]) -> None:  # 自動監視完了処理
         manual_requested = bool(getattr(self, "_manual_auto_record_requested", False))
         if self.auto_paused_by_user:  # 手動停止中の場合
@@ -798,15 +805,20 @@ class MainWindowRecordingMixin:  # MainWindowRecordingMixin定義
         self.auto_check_in_progress = False  # 監視中フラグを解除
         if manual_requested:
             self._manual_auto_record_requested = False
-    def _cleanup_auto_check_thread(self) -> None:  # 自動監視スレッドの後始末
-        if self.auto_check_worker is not None:  # ワーカーが存在する場合
-            self.auto_check_worker.deleteLater()  # ワーカーを破棄
-        if self.auto_check_thread is not None:  # スレッドが存在する場合
-            self.auto_check_thread.quit()  # スレッド終了要求
-            self.auto_check_thread.wait(3000)  # スレッド終了待機
-            self.auto_check_thread.deleteLater()  # スレッドを破棄
-        self.auto_check_worker = None  # ワーカー参照を破棄
-        self.auto_check_thread = None  # スレッド参照を破棄
+    def _cleanup_auto_check_thread(self) -> None:  # 自動監視ワーカーの後始末
+        worker = self.auto_check_worker  # 後始末するワーカー
+        self.auto_check_worker = None  # ワーカー参照を破棄 (実行中ならプール側の参照で終了まで保持される)
+        if worker is None:  # ワーカーが無い場合
+            return  # 何もしない
+        for signal, slot in (  # 画面への通知 (run終了時のdeleteLaterは残す)
+            (worker.log_batch_signal, self._append_logs),  # ログ
+            (worker.notify_signal, self._show_info),  # 通知ポップアップ
+            (worker.finished_signal, self._on_auto_check_finished),  # 完了イベント
+        ):
+            try:  # 接続解除
+                signal.disconnect(slot)  # 停止後に終わった監視の結果を受け取らない
+            except TypeError:  # 接続が無い場合
+                pass  # 何もしない
     def _start_auto_recording(self, url: str) -> None:  # 自動録画開始処理
         normalized_url = url.strip()  # URLを正規化
         if not normalized_url:  # URLが空の場合
@@ -816,6 +828,7 @@ class MainWindowRecordingMixin:  # MainWindowRecordingMixin定義
         if self.manual_recording_url == normalized_url:  # 手動録画中の場合
             self._append_log(f"自動録画: 手動録画中のためスキップ {normalized_url}")  # ログ出力
             return  # 処理中断
+        invalidate_live_probe_cache(normalized_url)  # 録画開始後の配信状態は改めて確認する
         output_dir = Path(load_setting_value("output_dir", "recordings", str))  # 出力ディレクトリ取得
         output_format = load_setting_value("output_format", DEFAULT_OUTPUT_FORMAT, str)  # 出力形式を取得
         auto_filename = None  # 配信者別ファイル名を使わない
@@ -892,6 +905,7 @@ class MainWindowRecordingMixin:  # MainWindowRecordingMixin定義
             self.stop_button.setEnabled(True)  # 停止ボタンを有効化
         self._update_timeshift_button_state()  # タイムシフトボタン状態を更新
     def _on_auto_recording_finished(self, url: str, exit_code: int) -> None:  # 自動録画終了処理
+        invalidate_live_probe_cache(url)  # 配信終了後に古い確認結果で録画を再開しない
         session = self.auto_sessions.pop(url, None)  # セッションを取得して削除
         if session is not None:  # セッションが存在する場合
             thread = session.get("thread")  # スレッド参照を取得
@@ -1104,6 +1118,7 @@ class MainWindowRecordingMixin:  # MainWindowRecordingMixin定義
         if self.auto_check_worker is not None:  # 自動監視ワーカーが存在する場合
             self.auto_check_worker.stop()  # 監視停止を要求
         self._cleanup_auto_check_thread()  # 自動監視スレッドを後始末
+        shutdown_auto_check_probes()  # URL確認用の常駐スレッドを終了
         self._stop_all_auto_recordings()  # 自動録画を停止
         if self.stop_event is not None:  # 録画中の場合
             self.stop_event.set()  # 停止フラグを設定
@@ -170,8 +170,20 @@ class MainWindowSettingsMixin:  # MainWindowSettingsMixin定義
                 audio.setVolume(float(self.preview_volume))  # 音量を反映
         if hasattr(self, "_apply_log_panel_visibility"):
             self._apply_log_panel_visibility()
+    def _on_settings_saved(self) -> None:  # 設定ダイアログ保存時の反映
+        self._load_settings_to_ui()  # 設定を再読み込み (ログパネル表示も反映)
+        self._configure_auto_monitor()  # 自動監視を再設定
+        self._apply_tray_setting(True)  # タスクトレイ設定を反映
+        self._apply_startup_setting(True)  # 自動起動設定を反映
+        self._apply_ui_theme()  # UIテーマを反映
     def _open_settings_dialog(self) -> None:  # 設定ダイアログ表示
-        dialog = SettingsDialog(self)  # 設定ダイアログ生成
+        dialog = getattr(self, "_settings_dialog", None)  # 生成済みの設定ダイアログ
+        if dialog is None:  # 初回のみ生成
+            dialog = SettingsDialog(self)  # 設定ダイアログ生成
+            dialog.settingsChanged.connect(self._on_settings_saved)  # 保存時の反映処理を接続
+            self._settings_dialog = dialog  # 閉じても破棄せず再利用
+        else:  # 2回目以降の場合
+            dialog.reload_settings()  # ウィジェットは作り直さず保存済みの値だけ反映
         if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:  # OK時の処理
             self._load_settings_to_ui()  # 設定を再読み込み
             self._configure_auto_monitor()  # 自動監視を再設定
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
+import bisect
+import collections
 import datetime as dt
-import subprocess
+import os
+import re
 import tempfile
 import threading
+import time
 import hashlib
 from pathlib import Path
 from typing import Optional
@@ -15,7 +19,6 @@ from utils.theme_utils import (
     get_ui_font_css_family,
     is_custom_ui_colors_enabled,
 )
-from streamlink import Streamlink
 from streamlink.exceptions import StreamlinkError
 from core.config import (
     DEFAULT_QUALITY,
@@ -32,78 +35,435 @@ from core.config import (
     OUTPUT_FORMAT_WAV,
     READ_CHUNK_SIZE,
 )
-from core.recording import find_ffmpeg_path, select_stream
+from core.recording import (  # 録画関連の補助
+    HW_H264_ENCODER_ARGS,
+    detect_hardware_h264_encoder,
+    disable_hardware_h264_encoder,
+    find_ffmpeg_path,
+    get_detected_hardware_h264_encoder,
+    probe_audio_codec,
+    select_stream,
+)
 from utils.settings_store import load_setting_value
 from utils.streamlink_utils import (
     apply_streamlink_options_for_url,
-    restore_streamlink_headers,
+    create_streamlink_session,
     set_streamlink_headers_for_url,
 )
 from utils.url_utils import ensure_unique_path
 
+CLIP_EXPORT_MAX_WORKERS = 4  # クリップ書き出しの同時実行数上限
+PREVIEW_EMIT_BATCH_BYTES = 256 * 1024  # プレビューデータをまとめて送る量
+PREVIEW_EMIT_INTERVAL_SEC = 0.05  # まとめ量に満たなくても送り出す間隔
+PREVIEW_PIPE_HIGH_WATER_BYTES = 4 * 1024 * 1024  # QProcessへ渡す書き込み待ちの上限
+PREVIEW_PIPE_MAX_QUEUED_BYTES = 64 * 1024 * 1024  # プロキシ側で保持する未送信データの上限
+TEMP_MP4_MOVFLAGS = "frag_keyframe+empty_moov+default_base_moof"  # 一時MP4の書き出し方式(追記のみで完結)
+_FORMAT_SUFFIX = {  # 出力形式ごとの拡張子
+    OUTPUT_FORMAT_TS: ".ts",
+    OUTPUT_FORMAT_MP4_COPY: ".mp4",
+    OUTPUT_FORMAT_MP4_LIGHT: ".mp4",
+    OUTPUT_FORMAT_MOV: ".mov",
+    OUTPUT_FORMAT_FLV: ".flv",
+    OUTPUT_FORMAT_MKV: ".mkv",
+    OUTPUT_FORMAT_MP3: ".mp3",
+    OUTPUT_FORMAT_WAV: ".wav",
+}
+_FORMAT_ENCODE_ARGS = {  # 出力形式ごとのエンコード引数(未登録はコピー)
+    OUTPUT_FORMAT_MP4_LIGHT: (
+        "-c:v",
+        "libx264",
+        "-preset",
+        "veryfast",
+        "-crf",
+        "28",
+        "-pix_fmt",
+        "yuv420p",
+        "-c:a",
+        "aac",
+        "-b:a",
+        "128k",
+    ),
+    OUTPUT_FORMAT_MP3: ("-vn", "-c:a", "libmp3lame", "-b:a", "192k"),
+    OUTPUT_FORMAT_WAV: ("-vn", "-c:a", "pcm_s16le"),
+}
+_COPY_ENCODE_ARGS = ("-c", "copy")
+TIMESHIFT_FILTER_THREADS = "2"  # 一時MP4生成時のフィルタースレッド数
+TIMESHIFT_PREWARM_MAX_BYTES = 8 * 1024 * 1024  # 再生前に先読みする録画の先頭サイズ (再生開始に必要な分だけで、再生・録画の書き込みと読み込みを奪い合わない)
+SEEK_TOLERANCE_MS = 250  # この差未満の位置合わせではシークしない
+SEEK_UPDATE_INTERVAL_MS = 16  # スライダー操作を反映する間隔
+POSITION_UPDATE_INTERVAL_MS = 250  # 再生位置表示の更新間隔(Qt6のQMediaPlayerは通知間隔を変更できないため表示側で間引く)
+_TWO_DIGIT_TEXT = tuple(f"{value:02d}" for value in range(100))  # ゼロ埋め2桁の文字列表
+_SEGMENT_PLACEHOLDER_COLOR = QtGui.QColor("#94a3b8")  # 区間未確定時の表示色
+_RECORDING_NAME_TIME_RE = re.compile(r"(\d{4})年(\d{2})月(\d{2})日-(\d{2})時(\d{2})分(\d{2})秒")
+
+def _ffmpeg_threads_per_invocation(n_workers: int) -> int:
+    # 同時実行するffmpeg間でCPUコアを分け合い、過剰なスレッド生成を避ける
+    workers = max(1, int(n_workers))
+    return max(1, (os.cpu_count() or workers) // workers)
+
+def _timeshift_encode_thread_args() -> tuple[str, ...]:
+    # libx264のスレッド数をコア数に固定し、既定の1.5倍割り当てによる取り合いを抑える
+    return ("-threads", str(_ffmpeg_threads_per_invocation(1)))
+
+_TIMESHIFT_STYLE_TEMPLATE = """
+            QDialog {{
+                background-color: {dialog_bg};
+                color: {base_text};
+                font-family: {font_family};
+            }}
+            QFrame#ControlBar {{
+                background-color: {control_bg};
+                border-top: 1px solid {control_border};
+                border-bottom-left-radius: 8px;
+                border-bottom-right-radius: 8px;
+            }}
+            QPushButton {{
+                background-color: transparent;
+                border: none;
+                border-radius: 4px;
+                color: {base_text};
+                font-weight: bold;
+                font-size: 13px;
+                padding: 6px 12px;
+            }}
+            QPushButton:hover {{
+                background-color: {control_border};
+                color: {base_text};
+            }}
+            QPushButton#PrimaryButton {{
+                background-color: {primary};
+                color: #ffffff;
+            }}
+            QPushButton#PrimaryButton:hover {{
+                background-color: {primary_hover};
+            }}
+            QPushButton#GhostButton {{
+                background-color: {ghost_bg};
+                color: {base_text};
+            }}
+            QPushButton#GhostButton:hover {{
+                background-color: {ghost_hover};
+            }}
+            QPushButton#DangerButton {{
+                background-color: {danger_bg};
+                color: {base_text};
+            }}
+            QPushButton#DangerButton:hover {{
+                background-color: {danger_hover};
+                color: {base_text};
+            }}
+            QLabel {{
+                color: {muted_text};
+                font-family: monospace;
+                font-size: 13px;
+                font-weight: bold;
+            }}
+            QLabel#SectionTitle {{
+                color: {base_text};
+                font-size: 13px;
+                font-weight: bold;
+                letter-spacing: 0.5px;
+            }}
+            QSlider::groove:horizontal {{
+                border: 1px solid {control_border};
+                height: 6px;
+                background: {control_bg};
+                margin: 2px 0;
+                border-radius: 3px;
+            }}
+            QSlider::handle:horizontal {{
+                background: {primary};
+                border: 1px solid {primary};
+                width: 14px;
+                height: 14px;
+                margin: -5px 0;
+                border-radius: 7px;
+            }}
+            QSlider::handle:horizontal:hover {{
+                background: {primary_hover};
+            }}
+            QSlider::sub-page:horizontal {{
+                background: {primary};
+                border-radius: 3px;
+            }}
+            QFrame#ClipPanel {{
+                background-color: {panel_bg};
+                border-top: 1px solid {panel_border};
+                border-bottom-left-radius: 8px;
+                border-bottom-right-radius: 8px;
+            }}
+            QLineEdit, QComboBox {{
+                background-color: {input_bg};
+                color: {base_text};
+                border: 1px solid {input_border};
+                border-radius: 6px;
+                padding: 6px 10px;
+            }}
+            QLineEdit:focus, QComboBox:focus {{
+                border: 2px solid {primary};
+                padding: 5px 9px;
+            }}
+            QListView {{
+                background-color: {list_bg};
+                border: none;
+                border-radius: 8px;
+                padding: 6px;
+                outline: none;
+            }}
+            QListView::item {{
+                background-color: {list_item_bg};
+                border: 1px solid {list_item_border};
+                border-radius: 6px;
+                padding: 8px;
+                margin-bottom: 6px;
+                color: {base_text};
+            }}
+            QListView::item:selected {{
+                border: 1px solid {primary};
+                background-color: {list_item_selected};
+                color: {primary};
+                font-weight: bold;
+            }}
+            QListView::item:focus {{
+                outline: none;
+            }}
+        """
+_TIMESHIFT_STYLE_CACHE: dict[tuple[tuple[str, str], ...], str] = {}  # 配色ごとの生成済みスタイルシート
+
+def _render_timeshift_style(values: dict[str, str]) -> str:
+    # 同じ配色・フォントなら生成済みの文字列を使い回す
+    key = tuple(sorted(values.items()))
+    style = _TIMESHIFT_STYLE_CACHE.get(key)
+    if style is None:
+        style = _TIMESHIFT_STYLE_TEMPLATE.format_map(values)
+        _TIMESHIFT_STYLE_CACHE[key] = style
+    return style
+
+def _read_file_head(path: Path, stop_event: threading.Event) -> None:
+    # 読み捨てることでOSのキャッシュに載せる(再生側は同じファイルをパスで開く)
+    remaining = TIMESHIFT_PREWARM_MAX_BYTES
+    try:
+        with path.open("rb", buffering=0) as handle:
+            while remaining > 0 and not stop_event.is_set():
+                data = handle.read(min(READ_CHUNK_SIZE, remaining))
+                if not data:
+                    break
+                remaining -= len(data)
+    except OSError:
+        pass
+
+class SegmentRangesModel(QtCore.QAbstractListModel):
+    # 区間ラベルは表示時に生成し、区間数ぶんの項目オブジェクトを作らない
+    def __init__(self, label_for, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._label_for = label_for
+        self._ranges: list[tuple[int, int]] = []
+        self._placeholder = ""
+
+    def reset(self, ranges: list[tuple[int, int]], placeholder: str) -> None:
+        self.beginResetModel()
+        self._ranges = ranges
+        self._placeholder = placeholder
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._ranges) or 1
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlag:
+        if not self._ranges:
+            return QtCore.Qt.ItemFlag.NoItemFlags
+        return super().flags(index)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if not self._ranges:
+            if role == QtCore.Qt.ItemDataRole.DisplayRole:
+                return self._placeholder
+            if role == QtCore.Qt.ItemDataRole.ForegroundRole:
+                return _SEGMENT_PLACEHOLDER_COLOR
+            return None
+        segment = self._ranges[index.row()]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self._label_for(*segment)
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return segment
+        return None
+
+PREVIEW_READER_MAX_THREADS = 32  # 同時に読み込めるプレビュー配信数の上限
+_PREVIEW_READER_POOL: list[QtCore.QThreadPool] = []  # プレビュー読み込み専用のスレッドプール
+
+def get_preview_reader_pool() -> QtCore.QThreadPool:
+    # 読み込みは配信ごとにスレッドを占有するため、グローバルプールとは分けて優先度を上げる
+    if not _PREVIEW_READER_POOL:
+        pool = QtCore.QThreadPool()
+        pool.setMaxThreadCount(PREVIEW_READER_MAX_THREADS)
+        pool.setThreadPriority(QtCore.QThread.Priority.HighPriority)
+        _PREVIEW_READER_POOL.append(pool)
+    return _PREVIEW_READER_POOL[0]
+
+class PreviewDataRing:
+    # 読み込みスレッドが積み、GUIスレッドがまとめて取り出す単一生産者・単一消費者のキュー
+    # dequeのappend/popleftはGILの下で不可分なため、追加のロックは不要
+    def __init__(self) -> None:
+        self._chunks: collections.deque[bytes] = collections.deque()
+        self._wake_pending = False
+    def push(self, data: bytes) -> bool:
+        # 取り出し待ちの通知が無い場合だけTrueを返し、通知を1回にまとめる
+        self._chunks.append(data)
+        if self._wake_pending:
+            return False
+        self._wake_pending = True
+        return True
+    def take(self) -> list[bytes]:
+        # 通知済みフラグを先に戻してから取り出し、取りこぼしを防ぐ
+        self._wake_pending = False
+        chunks: list[bytes] = []
+        while True:
+            try:
+                chunks.append(self._chunks.popleft())
+            except IndexError:
+                return chunks
+
 class PreviewPipeProxy(QtCore.QObject):
     def __init__(self, process: QtCore.QProcess) -> None:
         super().__init__()
         self._process = process
         self._closed = False
+        self._close_requested = False
+        self._pending: collections.deque[bytes] = collections.deque()
+        self._queued_bytes = 0
+        self._ring: PreviewDataRing | None = None
+        self._process.bytesWritten.connect(self._drain)
+    def set_source_ring(self, ring: PreviewDataRing) -> None:
+        self._ring = ring
+    @QtCore.pyqtSlot()
+    def drain_ring(self) -> None:
+        if self._ring is None:
+            return
+        for data in self._ring.take():
+            self._enqueue(data)
+        self._drain()
     @QtCore.pyqtSlot(bytes)
     def write_data(self, data: bytes) -> None:
-        if self._closed:
+        self._enqueue(data)
+        self._drain()
+    def _enqueue(self, data: bytes) -> None:
+        if self._closed or self._close_requested:
             return
         if self._process.state() != QtCore.QProcess.ProcessState.Running:
             return
-        if self._process.write(data) == -1:
+        self._pending.append(data)
+        self._queued_bytes += len(data)
+        # ffmpegが詰まった場合は古いデータから捨て、メモリの増加を抑える
+        while self._queued_bytes > PREVIEW_PIPE_MAX_QUEUED_BYTES and len(self._pending) > 1:
+            self._queued_bytes -= len(self._pending.popleft())
+    @QtCore.pyqtSlot()
+    def _drain(self) -> None:
+        if self._closed:
             return
-        self._process.waitForBytesWritten(100)
+        if self._process.state() != QtCore.QProcess.ProcessState.Running:
+            self._pending.clear()
+            self._queued_bytes = 0
+            return
+        # 書き込み待ちが上限未満の間だけ渡し、残りはbytesWritten通知で送る
+        while self._pending and self._process.bytesToWrite() < PREVIEW_PIPE_HIGH_WATER_BYTES:
+            data = self._pending.popleft()
+            self._queued_bytes -= len(data)
+            if self._process.write(data) == -1:
+                self._pending.clear()
+                self._queued_bytes = 0
+                break
+        if self._close_requested and not self._pending:
+            self._close_write_channel()
     @QtCore.pyqtSlot()
     def close(self) -> None:
+        if self._closed or self._close_requested:
+            return
+        if self._ring is not None:
+            for data in self._ring.take():
+                self._enqueue(data)
+        self._close_requested = True
+        self._drain()
+        if self._process.state() != QtCore.QProcess.ProcessState.Running:
+            self._close_write_channel()
+    def _close_write_channel(self) -> None:
         if self._closed:
             return
         self._closed = True
+        self._pending.clear()
+        self._queued_bytes = 0
         self._process.closeWriteChannel()
 
 class StreamlinkPreviewWorker(QtCore.QObject):
-    data_signal = QtCore.pyqtSignal(bytes)
+    data_ready = QtCore.pyqtSignal()
     log_signal = QtCore.pyqtSignal(str)
     finished_signal = QtCore.pyqtSignal()
     def __init__(self, url: str, stop_event: threading.Event) -> None:
         super().__init__()
         self._url = url
         self._stop_event = stop_event
+        self.ring = PreviewDataRing()
     def run(self) -> None:
+        try:
+            self._read_stream()
+        finally:
+            # 終了通知はrunの最後の処理として送る (受信側はこの通知でdeleteLaterするため、以降は自身に触れない)
+            self.finished_signal.emit()
+    def _read_stream(self) -> None:
         stream_io = None
-        session = Streamlink()
+        # 小さな読み込み単位はまとめてからリングに積み、GUIスレッドへは通知だけを送る
+        pending = bytearray()
         http_timeout = load_setting_value("http_timeout", 20, int)
         stream_timeout = load_setting_value("stream_timeout", 60, int)
-        session.set_option("http-timeout", int(http_timeout))
-        session.set_option("stream-timeout", int(stream_timeout))
-        apply_streamlink_options_for_url(session, self._url)
-        original_headers = dict(session.http.headers)
         try:
-            original_headers = set_streamlink_headers_for_url(session, self._url)
+            # プラグインがヘッダーやCookieを書き換えるため、プレビューごとに専用のセッションを使う
+            session = create_streamlink_session(http_timeout, stream_timeout)
+            apply_streamlink_options_for_url(session, self._url)
+            set_streamlink_headers_for_url(session, self._url)
             streams = session.streams(self._url)
             if not streams:
                 self.log_signal.emit("プレビュー用ストリームが見つかりませんでした。")
                 return
             stream = select_stream(streams, DEFAULT_QUALITY)
             stream_io = stream.open()
+            # 読み込みバッファは一度だけ確保し、readinto対応時は再利用する
+            buffer = bytearray(READ_CHUNK_SIZE)
+            view = memoryview(buffer)
+            readinto = getattr(stream_io, "readinto", None)
+            deadline = time.monotonic() + PREVIEW_EMIT_INTERVAL_SEC
             while not self._stop_event.is_set():
-                data = stream_io.read(READ_CHUNK_SIZE)
-                if not data:
-                    break
-                self.data_signal.emit(data)
+                if readinto is not None:
+                    size = readinto(view)
+                    if not size:
+                        break
+                    pending += view[:size]
+                else:
+                    data = stream_io.read(READ_CHUNK_SIZE)
+                    if not data:
+                        break
+                    pending += data
+                if len(pending) >= PREVIEW_EMIT_BATCH_BYTES or time.monotonic() >= deadline:
+                    self._push(bytes(pending))
+                    pending.clear()
+                    deadline = time.monotonic() + PREVIEW_EMIT_INTERVAL_SEC
         except StreamlinkError as exc:
             self.log_signal.emit(f"プレビュー用ストリーム取得に失敗しました: {exc}")
         except Exception as exc:
             self.log_signal.emit(f"プレビュー用ストリーム読み込みに失敗しました: {exc}")
         finally:
-            restore_streamlink_headers(session, original_headers)
+            if pending:
+                self._push(bytes(pending))
             if stream_io is not None and hasattr(stream_io, "close"):
                 try:
                     stream_io.close()
                 except Exception:
                     pass
-            self.finished_signal.emit()
+    def _push(self, data: bytes) -> None:
+        if self.ring.push(data):
+            self.data_ready.emit()
 
 class TimeShiftWindow(QtWidgets.QDialog):
     def __init__(self, recording_path: Path, parent: QtWidgets.QWidget | None = None) -> None:
@@ -116,19 +476,46 @@ class TimeShiftWindow(QtWidgets.QDialog):
         self._temp_mp4_range: tuple[int, int] | None = None
         self._temp_mp4_is_copy = False
         self._temp_mp4_retry = False
+        self._copy_remux_failed = False
+        self._temp_mp4_source_stamp: tuple[int, int] | None = None
         self._was_playing_before_seek = False
         self._proxy_process: QtCore.QProcess | None = None
         self._proxy_target_range: tuple[int, int] | None = None
         self._proxy_mp4_path: Path | None = None
+        self._proxy_encoder: str | None = None
         self._temp_files: set[Path] = set()
+        self._reserved_clip_paths: set[Path] = set()
+        self._clip_processes: dict[QtCore.QProcess, list[int]] = {}
+        self._clip_queue: list[tuple[int, int, list[str]]] = []
+        self._clip_total = 0
+        self._clip_skipped = 0
+        self._clip_done = 0
+        self._clip_success = 0
+        self._clip_ffmpeg_path = ""
+        self._clip_progress: QtWidgets.QProgressDialog | None = None
+        self._reencode_process: QtCore.QProcess | None = None
+        self._reencode_context: dict[str, object] | None = None
+        self._reencode_progress: QtWidgets.QProgressDialog | None = None
         self._dragging_slider = False
+        self._pending_position = 0
+        self._duration_ms = 0
+        self._pending_seek = 0
+        self._pending_resume_pos: int | None = None
+        self._duration_text_ms = 0
+        self._duration_text = "00:00"
+        self._position_label_key: tuple[int, int] | None = None
         self._clips: list[tuple[int, int]] = []
         self._segment_ranges: list[tuple[int, int]] = []
+        self._segment_base_seconds: int | None = None
+        self._last_seek_key: tuple[QtCore.QUrl, int, int] | None = None
         self._segment_playback: tuple[int, int] | None = None
         self._last_duration_ms = 0
         self._recording_duration_ms = 0
         self._mp4_converted_segments: set[tuple[int, int]] = set()
         self._mp4_converted_all = False
+        self._recording_start_cache: dt.datetime | None = None
+        self._recording_start_resolved = False
+        self._source_audio_state: dict[str, str | None] = {}  # ワーカーで取得した音声コーデック
         self._segment_hours = load_setting_value(
             "timeshift_segment_hours",
             DEFAULT_TIMESHIFT_SEGMENT_HOURS,
@@ -148,8 +535,11 @@ class TimeShiftWindow(QtWidgets.QDialog):
         self.setWindowTitle("クリップ作成ツール")
         self.setMinimumSize(800, 500)
         self._apply_theme()
+        self._prewarm_stop = threading.Event()
         self._build_ui()
         self._connect_player_signals()
+        self._prewarm_recording_file()
+        self._start_encode_probes()
         self._apply_source_and_play()
 
     def _apply_theme(self):
@@ -214,129 +604,29 @@ class TimeShiftWindow(QtWidgets.QDialog):
                 list_item_bg = adjust_color(dialog_bg, 1.04 if is_dark else 1.0)
                 list_item_border = control_border
                 list_item_selected = adjust_color(panel_bg, 1.08 if is_dark else 0.95)
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {dialog_bg};
-                color: {base_text};
-                font-family: {get_ui_font_css_family(["Yu Gothic UI", "Segoe UI", "sans-serif"])};
-            }}
-            QFrame#ControlBar {{
-                background-color: {control_bg};
-                border-top: 1px solid {control_border};
-                border-bottom-left-radius: 8px;
-                border-bottom-right-radius: 8px;
-            }}
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-                color: {base_text};
-                font-weight: bold;
-                font-size: 13px;
-                padding: 6px 12px;
-            }}
-            QPushButton:hover {{
-                background-color: {control_border};
-                color: {base_text};
-            }}
-            QPushButton#PrimaryButton {{
-                background-color: {primary};
-                color: #ffffff;
-            }}
-            QPushButton#PrimaryButton:hover {{
-                background-color: {primary_hover};
-            }}
-            QPushButton#GhostButton {{
-                background-color: {ghost_bg};
-                color: {base_text};
-            }}
-            QPushButton#GhostButton:hover {{
-                background-color: {ghost_hover};
-            }}
-            QPushButton#DangerButton {{
-                background-color: {danger_bg};
-                color: {base_text};
-            }}
-            QPushButton#DangerButton:hover {{
-                background-color: {danger_hover};
-                color: {base_text};
-            }}
-            QLabel {{
-                color: {muted_text};
-                font-family: monospace;
-                font-size: 13px;
-                font-weight: bold;
-            }}
-            QLabel#SectionTitle {{
-                color: {base_text};
-                font-size: 13px;
-                font-weight: bold;
-                letter-spacing: 0.5px;
-            }}
-            QSlider::groove:horizontal {{
-                border: 1px solid {control_border};
-                height: 6px;
-                background: {control_bg};
-                margin: 2px 0;
-                border-radius: 3px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {primary};
-                border: 1px solid {primary};
-                width: 14px;
-                height: 14px;
-                margin: -5px 0;
-                border-radius: 7px;
-            }}
-            QSlider::handle:horizontal:hover {{
-                background: {primary_hover};
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {primary};
-                border-radius: 3px;
-            }}
-            QFrame#ClipPanel {{
-                background-color: {panel_bg};
-                border-top: 1px solid {panel_border};
-                border-bottom-left-radius: 8px;
-                border-bottom-right-radius: 8px;
-            }}
-            QLineEdit, QComboBox {{
-                background-color: {input_bg};
-                color: {base_text};
-                border: 1px solid {input_border};
-                border-radius: 6px;
-                padding: 6px 10px;
-            }}
-            QLineEdit:focus, QComboBox:focus {{
-                border: 2px solid {primary};
-                padding: 5px 9px;
-            }}
-            QListWidget {{
-                background-color: {list_bg};
-                border: none;
-                border-radius: 8px;
-                padding: 6px;
-                outline: none;
-            }}
-            QListWidget::item {{
-                background-color: {list_item_bg};
-                border: 1px solid {list_item_border};
-                border-radius: 6px;
-                padding: 8px;
-                margin-bottom: 6px;
-                color: {base_text};
-            }}
-            QListWidget::item:selected {{
-                border: 1px solid {primary};
-                background-color: {list_item_selected};
-                color: {primary};
-                font-weight: bold;
-            }}
-            QListWidget::item:focus {{
-                outline: none;
-            }}
-        """)
+        colors = {
+            "dialog_bg": dialog_bg,
+            "control_bg": control_bg,
+            "control_border": control_border,
+            "base_text": base_text,
+            "muted_text": muted_text,
+            "primary": primary,
+            "primary_hover": primary_hover,
+            "ghost_bg": ghost_bg,
+            "ghost_hover": ghost_hover,
+            "danger_bg": danger_bg,
+            "danger_hover": danger_hover,
+            "panel_bg": panel_bg,
+            "panel_border": panel_border,
+            "input_bg": input_bg,
+            "input_border": input_border,
+            "list_bg": list_bg,
+            "list_item_bg": list_item_bg,
+            "list_item_border": list_item_border,
+            "list_item_selected": list_item_selected,
+            "font_family": get_ui_font_css_family(["Yu Gothic UI", "Segoe UI", "sans-serif"]),
+        }
+        self.setStyleSheet(_render_timeshift_style(colors))
 
     def _build_ui(self) -> None:
         layout = QtWidgets.QVBoxLayout(self)
@@ -403,10 +693,15 @@ class TimeShiftWindow(QtWidgets.QDialog):
 
         segment_row = QtWidgets.QHBoxLayout()
         segment_row.setSpacing(10)
-        self._segment_list = QtWidgets.QListWidget()
+        self._segment_model = SegmentRangesModel(self._segment_label, self)
+        self._segment_list = QtWidgets.QListView()
+        self._segment_list.setModel(self._segment_model)
+        self._segment_list.setUniformItemSizes(True)
         self._segment_list.setMinimumHeight(180)
         self._segment_list.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
-        self._segment_list.itemSelectionChanged.connect(self._apply_selected_segment)
+        self._segment_list.selectionModel().selectionChanged.connect(
+            lambda *_: self._apply_selected_segment()
+        )
         self._segment_mp4_btn = QtWidgets.QPushButton("選択をMP4変換")
         self._segment_mp4_btn.setToolTip("選択した区間を一時MP4に変換して再生します。")
         self._segment_mp4_btn.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
@@ -531,6 +826,14 @@ class TimeShiftWindow(QtWidgets.QDialog):
         self._position_slider.sliderMoved.connect(self._on_slider_moved)
 
     def _connect_player_signals(self) -> None:
+        self._position_timer = QtCore.QTimer(self)
+        self._position_timer.setSingleShot(True)
+        self._position_timer.setInterval(POSITION_UPDATE_INTERVAL_MS)
+        self._position_timer.timeout.connect(self._flush_position)
+        self._seek_timer = QtCore.QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(SEEK_UPDATE_INTERVAL_MS)
+        self._seek_timer.timeout.connect(self._flush_seek)
         self._player.positionChanged.connect(self._update_position)
         self._player.durationChanged.connect(self._update_duration)
         self._player.playbackStateChanged.connect(self._update_play_button_text)
@@ -544,12 +847,38 @@ class TimeShiftWindow(QtWidgets.QDialog):
         if self._recording_path.stat().st_size <= 0:
             QtWidgets.QMessageBox.information(self, "情報", "録画ファイルがまだ作成中です。")
             return
-        playback_path = self._prepare_timeshift_source(self._recording_path, force=True)
+        playback_path = self._prepare_timeshift_source(self._recording_path, force=False)
         self._playback_path = playback_path
         file_url = QtCore.QUrl.fromLocalFile(str(playback_path))
         self._player.setSource(file_url)
         self._player.play()
 
+    def _prewarm_recording_file(self) -> None:
+        # ページキャッシュに載っていない録画は初回再生で数秒止まるため、先読みしておく
+        path = self._recording_path
+        if hasattr(os, "posix_fadvise"):
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                return
+            try:
+                os.posix_fadvise(fd, 0, TIMESHIFT_PREWARM_MAX_BYTES, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+            return
+        stop_event = self._prewarm_stop
+        QtCore.QThreadPool.globalInstance().start(lambda: _read_file_head(path, stop_event))
+
+    def _start_encode_probes(self) -> None:
+        # ffmpeg/ffprobeの確認は数秒かかりうるためGUIスレッドでは待たず、結果が出るまでは安全な既定の引数で変換する
+        path = self._recording_path
+        state = self._source_audio_state
+        pool = QtCore.QThreadPool.globalInstance()
+        pool.start(detect_hardware_h264_encoder)
+        pool.start(lambda: state.setdefault("codec", probe_audio_codec(path)))
+
     def _toggle_playback(self) -> None:
         state = self._player.playbackState()
         if state == QtMultimedia.QMediaPlayer.PlaybackState.PlayingState:
@@ -565,12 +894,7 @@ class TimeShiftWindow(QtWidgets.QDialog):
         playback_path = self._prepare_timeshift_source(self._recording_path, force=True)
         self._playback_path = playback_path
         file_url = QtCore.QUrl.fromLocalFile(str(playback_path))
-        self._player.setSource(file_url)
-        self._player.play()
-        QtCore.QTimer.singleShot(
-            500,
-            lambda: self._player.setPosition(current_pos),
-        )
+        self._play_source_from(file_url, current_pos)
 
     def _on_slider_pressed(self) -> None:
         self._dragging_slider = True
@@ -579,6 +903,7 @@ class TimeShiftWindow(QtWidgets.QDialog):
         )
 
     def _on_slider_released(self) -> None:
+        self._seek_timer.stop()
         self._dragging_slider = False
         self._player.setPosition(int(self._position_slider.value()))
         if self._was_playing_before_seek and (
@@ -587,8 +912,14 @@ class TimeShiftWindow(QtWidgets.QDialog):
             self._player.play()
 
     def _on_slider_moved(self, value: int) -> None:
-        position = int(value)
-        self._position_label.setText(self._format_position(position, int(self._player.duration())))
+        # ドラッグ中の移動通知はまとめ、最新の位置だけを反映する
+        self._pending_seek = int(value)
+        if not self._seek_timer.isActive():
+            self._seek_timer.start()
+
+    def _flush_seek(self) -> None:
+        position = self._pending_seek
+        self._set_position_label(position, self._duration_ms)
         if self._dragging_slider:
             self._player.setPosition(position)
             if self._was_playing_before_seek and (
@@ -599,20 +930,31 @@ class TimeShiftWindow(QtWidgets.QDialog):
     def _update_position(self, position: int) -> None:
         if self._dragging_slider:
             return
-        self._position_slider.setValue(int(position))
+        # 表示更新はタイマーでまとめ、再生位置通知ごとの文字列生成を避ける
+        self._pending_position = int(position)
+        if not self._position_timer.isActive():
+            self._position_timer.start()
+        if position >= self._position_slider.maximum():
+            self._player.pause()
+
+    def _flush_position(self) -> None:
+        self._position_timer.stop()
+        if self._dragging_slider:
+            return
+        position = self._pending_position
+        self._position_slider.setValue(position)
         segment = None if self._use_temp_mp4 else self._segment_playback
         if segment:
             start_ms, end_ms = segment
             total_ms = max(0, end_ms - start_ms)
-            current_ms = max(0, min(total_ms, int(position) - start_ms))
-            self._position_label.setText(self._format_position(current_ms, total_ms))
+            current_ms = max(0, min(total_ms, position - start_ms))
+            self._set_position_label(current_ms, total_ms)
         else:
-            self._position_label.setText(self._format_position(int(position), int(self._player.duration())))
-        if position >= self._position_slider.maximum():
-            self._player.pause()
+            self._set_position_label(position, self._duration_ms)
 
     def _update_duration(self, duration: int) -> None:
         duration_ms = max(0, int(duration))
+        self._duration_ms = duration_ms  # 以降の位置更新ではプレーヤーへ問い合わせない
         if self._temp_mp4_path is None and duration_ms > 0:
             self._recording_duration_ms = duration_ms
         base_duration_ms = duration_ms
@@ -620,7 +962,7 @@ class TimeShiftWindow(QtWidgets.QDialog):
             base_duration_ms = self._recording_duration_ms
         if self._segment_playback is None:
             self._position_slider.setRange(0, duration_ms)
-            self._position_label.setText(self._format_position(int(self._player.position()), duration_ms))
+            self._set_position_label(int(self._player.position()), duration_ms)
         self._maybe_refresh_segments(base_duration_ms)
 
     def _update_play_button_text(self, state: QtMultimedia.QMediaPlayer.PlaybackState) -> None:
@@ -635,23 +977,62 @@ class TimeShiftWindow(QtWidgets.QDialog):
         details = self._player.errorString() or "不明なエラー"
         if self._use_temp_mp4 and self._temp_mp4_is_copy and not self._temp_mp4_retry:
             self._temp_mp4_retry = True
+            self._copy_remux_failed = True
             self._player.stop()
             self._player.setSource(QtCore.QUrl())
-            if self._reencode_temp_mp4():
+            if self._reencode_temp_mp4(
+                lambda succeeded: None if succeeded else self._show_playback_error(details)
+            ):
                 return
+        self._show_playback_error(details)
+
+    def _show_playback_error(self, details: str) -> None:
         self._temp_mp4_retry = False
         QtWidgets.QMessageBox.information(self, "情報", f"クリップ作成ツールでの再生に失敗しました: {details}")
 
     def _on_media_status(self, status: QtMultimedia.QMediaPlayer.MediaStatus) -> None:
         if status == QtMultimedia.QMediaPlayer.MediaStatus.EndOfMedia:
             self._player.pause()
+            return
+        self._apply_pending_resume(status)
+
+    def _play_source_from(self, file_url: QtCore.QUrl, position: int) -> None:
+        # 読み込み完了を待ってから位置を戻し、固定の待ち時間に頼らない
+        self._pending_resume_pos = int(position)
+        self._player.setSource(file_url)
+        self._player.play()
+        # 同じソースの再設定や同期読み込みでは状態通知が来ないため、その場で反映する
+        self._apply_pending_resume(self._player.mediaStatus())
+
+    def _apply_pending_resume(self, status: QtMultimedia.QMediaPlayer.MediaStatus) -> None:
+        if self._pending_resume_pos is None:
+            return
+        if status not in (
+            QtMultimedia.QMediaPlayer.MediaStatus.LoadedMedia,
+            QtMultimedia.QMediaPlayer.MediaStatus.BufferedMedia,
+        ):
+            return
+        position = self._pending_resume_pos
+        self._pending_resume_pos = None
+        self._player.setPosition(position)
 
     def _prepare_timeshift_source(self, input_path: Path, force: bool = False) -> Path:
         if self._use_temp_mp4 and self._temp_mp4_path and self._temp_mp4_path.exists():
-            return self._temp_mp4_path
+            # 全体変換の一時MP4は録画が伸びると古くなるため、強制更新時は指紋で鮮度を確認する
+            if not force or self._temp_mp4_range is not None:
+                return self._temp_mp4_path
+            if self._source_fingerprint(input_path) == self._temp_mp4_source_stamp:
+                return self._temp_mp4_path
         self._use_temp_mp4 = False
         return input_path
 
+    def _source_fingerprint(self, path: Path) -> tuple[int, int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (int(stat.st_size), int(stat.st_mtime_ns))
+
     def _register_temp_path(self, path: Path) -> None:
         self._temp_files.add(path)
 
@@ -679,40 +1060,34 @@ class TimeShiftWindow(QtWidgets.QDialog):
         if duration_sec <= 0:
             return
         proxy_path = self._build_proxy_path(start_ms, end_ms)
+        self._stop_proxy_process()
         self._proxy_target_range = (int(start_ms), int(end_ms))
         self._proxy_mp4_path = proxy_path
         self._register_temp_path(proxy_path)
         if proxy_path.exists():
             self._switch_to_proxy(proxy_path, start_ms, end_ms)
             return
-        self._stop_proxy_process()
         process = QtCore.QProcess(self)
         self._proxy_process = process
         process.finished.connect(self._on_proxy_finished)
+        encoder = get_detected_hardware_h264_encoder()
+        self._proxy_encoder = encoder
         args = [
             "-y",
+            "-filter_threads",
+            TIMESHIFT_FILTER_THREADS,
             "-ss",
             f"{max(0.0, start_ms / 1000.0):.3f}",
             "-i",
             str(self._recording_path),
             "-t",
             f"{duration_sec:.3f}",
-            "-c:v",
-            "libx264",
-            "-preset",
-            "veryfast",
-            "-crf",
-            "32",
+            *self._timeshift_video_args("32", encoder),
             "-vf",
             "scale=-2:480",
-            "-pix_fmt",
-            "yuv420p",
-            "-c:a",
-            "aac",
-            "-b:a",
-            "96k",
+            *self._timeshift_audio_args("96k"),
             "-movflags",
-            "+faststart",
+            TEMP_MP4_MOVFLAGS,
             str(proxy_path),
         ]
         process.start(ffmpeg_path, args)
@@ -721,17 +1096,24 @@ class TimeShiftWindow(QtWidgets.QDialog):
         process = self._proxy_process
         target = self._proxy_target_range
         proxy_path = self._proxy_mp4_path
+        encoder = self._proxy_encoder
         self._proxy_process = None
+        self._proxy_encoder = None
         if process is None or target is None or proxy_path is None:
             return
         if process.exitStatus() != QtCore.QProcess.ExitStatus.NormalExit:
             return
         if process.exitCode() != 0:
+            if encoder is not None:
+                # HWエンコーダが使えない環境ではlibx264で作り直す
+                disable_hardware_h264_encoder()
+                proxy_path.unlink(missing_ok=True)
+                self._start_proxy_for_range(*target)
             return
-        selected = self._segment_list.selectedItems()
-        if not selected:
+        selected = self._selected_segment_range()
+        if selected is None:
             return
-        start_ms, end_ms = selected[0].data(QtCore.Qt.ItemDataRole.UserRole)
+        start_ms, end_ms = selected
         if (int(start_ms), int(end_ms)) != target:
             return
         if not proxy_path.exists():
@@ -749,22 +1131,31 @@ class TimeShiftWindow(QtWidgets.QDialog):
         self._temp_mp4_retry = False
         self._segment_playback = None
         file_url = QtCore.QUrl.fromLocalFile(str(proxy_path))
-        self._player.setSource(file_url)
-        self._player.play()
-        QtCore.QTimer.singleShot(
-            300,
-            lambda: self._player.setPosition(relative_pos),
-        )
+        self._play_source_from(file_url, relative_pos)
+
+    def _set_position_label(self, position_ms: int, duration_ms: int) -> None:
+        # 表示上の秒と全体長が変わらない間はラベルを書き換えない
+        label_key = (max(0, int(position_ms)) // 1000, int(duration_ms))
+        if label_key == self._position_label_key:
+            return
+        self._position_label_key = label_key
+        self._position_label.setText(self._format_position(position_ms, duration_ms))
 
     def _format_position(self, position_ms: int, duration_ms: int) -> str:
-        return f"{self._format_time(position_ms)} / {self._format_time(duration_ms)}"
+        if duration_ms != self._duration_text_ms:
+            self._duration_text_ms = duration_ms
+            self._duration_text = self._format_time(duration_ms)
+        # 再生中に毎回通る経路のため、位置側は_format_timeを呼ばずにその場で組み立てる
+        minutes, seconds = divmod(max(0, int(position_ms)) // 1000, 60)
+        if minutes < 100:
+            return f"{_TWO_DIGIT_TEXT[minutes]}:{_TWO_DIGIT_TEXT[seconds]} / {self._duration_text}"
+        return f"{minutes}:{_TWO_DIGIT_TEXT[seconds]} / {self._duration_text}"
 
     def _format_time(self, millis: int) -> str:
-        safe_millis = max(0, int(millis))
-        total_seconds = safe_millis // 1000
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
-        return f"{minutes:02d}:{seconds:02d}"
+        minutes, seconds = divmod(max(0, int(millis)) // 1000, 60)
+        if minutes < 100:
+            return f"{_TWO_DIGIT_TEXT[minutes]}:{_TWO_DIGIT_TEXT[seconds]}"
+        return f"{minutes}:{_TWO_DIGIT_TEXT[seconds]}"
 
     def _format_clock_time(self, timestamp: dt.datetime) -> str:
         return timestamp.strftime("%H:%M:%S")
@@ -837,8 +1228,30 @@ class TimeShiftWindow(QtWidgets.QDialog):
         if end_ms <= start_ms:
             QtWidgets.QMessageBox.information(self, "情報", "終了は開始より後にしてください。")
             return
-        self._clips.append((start_ms, end_ms))
-        self._refresh_clip_list()
+        # クリップは開始時刻順に保ち、追加した1件だけをリストへ挿入する
+        if not self._clips:
+            self._clip_list.clear()
+        row = bisect.bisect_right(self._clips, (start_ms, end_ms))
+        self._clips.insert(row, (start_ms, end_ms))
+        item = QtWidgets.QListWidgetItem(self._clip_item_text(row + 1, start_ms, end_ms))
+        item.setData(QtCore.Qt.ItemDataRole.UserRole, (start_ms, end_ms))
+        self._clip_list.insertItem(row, item)
+        self._renumber_clip_items(row + 1)
+
+    def _clip_item_text(self, index: int, start_ms: int, end_ms: int) -> str:
+        duration_ms = max(0, end_ms - start_ms)
+        return (
+            f"#{index} {self._format_time(start_ms)} → {self._format_time(end_ms)} "
+            f"({self._format_time(duration_ms)})"
+        )
+
+    def _renumber_clip_items(self, first_row: int) -> None:
+        for row in range(max(0, first_row), len(self._clips)):
+            item = self._clip_list.item(row)
+            if item is None:
+                break
+            start_ms, end_ms = self._clips[row]
+            item.setText(self._clip_item_text(row + 1, start_ms, end_ms))
 
     def _refresh_clip_list(self) -> None:
         self._clip_list.clear()
@@ -849,12 +1262,7 @@ class TimeShiftWindow(QtWidgets.QDialog):
             self._clip_list.addItem(placeholder)
             return
         for index, (start_ms, end_ms) in enumerate(self._clips, start=1):
-            duration_ms = max(0, end_ms - start_ms)
-            item_text = (
-                f"#{index} {self._format_time(start_ms)} → {self._format_time(end_ms)} "
-                f"({self._format_time(duration_ms)})"
-            )
-            item = QtWidgets.QListWidgetItem(item_text)
+            item = QtWidgets.QListWidgetItem(self._clip_item_text(index, start_ms, end_ms))
             item.setData(QtCore.Qt.ItemDataRole.UserRole, (start_ms, end_ms))
             self._clip_list.addItem(item)
 
@@ -863,10 +1271,18 @@ class TimeShiftWindow(QtWidgets.QDialog):
         if not selected:
             return
         indices = [self._clip_list.row(item) for item in selected]
+        removed = False
         for index in sorted(indices, reverse=True):
             if 0 <= index < len(self._clips):
                 self._clips.pop(index)
-        self._refresh_clip_list()
+                self._clip_list.takeItem(index)
+                removed = True
+        if not removed:
+            return
+        if not self._clips:
+            self._refresh_clip_list()
+            return
+        self._renumber_clip_items(min(indices))
 
     def _export_selected_clips(self) -> None:
         selected = self._clip_list.selectedItems()
@@ -883,87 +1299,208 @@ class TimeShiftWindow(QtWidgets.QDialog):
         self._export_clips(list(self._clips))
 
     def _export_clips(self, clips: list[tuple[int, int]]) -> None:
-        if not find_ffmpeg_path():
+        ffmpeg_path = find_ffmpeg_path()
+        if not ffmpeg_path:
             QtWidgets.QMessageBox.information(self, "情報", "ffmpegが見つかりません。")
             return
         if not self._recording_path.exists():
             QtWidgets.QMessageBox.information(self, "情報", "録画ファイルが見つかりません。")
             return
-        output_format = self._clip_format.currentData()
-        success = 0
-        for idx, (start_ms, end_ms) in enumerate(clips, start=1):
-            output_path = self._build_clip_output_path(idx, str(output_format))
-            if self._run_ffmpeg_clip(ffmpeg_path, start_ms, end_ms, output_path, str(output_format)):
-                success += 1
-        QtWidgets.QMessageBox.information(
-            self,
-            "情報",
-            f"クリップ保存完了: {success} / {len(clips)}",
+        if self._clip_processes or self._clip_queue:
+            QtWidgets.QMessageBox.information(self, "情報", "クリップを保存中です。完了までお待ちください。")
+            return
+        # 長さ0や録画範囲外の区間はffmpegを起動する前に除外する
+        duration_ms = self._recording_duration_ms or self._duration_ms
+        valid_clips: list[tuple[int, int]] = []
+        for start_ms, end_ms in clips:
+            start_ms = max(0, int(start_ms))
+            end_ms = min(duration_ms, int(end_ms)) if duration_ms > 0 else int(end_ms)
+            if end_ms > start_ms:
+                valid_clips.append((start_ms, end_ms))
+        if not valid_clips:
+            QtWidgets.QMessageBox.information(self, "情報", "保存できる区間のクリップがありません。")
+            return
+        self._clip_skipped = len(clips) - len(valid_clips)
+        output_format = str(self._clip_format.currentData())
+        # 出力パスは起動前にまとめて確定させ、並列実行時の名前衝突を防ぐ
+        jobs: list[tuple[int, int, Path]] = []
+        try:
+            for idx, (start_ms, end_ms) in enumerate(valid_clips, start=1):
+                output_path = self._build_clip_output_path(idx, output_format)
+                self._reserved_clip_paths.add(output_path)
+                jobs.append((start_ms, end_ms, output_path))
+        finally:
+            self._reserved_clip_paths.clear()
+        pool_size = max(1, min(CLIP_EXPORT_MAX_WORKERS, len(jobs)))
+        threads = _ffmpeg_threads_per_invocation(pool_size)
+        self._clip_queue = [
+            (start_ms, end_ms, self._build_clip_args(start_ms, end_ms, output_path, output_format, threads))
+            for start_ms, end_ms, output_path in jobs
+        ]
+        self._clip_total = len(jobs)
+        self._clip_success = 0
+        self._clip_done = 0
+        self._clip_ffmpeg_path = ffmpeg_path
+        self._clip_progress = self._create_progress_dialog("クリップを保存しています...", self._cancel_clip_export)
+        for _ in range(pool_size):
+            self._start_next_clip_process()
+
+    def _create_progress_dialog(self, label: str, cancel_cb) -> QtWidgets.QProgressDialog:
+        dialog = QtWidgets.QProgressDialog(label, "キャンセル", 0, 100, self)
+        dialog.setWindowTitle("処理中")
+        dialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+        dialog.setMinimumDuration(0)
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+        dialog.canceled.connect(cancel_cb)
+        dialog.setValue(0)
+        return dialog
+
+    def _close_progress_dialog(self, dialog: QtWidgets.QProgressDialog | None) -> None:
+        if dialog is None:
+            return
+        dialog.blockSignals(True)
+        dialog.close()
+        dialog.deleteLater()
+
+    def _read_ffmpeg_progress_ms(self, process: QtCore.QProcess) -> int | None:
+        # -progress の出力は out_time_us (旧版は out_time_ms もマイクロ秒) を含む
+        text = bytes(process.readAllStandardError()).decode("utf-8", errors="replace")
+        position_ms = None
+        for line in text.splitlines():
+            key, _, value = line.partition("=")
+            if key not in ("out_time_us", "out_time_ms"):
+                continue
+            try:
+                position_ms = max(0, int(value.strip()) // 1000)
+            except ValueError:
+                continue
+        return position_ms
+
+    def _start_next_clip_process(self) -> None:
+        if not self._clip_queue:
+            return
+        start_ms, end_ms, args = self._clip_queue.pop(0)
+        process = QtCore.QProcess(self)
+        self._clip_processes[process] = [max(1, end_ms - start_ms), 0]
+        process.readyReadStandardError.connect(
+            lambda target=process: self._on_clip_process_progress(target)
+        )
+        process.finished.connect(
+            lambda _code, _status, target=process: self._on_clip_process_finished(target)
+        )
+        process.errorOccurred.connect(
+            lambda error, target=process: self._on_clip_process_error(target, error)
+        )
+        process.start(self._clip_ffmpeg_path, args)
+
+    def _on_clip_process_progress(self, process: QtCore.QProcess) -> None:
+        state = self._clip_processes.get(process)
+        if state is None:
+            return
+        position_ms = self._read_ffmpeg_progress_ms(process)
+        if position_ms is None:
+            return
+        state[1] = min(state[0], position_ms)
+        self._update_clip_progress()
+
+    def _update_clip_progress(self) -> None:
+        if self._clip_progress is None or self._clip_total <= 0:
+            return
+        running = sum(done / total for total, done in self._clip_processes.values())
+        percent = int((self._clip_done + running) * 100 / self._clip_total)
+        self._clip_progress.setValue(max(0, min(100, percent)))
+
+    def _on_clip_process_error(self, process: QtCore.QProcess, error: QtCore.QProcess.ProcessError) -> None:
+        if error == QtCore.QProcess.ProcessError.FailedToStart:
+            self._finish_clip_process(process, False)
+
+    def _on_clip_process_finished(self, process: QtCore.QProcess) -> None:
+        succeeded = (
+            process.exitStatus() == QtCore.QProcess.ExitStatus.NormalExit
+            and process.exitCode() == 0
         )
+        self._finish_clip_process(process, succeeded)
+
+    def _finish_clip_process(self, process: QtCore.QProcess, succeeded: bool) -> None:
+        if self._clip_processes.pop(process, None) is None:
+            return
+        process.deleteLater()
+        self._clip_done += 1
+        if succeeded:
+            self._clip_success += 1
+        self._update_clip_progress()
+        if self._clip_queue:
+            self._start_next_clip_process()
+            return
+        if self._clip_processes:
+            return
+        self._close_progress_dialog(self._clip_progress)
+        self._clip_progress = None
+        message = f"クリップ保存完了: {self._clip_success} / {self._clip_total}"
+        if self._clip_skipped:
+            message += f"\n無効な区間のため {self._clip_skipped} 件をスキップしました。"
+        QtWidgets.QMessageBox.information(self, "情報", message)
+
+    def _cancel_clip_export(self) -> None:
+        self._clip_queue = []
+        self._close_progress_dialog(self._clip_progress)
+        self._clip_progress = None
+        self._stop_clip_processes()
+
+    def _stop_clip_processes(self) -> None:
+        processes = list(self._clip_processes)
+        self._clip_processes.clear()
+        self._clip_queue = []
+        for process in processes:
+            if process.state() != QtCore.QProcess.ProcessState.NotRunning:
+                process.kill()
+                process.waitForFinished(1000)
+            process.deleteLater()
 
     def _build_clip_output_path(self, index: int, output_format: str) -> Path:
         base = self._recording_path.with_suffix("")
         suffix = self._format_to_suffix(output_format)
         candidate = base.with_name(f"{base.name}_clip_{index}").with_suffix(suffix)
-        return ensure_unique_path(candidate)
+        unique = ensure_unique_path(candidate)
+        counter = 1
+        while unique in self._reserved_clip_paths:
+            unique = ensure_unique_path(base.with_name(f"{base.name}_clip_{index}_{counter}").with_suffix(suffix))
+            counter += 1
+        return unique
 
     def _format_to_suffix(self, output_format: str) -> str:
-        mapping = {
-            OUTPUT_FORMAT_TS: ".ts",
-            OUTPUT_FORMAT_MP4_COPY: ".mp4",
-            OUTPUT_FORMAT_MP4_LIGHT: ".mp4",
-            OUTPUT_FORMAT_MOV: ".mov",
-            OUTPUT_FORMAT_FLV: ".flv",
-            OUTPUT_FORMAT_MKV: ".mkv",
-            OUTPUT_FORMAT_MP3: ".mp3",
-            OUTPUT_FORMAT_WAV: ".wav",
-        }
-        return mapping.get(output_format, ".mp4")
+        return _FORMAT_SUFFIX.get(output_format, ".mp4")
 
-    def _run_ffmpeg_clip(
+    def _build_clip_args(
         self,
-        ffmpeg_path: str,
         start_ms: int,
         end_ms: int,
         output_path: Path,
         output_format: str,
-    ) -> bool:
+        threads: int = 0,
+    ) -> list[str]:
         duration_sec = max(0.0, (end_ms - start_ms) / 1000.0)
-        if duration_sec <= 0:
-            return False
         start_sec = max(0.0, start_ms / 1000.0)
-        command = [ffmpeg_path, "-y", "-ss", f"{start_sec:.3f}", "-i", str(self._recording_path), "-t", f"{duration_sec:.3f}"]
-        if output_format == OUTPUT_FORMAT_MP4_LIGHT:
-            command += [
-                "-c:v",
-                "libx264",
-                "-preset",
-                "veryfast",
-                "-crf",
-                "28",
-                "-pix_fmt",
-                "yuv420p",
-                "-c:a",
-                "aac",
-                "-b:a",
-                "128k",
-            ]
-        elif output_format == OUTPUT_FORMAT_MP3:
-            command += ["-vn", "-c:a", "libmp3lame", "-b:a", "192k"]
-        elif output_format == OUTPUT_FORMAT_WAV:
-            command += ["-vn", "-c:a", "pcm_s16le"]
-        else:
-            command += ["-c", "copy"]
-        command.append(str(output_path))
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            check=False,
-        )
-        return result.returncode == 0
+        args = [
+            "-y",
+            "-nostats",
+            "-loglevel",
+            "error",
+            "-progress",
+            "pipe:2",
+            "-ss",
+            f"{start_sec:.3f}",
+            "-i",
+            str(self._recording_path),
+            "-t",
+            f"{duration_sec:.3f}",
+        ]
+        args.extend(_FORMAT_ENCODE_ARGS.get(output_format, _COPY_ENCODE_ARGS))
+        if threads > 0:
+            args += ["-threads", str(int(threads))]
+        args.append(str(output_path))
+        return args
 
     def _maybe_refresh_segments(self, duration_ms: int) -> None:
         if duration_ms <= 0 or duration_ms == self._last_duration_ms:
@@ -974,74 +1511,77 @@ class TimeShiftWindow(QtWidgets.QDialog):
 
     def _build_segment_ranges(self, duration_ms: int) -> list[tuple[int, int]]:
         segment_ms = max(1000, int(self._segment_duration_ms))
-        ranges: list[tuple[int, int]] = []
-        start = 0
-        while start < duration_ms:
-            end = min(duration_ms, start + segment_ms)
-            ranges.append((start, end))
-            start = end
-        return ranges
+        return [
+            (start, min(duration_ms, start + segment_ms))
+            for start in range(0, int(duration_ms), segment_ms)
+        ]
 
     def _recording_start_time(self) -> Optional[dt.datetime]:
-        name = self._recording_path.stem
-        match = QtCore.QRegularExpression(r"(\d{4})年(\d{2})月(\d{2})日-(\d{2})時(\d{2})分(\d{2})秒").match(name)
-        if not match.hasMatch():
+        # 録画パスは変わらないため、ファイル名の解析結果は初回のみ求める
+        if not self._recording_start_resolved:
+            self._recording_start_cache = self._parse_recording_start_time(self._recording_path.stem)
+            self._recording_start_resolved = True
+        return self._recording_start_cache
+
+    def _parse_recording_start_time(self, name: str) -> Optional[dt.datetime]:
+        match = _RECORDING_NAME_TIME_RE.search(name)
+        if match is None:
             return None
         try:
-            return dt.datetime(
-                int(match.captured(1)),
-                int(match.captured(2)),
-                int(match.captured(3)),
-                int(match.captured(4)),
-                int(match.captured(5)),
-                int(match.captured(6)),
-            )
+            return dt.datetime(*map(int, match.groups()))
         except ValueError:
             return None
 
     def _refresh_segment_list(self) -> None:
-        self._segment_list.clear()
-        if not self._segment_ranges:
-            placeholder_end = self._format_time(self._segment_duration_ms)
-            placeholder = QtWidgets.QListWidgetItem(f"00:00～{placeholder_end}")
-            placeholder.setFlags(QtCore.Qt.ItemFlag.NoItemFlags)
-            placeholder.setForeground(QtGui.QColor("#94a3b8"))
-            self._segment_list.addItem(placeholder)
-            return
+        # モデルのリセットでは選択解除が通知されないため、選択中だった場合は再生状態を戻す
+        had_selection = self._segment_list.selectionModel().hasSelection()
         start_time = self._recording_start_time()
-        for index, (start_ms, end_ms) in enumerate(self._segment_ranges, start=1):
-            if start_time:
-                start_clock = start_time + dt.timedelta(milliseconds=start_ms)
-                end_clock = start_time + dt.timedelta(milliseconds=end_ms)
-                label = (
-                    f"{start_clock.hour}時{start_clock.minute}分{start_clock.second}秒～"
-                    f"{end_clock.hour}時{end_clock.minute}分{end_clock.second}秒"
-                )
-            else:
-                label = f"{self._format_time(start_ms)}～{self._format_time(end_ms)}"
-            if self._mp4_converted_all or (start_ms, end_ms) in self._mp4_converted_segments:
-                label = f"{label} (mp4)"
-            item = QtWidgets.QListWidgetItem(label)
-            item.setData(QtCore.Qt.ItemDataRole.UserRole, (start_ms, end_ms))
-            self._segment_list.addItem(item)
+        self._segment_base_seconds = None
+        if start_time:
+            self._segment_base_seconds = start_time.hour * 3600 + start_time.minute * 60 + start_time.second
+        placeholder = f"00:00～{self._format_time(self._segment_duration_ms)}"
+        self._segment_model.reset(self._segment_ranges, placeholder)
+        if had_selection:
+            self._apply_selected_segment()
+
+    def _segment_label(self, start_ms: int, end_ms: int) -> str:
+        # 時刻ラベルは日付をまたいでも時分秒のみ表示するため、秒単位の整数演算で求める
+        base_seconds = self._segment_base_seconds
+        if base_seconds is not None:
+            start_h, start_rem = divmod((base_seconds + start_ms // 1000) % 86400, 3600)
+            end_h, end_rem = divmod((base_seconds + end_ms // 1000) % 86400, 3600)
+            start_m, start_s = divmod(start_rem, 60)
+            end_m, end_s = divmod(end_rem, 60)
+            label = f"{start_h}時{start_m}分{start_s}秒～{end_h}時{end_m}分{end_s}秒"
+        else:
+            label = f"{self._format_time(start_ms)}～{self._format_time(end_ms)}"
+        if self._mp4_converted_all or (start_ms, end_ms) in self._mp4_converted_segments:
+            label = f"{label} (mp4)"
+        return label
+
+    def _selected_segment_range(self) -> tuple[int, int] | None:
+        indexes = self._segment_list.selectionModel().selectedIndexes()
+        if not indexes:
+            return None
+        return indexes[0].data(QtCore.Qt.ItemDataRole.UserRole)
 
     def _apply_selected_segment(self) -> None:
-        selected = self._segment_list.selectedItems()
-        if not selected:
+        selected = self._selected_segment_range()
+        if selected is None:
             self._clip_start_input.setText("")
             self._clip_end_input.setText("")
             self._segment_playback = None
             self._use_temp_mp4 = False
             self._temp_mp4_range = None
             self._stop_proxy_process()
-            self._seek_segment_range(0, self._player.duration())
+            self._seek_segment_range(0, self._duration_ms)
             return
-        start_ms, end_ms = selected[0].data(QtCore.Qt.ItemDataRole.UserRole)
+        start_ms, end_ms = selected
         self._clip_start_input.setText(self._format_time(start_ms))
         self._clip_end_input.setText(self._format_time(end_ms))
         if self._use_temp_mp4 and self._temp_mp4_range == (int(start_ms), int(end_ms)):
             self._segment_playback = None
-            self._position_slider.setRange(0, max(0, int(self._player.duration())))
+            self._position_slider.setRange(0, max(0, self._duration_ms))
             return
         self._use_temp_mp4 = False
         self._temp_mp4_range = None
@@ -1050,7 +1590,7 @@ class TimeShiftWindow(QtWidgets.QDialog):
         self._start_proxy_for_range(int(start_ms), int(end_ms))
 
     def _convert_to_temp_mp4(self) -> None:
-        selected = self._segment_list.selectedItems()
+        selected = self._selected_segment_range()
         ffmpeg_path = find_ffmpeg_path()
         if not ffmpeg_path:
             QtWidgets.QMessageBox.information(self, "情報", "ffmpegが見つかりません。")
@@ -1059,8 +1599,8 @@ class TimeShiftWindow(QtWidgets.QDialog):
             QtWidgets.QMessageBox.information(self, "情報", "録画ファイルが見つかりません。")
             return
         position_offset_ms = 0
-        if selected:
-            start_ms, end_ms = selected[0].data(QtCore.Qt.ItemDataRole.UserRole)
+        if selected is not None:
+            start_ms, end_ms = selected
             duration_sec = max(0.0, (end_ms - start_ms) / 1000.0)
             if duration_sec <= 0:
                 QtWidgets.QMessageBox.information(self, "情報", "変換する区間が不正です。")
@@ -1071,19 +1611,46 @@ class TimeShiftWindow(QtWidgets.QDialog):
             self._temp_mp4_offset_ms = 0
             self._temp_mp4_range = None
         self._temp_mp4_offset_ms = int(position_offset_ms)
-        if not self._reencode_temp_mp4():
+        converted_range = self._temp_mp4_range
+        if not self._reencode_temp_mp4(
+            lambda succeeded: self._on_temp_mp4_converted(succeeded, converted_range),
+            copy=True,
+        ):
+            QtWidgets.QMessageBox.information(self, "情報", "MP4変換に失敗しました。")
+
+    def _on_temp_mp4_converted(self, succeeded: bool, converted_range: tuple[int, int] | None) -> None:
+        if not succeeded:
             QtWidgets.QMessageBox.information(self, "情報", "MP4変換に失敗しました。")
             return
-        if selected:
-            start_ms, end_ms = selected[0].data(QtCore.Qt.ItemDataRole.UserRole)
+        if converted_range is not None:
             self._mp4_converted_all = False
-            self._mp4_converted_segments.add((int(start_ms), int(end_ms)))
+            self._mp4_converted_segments.add(converted_range)
         else:
             self._mp4_converted_all = True
             self._mp4_converted_segments.clear()
         self._refresh_segment_list()
 
-    def _reencode_temp_mp4(self) -> bool:
+    def _timeshift_video_args(self, crf: str, encoder: str | None) -> tuple[str, ...]:
+        if encoder is not None:
+            return (*HW_H264_ENCODER_ARGS[encoder], "-pix_fmt", "yuv420p")
+        return (
+            "-c:v",
+            "libx264",
+            "-preset",
+            "veryfast",
+            "-crf",
+            crf,
+            "-pix_fmt",
+            "yuv420p",
+            *_timeshift_encode_thread_args(),
+        )
+
+    def _timeshift_audio_args(self, bitrate: str) -> tuple[str, ...]:
+        if self._source_audio_state.get("codec") == "aac":
+            return ("-c:a", "copy")  # AACはそのままMP4に格納できる
+        return ("-c:a", "aac", "-b:a", bitrate)
+
+    def _reencode_temp_mp4(self, on_finished=None, copy: bool = False) -> bool:
         ffmpeg_path = find_ffmpeg_path()
         if not ffmpeg_path:
             return False
@@ -1098,77 +1665,187 @@ class TimeShiftWindow(QtWidgets.QDialog):
             start_sec = max(0.0, start_ms / 1000.0)
             position_offset_ms = int(start_ms)
         current_pos = max(0, int(self._player.position()) - position_offset_ms)
+        source_stamp = self._source_fingerprint(self._recording_path)
         temp_dir = Path(tempfile.gettempdir())
         base_name = self._recording_path.with_suffix("").name
         output_path = ensure_unique_path(temp_dir / f"{base_name}_clip_preview_reencode.mp4")
         self._register_temp_path(output_path)
-        command = [ffmpeg_path, "-y"]
-        if start_sec is not None:
-            command += ["-ss", f"{start_sec:.3f}"]
-        command += ["-i", str(self._recording_path)]
-        if duration_sec is not None:
-            command += ["-t", f"{duration_sec:.3f}"]
-        command += [
-            "-c:v",
-            "libx264",
-            "-preset",
-            "veryfast",
-            "-crf",
-            "28",
-            "-pix_fmt",
-            "yuv420p",
-            "-c:a",
-            "aac",
-            "-b:a",
-            "128k",
-            "-movflags",
-            "+faststart",
-            str(output_path),
+        self._stop_reencode_process()
+        total_ms = int(duration_sec * 1000) if duration_sec is not None else self._recording_duration_ms
+        self._reencode_context = {
+            "ffmpeg_path": ffmpeg_path,
+            "start_sec": start_sec,
+            "duration_sec": duration_sec,
+            "copy": copy and not self._copy_remux_failed,
+            "encoder": get_detected_hardware_h264_encoder(),
+            "output_path": output_path,
+            "source_stamp": source_stamp,
+            "position_offset_ms": int(position_offset_ms),
+            "current_pos": current_pos,
+            "total_ms": max(0, int(total_ms)),
+            "on_finished": on_finished,
+        }
+        self._reencode_progress = self._create_progress_dialog("MP4に変換しています...", self._cancel_reencode)
+        self._launch_reencode_process()
+        return True
+
+    def _launch_reencode_process(self) -> None:
+        context = self._reencode_context
+        if context is None:
+            return
+        process = QtCore.QProcess(self)
+        self._reencode_process = process
+        process.readyReadStandardError.connect(self._on_reencode_progress)
+        process.finished.connect(self._on_reencode_finished)
+        process.errorOccurred.connect(self._on_reencode_error)
+        args = [
+            "-y",
+            "-nostats",
+            "-loglevel",
+            "error",
+            "-progress",
+            "pipe:2",
         ]
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            check=False,
+        if context["copy"]:
+            args += ["-fflags", "+genpts"]  # TSのタイムスタンプ欠けをコピー時に補う
+        else:
+            args += ["-filter_threads", TIMESHIFT_FILTER_THREADS]
+        if context["start_sec"] is not None:
+            args += ["-ss", f"{context['start_sec']:.3f}"]
+        args += ["-i", str(self._recording_path)]
+        if context["duration_sec"] is not None:
+            args += ["-t", f"{context['duration_sec']:.3f}"]
+        if context["copy"]:
+            args += _COPY_ENCODE_ARGS
+        else:
+            args += [
+                *self._timeshift_video_args("28", context["encoder"]),
+                *self._timeshift_audio_args("128k"),
+            ]
+        args += ["-movflags", TEMP_MP4_MOVFLAGS, str(context["output_path"])]
+        process.start(context["ffmpeg_path"], args)
+
+    def _on_reencode_progress(self) -> None:
+        process = self._reencode_process
+        context = self._reencode_context
+        if process is None or context is None or self._reencode_progress is None:
+            return
+        position_ms = self._read_ffmpeg_progress_ms(process)
+        total_ms = int(context["total_ms"])
+        if position_ms is None or total_ms <= 0:
+            return
+        self._reencode_progress.setValue(max(0, min(100, position_ms * 100 // total_ms)))
+
+    def _on_reencode_error(self, error: QtCore.QProcess.ProcessError) -> None:
+        if error == QtCore.QProcess.ProcessError.FailedToStart:
+            self._finish_reencode(False)
+
+    def _on_reencode_finished(self) -> None:
+        process = self._reencode_process
+        succeeded = (
+            process is not None
+            and process.exitStatus() == QtCore.QProcess.ExitStatus.NormalExit
+            and process.exitCode() == 0
         )
-        if result.returncode != 0:
-            return False
-        if not output_path.exists() or output_path.stat().st_size == 0:
-            return False
-        self._temp_mp4_path = output_path
-        self._use_temp_mp4 = True
-        self._temp_mp4_offset_ms = int(position_offset_ms)
-        self._temp_mp4_is_copy = False
+        context = self._reencode_context
+        if not succeeded and process is not None and context is not None:
+            if context["copy"]:
+                # コピーで格納できないコーデックは以後も再エンコードに回す
+                self._copy_remux_failed = True
+                context["copy"] = False
+            elif context["encoder"] is not None:
+                # HWエンコーダが使えない環境ではlibx264で同じ範囲を再エンコードする
+                disable_hardware_h264_encoder()
+                context["encoder"] = None
+            else:
+                self._finish_reencode(False)
+                return
+            process.deleteLater()
+            self._launch_reencode_process()
+            return
+        self._finish_reencode(succeeded)
+
+    def _finish_reencode(self, succeeded: bool) -> None:
+        process = self._reencode_process
+        context = self._reencode_context
+        self._reencode_process = None
+        self._reencode_context = None
+        self._close_progress_dialog(self._reencode_progress)
+        self._reencode_progress = None
+        if process is None or context is None:
+            return
+        process.deleteLater()
+        output_path = context["output_path"]
+        if succeeded and (not output_path.exists() or output_path.stat().st_size == 0):
+            succeeded = False
+        if succeeded:
+            current_pos = int(context["current_pos"])
+            self._temp_mp4_path = output_path
+            self._temp_mp4_source_stamp = context["source_stamp"]
+            self._use_temp_mp4 = True
+            self._temp_mp4_offset_ms = int(context["position_offset_ms"])
+            self._temp_mp4_is_copy = bool(context["copy"])
+            self._temp_mp4_retry = False
+            self._segment_playback = None
+            self._playback_path = output_path
+            file_url = QtCore.QUrl.fromLocalFile(str(output_path))
+            self._play_source_from(file_url, current_pos)
+        on_finished = context["on_finished"]
+        if on_finished is not None:
+            on_finished(succeeded)
+
+    def _cancel_reencode(self) -> None:
+        # キャンセルも失敗として後続処理へ伝え、再試行中の状態を残さない
+        context = self._reencode_context
+        self._stop_reencode_process()
         self._temp_mp4_retry = False
-        self._segment_playback = None
-        self._playback_path = output_path
-        file_url = QtCore.QUrl.fromLocalFile(str(output_path))
-        self._player.setSource(file_url)
-        self._player.play()
-        QtCore.QTimer.singleShot(
-            500,
-            lambda: self._player.setPosition(current_pos),
-        )
-        return True
+        on_finished = context["on_finished"] if context is not None else None
+        if on_finished is not None:
+            on_finished(False)
+
+    def _stop_reencode_process(self) -> None:
+        process = self._reencode_process
+        if process is None:
+            return
+        self._reencode_process = None
+        self._reencode_context = None
+        self._close_progress_dialog(self._reencode_progress)
+        self._reencode_progress = None
+        if process.state() != QtCore.QProcess.ProcessState.NotRunning:
+            process.kill()
+            process.waitForFinished(1000)
+        process.deleteLater()
 
     def _seek_segment_range(self, start_ms: int, end_ms: int) -> None:
-        duration = int(self._player.duration())
+        duration = self._duration_ms
         if duration <= 0:
             return
         if start_ms < 0:
             start_ms = 0
         if end_ms <= 0 or end_ms > duration:
             end_ms = duration
+        # 同じソース・同じ区間の再適用ではスライダー更新もデマルチプレクサのシークも行わない
+        seek_key = (self._player.source(), int(start_ms), int(end_ms))
+        if (
+            seek_key == self._last_seek_key
+            and self._position_slider.minimum() == int(start_ms)
+            and self._position_slider.maximum() == int(end_ms)
+        ):
+            return
+        self._last_seek_key = seek_key
         self._position_slider.setRange(int(start_ms), int(end_ms))
-        self._player.setPosition(int(start_ms))
+        if abs(int(self._player.position()) - int(start_ms)) >= SEEK_TOLERANCE_MS:
+            self._player.setPosition(int(start_ms))
         self._update_position(int(start_ms))
+        self._flush_position()
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self._prewarm_stop.set()
         self._player.stop()
         self._player.setSource(QtCore.QUrl())
         self._stop_proxy_process()
+        self._stop_reencode_process()
+        self._cancel_clip_export()
         for path in list(self._temp_files):
             if path.exists():
                 try:
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-from PyQt6 import QtWidgets
+from PyQt6 import QtCore, QtWidgets
 from utils.theme_utils import load_ui_font_files, register_ui_font_files
 from ui.ui_settings_io import SettingsIOMixin
 from ui.ui_settings_pages import SettingsPagesMixin
@@ -10,21 +10,31 @@ from ui.ui_settings_widgets import ColorPickerWidget
 
 
 class SettingsDialog(QtWidgets.QDialog, SettingsStylesMixin, SettingsPagesMixin, SettingsIOMixin):
+    settingsChanged = QtCore.pyqtSignal()  # 設定保存後に1回だけ通知
+
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("設定")
         self.resize(950, 700)
         self._ui_color_inputs: dict[str, dict[str, ColorPickerWidget]] = {"light": {}, "dark": {}}
         self._suppress_ui_color_preview = True
-        self._ui_color_snapshot = self._capture_ui_color_snapshot()
         self._ui_font_files = load_ui_font_files()
         if self._ui_font_files:
             register_ui_font_files(self._ui_font_files)
         self._suppress_ui_font_preview = True
         self._suppress_auto_compress_profile_apply = True
-        self._ui_font_snapshot = self._capture_ui_font_snapshot()
         self._apply_global_style()
         self._init_ui()
+        self.reload_settings()
+
+    def reload_settings(self) -> None:
+        # 再表示時は構築済みのウィジェットを使い回し、取り消し用の控えと保存済みの値だけを取り直す
+        self._suppress_ui_color_preview = True
+        self._suppress_ui_font_preview = True
+        self._suppress_auto_compress_profile_apply = True
+        self._ui_color_snapshot = self._capture_ui_color_snapshot()
+        self._ui_font_snapshot = self._capture_ui_font_snapshot()
+        self._apply_global_style()
         try:
             self._load_settings()
         finally:
@@ -29,7 +29,13 @@ from core.config import (
     DEFAULT_TWITCASTING_ENTRIES,
     DEFAULT_YOUTUBE_RECORDING_BACKEND,
 )
-from utils.settings_store import load_bool_setting, load_setting_value, save_setting_value
+from utils.settings_store import (
+    load_all_settings,
+    load_bool_setting,
+    load_setting_value,
+    save_setting_value,
+    save_settings_bulk,
+)
 from utils.theme_utils import (
     get_default_ui_colors,
     get_ui_color_edit_values,
@@ -43,6 +49,135 @@ from utils.theme_utils import (
 from ui.ui_watermark_dialog import WatermarkDialog
 
 
+def _checked(widget) -> int:
+    return int(widget.isChecked())
+
+
+def _int_value(widget) -> int:
+    return int(widget.value())
+
+
+def _float_value(widget) -> float:
+    return float(widget.value())
+
+
+def _line_text(widget) -> str:
+    return widget.text().strip()
+
+
+def _plain_text(widget) -> str:
+    return widget.toPlainText().strip()
+
+
+def _data_str(widget) -> str:
+    return str(widget.currentData())
+
+
+def _data_int(widget) -> int:
+    return int(widget.currentData())
+
+
+def _current_text(widget) -> str:
+    return str(widget.currentText())
+
+
+# ページごとの保存項目 (設定キー, ウィジェット属性名, 値の取り出し方)
+_GENERAL_SAVE_FIELDS = (
+    ("preview_volume", "preview_volume_input", _float_value),
+    ("ui_colors_enabled", "ui_custom_colors_input", _checked),
+    ("timeshift_segment_hours", "timeshift_segment_hours_input", _int_value),
+    ("timeshift_segment_minutes", "timeshift_segment_minutes_input", _int_value),
+    ("timeshift_segment_seconds", "timeshift_segment_seconds_input", _int_value),
+)
+
+_STORAGE_SAVE_FIELDS = (
+    ("output_dir", "output_dir_input", _line_text),
+    ("output_format", "output_format_input", _data_str),
+    ("output_date_folder_enabled", "output_date_folder_input", _checked),
+    ("output_filename_with_channel", "output_filename_with_channel_input", _checked),
+    ("keep_ts_file", "keep_ts_input", _checked),
+)
+
+_RECORDING_SAVE_FIELDS = (
+    ("recording_quality", "recording_quality_input", _data_str),
+    ("youtube_recording_backend", "youtube_backend_input", _data_str),
+    ("recording_max_size_mb", "recording_max_size_input", _int_value),
+    ("recording_size_margin_mb", "recording_size_margin_input", _int_value),
+    ("auto_compress_enabled", "auto_compress_enabled_input", _checked),
+    ("auto_compress_profile", "auto_compress_profile_input", _data_str),
+    ("auto_compress_codec", "auto_compress_codec_input", _data_str),
+    ("auto_compress_preset", "auto_compress_preset_input", _data_str),
+    ("auto_compress_max_height", "auto_compress_resolution_input", _data_int),
+    ("auto_compress_fps", "auto_compress_fps_input", _int_value),
+    ("auto_compress_video_bitrate_kbps", "auto_compress_video_bitrate_input", _int_value),
+    ("auto_compress_audio_bitrate_kbps", "auto_compress_audio_bitrate_input", _int_value),
+    ("auto_compress_keep_original", "auto_compress_keep_original_input", _checked),
+    ("watermark_enabled", "watermark_enabled_input", _checked),
+    ("transcribe_enabled", "transcribe_enabled_input", _checked),
+    ("transcribe_model", "transcribe_model_input", _current_text),
+)
+
+_NETWORK_SAVE_FIELDS = (
+    ("retry_count", "retry_count_input", _int_value),
+    ("retry_wait", "retry_wait_input", _int_value),
+    ("http_timeout", "http_timeout_input", _int_value),
+    ("stream_timeout", "stream_timeout_input", _int_value),
+)
+
+_AUTOMATION_SAVE_FIELDS = (
+    ("auto_enabled", "auto_enabled_input", _checked),
+    ("auto_startup_recording", "auto_startup_input", _checked),
+    ("auto_notify_only", "auto_notify_only_input", _checked),
+    ("auto_check_interval", "auto_check_interval_input", _int_value),
+)
+
+_MONITORING_SAVE_FIELDS = (
+    ("twitcasting_entries", "twitcasting_input", _plain_text),
+    ("niconico_entries", "niconico_input", _plain_text),
+    ("tiktok_entries", "tiktok_input", _plain_text),
+    ("fuwatch_entries", "fuwatch_input", _plain_text),
+    ("kick_entries", "kick_input", _plain_text),
+    ("live17_entries", "live17_input", _plain_text),
+    ("bigo_entries", "bigo_input", _plain_text),
+    ("radiko_entries", "radiko_input", _plain_text),
+    ("openrectv_entries", "openrectv_input", _plain_text),
+    ("bilibili_entries", "bilibili_input", _plain_text),
+    ("abema_entries", "abema_input", _plain_text),
+    ("auto_notify_only_entries", "auto_notify_only_entries_input", _plain_text),
+    ("youtube_channels", "youtube_channels_input", _plain_text),
+    ("twitch_channels", "twitch_channels_input", _plain_text),
+)
+
+_API_SAVE_FIELDS = (
+    ("youtube_api_key", "youtube_api_key_input", _line_text),
+    ("twitch_client_id", "twitch_client_id_input", _line_text),
+    ("twitch_client_secret", "twitch_client_secret_input", _line_text),
+)
+
+_SYSTEM_SAVE_FIELDS = (
+    ("tray_enabled", "tray_enabled_input", _checked),
+    ("auto_start_enabled", "auto_start_input", _checked),
+    ("log_panel_visible", "log_panel_visible_input", _checked),
+)
+
+_ALL_SAVE_FIELDS = (
+    _GENERAL_SAVE_FIELDS,
+    _STORAGE_SAVE_FIELDS,
+    _RECORDING_SAVE_FIELDS,
+    _NETWORK_SAVE_FIELDS,
+    _AUTOMATION_SAVE_FIELDS,
+    _MONITORING_SAVE_FIELDS,
+    _API_SAVE_FIELDS,
+    _SYSTEM_SAVE_FIELDS,
+)  # 読み込み中にシグナルを止める対象の一覧
+
+
+def _combo_index(combo: QtWidgets.QComboBox, data, fallback=None) -> int:
+    # 構築時の索引から行番号を引く (見つからなければ代替値、それも無ければ先頭)
+    index = combo._data_index
+    return index.get(data, index.get(fallback, 0))
+
+
 class SettingsIOMixin:
     def _capture_ui_color_snapshot(self) -> dict[str, object]:
         return {
@@ -269,11 +404,11 @@ class SettingsIOMixin:
         config = presets.get(profile)
         if not config:
             return
-        preset_index = self.auto_compress_preset_input.findData(config["preset"])
-        if preset_index >= 0:
+        preset_index = self.auto_compress_preset_input._data_index.get(config["preset"])
+        if preset_index is not None:
             self.auto_compress_preset_input.setCurrentIndex(preset_index)
-        height_index = self.auto_compress_resolution_input.findData(config["max_height"])
-        if height_index >= 0:
+        height_index = self.auto_compress_resolution_input._data_index.get(config["max_height"])
+        if height_index is not None:
             self.auto_compress_resolution_input.setCurrentIndex(height_index)
         self.auto_compress_video_bitrate_input.setValue(int(config["video_bitrate"]))
         self.auto_compress_audio_bitrate_input.setValue(int(config["audio_bitrate"]))
@@ -286,20 +421,36 @@ class SettingsIOMixin:
     # --- Loading & Saving Logic ---
 
     def _load_settings(self) -> None:
-        self.output_dir_input.setText(load_setting_value("output_dir", "recordings", str))
-        
-        fmt = load_setting_value("output_format", DEFAULT_OUTPUT_FORMAT, str).lower()
-        idx = self.output_format_input.findData(fmt)
-        if idx < 0: idx = self.output_format_input.findData(DEFAULT_OUTPUT_FORMAT)
-        self.output_format_input.setCurrentIndex(max(0, idx))
-
-        self.output_date_folder_input.setChecked(load_bool_setting("output_date_folder_enabled", False))
-        self.output_filename_with_channel_input.setChecked(load_bool_setting("output_filename_with_channel", False))
-
-        self.retry_count_input.setValue(load_setting_value("retry_count", DEFAULT_RETRY_COUNT, int))
-        self.retry_wait_input.setValue(load_setting_value("retry_wait", DEFAULT_RETRY_WAIT_SEC, int))
-        self.http_timeout_input.setValue(load_setting_value("http_timeout", 20, int))
-        self.stream_timeout_input.setValue(load_setting_value("stream_timeout", 60, int))
+        # 全キーを一度に読み込んでキャッシュへ載せ、以降の個別読み込みをQSettingsに戻さない
+        load_all_settings()
+        # 構築済みのページだけを読み込む (未構築ページは初回表示時に読み込む)
+        self._run_settings_loaders([self._page_builders[row][1] for row in sorted(self._built_pages)])
+        self._settings_loaded = True
+
+    def _run_settings_loaders(self, loaders) -> None:
+        # 値の反映中は再描画と入力欄のシグナルを止め、状態の更新は各ローダーの明示呼び出しに任せる
+        blockers = [QtCore.QSignalBlocker(widget) for widget in self._iter_setting_widgets()]
+        self.setUpdatesEnabled(False)
+        try:
+            for loader in loaders:
+                loader()
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _iter_setting_widgets(self):
+        # 構築済みページの入力欄とUI配色の選択欄 (フォント選択はライブ反映のため対象外)
+        for fields in _ALL_SAVE_FIELDS:
+            for _key, attr, _extract in fields:
+                widget = getattr(self, attr, None)
+                if widget is not None:
+                    yield widget
+        for pickers in self._ui_color_inputs.values():
+            yield from pickers.values()
+
+    def _load_general_settings(self) -> None:
         self.preview_volume_input.setValue(load_setting_value("preview_volume", 0.5, float))
         self.ui_custom_colors_input.setChecked(load_bool_setting("ui_colors_enabled", False))
         for mode in ("light", "dark"):
@@ -315,30 +466,50 @@ class SettingsIOMixin:
                 self.ui_font_combo.addItem(font_family, font_family)
                 idx = self.ui_font_combo.findData(font_family)
             self.ui_font_combo.setCurrentIndex(max(0, idx))
+        self.timeshift_segment_hours_input.setValue(
+            load_setting_value("timeshift_segment_hours", DEFAULT_TIMESHIFT_SEGMENT_HOURS, int)
+        )
+        self.timeshift_segment_minutes_input.setValue(
+            load_setting_value("timeshift_segment_minutes", DEFAULT_TIMESHIFT_SEGMENT_MINUTES, int)
+        )
+        self.timeshift_segment_seconds_input.setValue(
+            load_setting_value("timeshift_segment_seconds", DEFAULT_TIMESHIFT_SEGMENT_SECONDS, int)
+        )
+
+    def _load_storage_settings(self) -> None:
+        self.output_dir_input.setText(load_setting_value("output_dir", "recordings", str))
+        
+        fmt = load_setting_value("output_format", DEFAULT_OUTPUT_FORMAT, str).lower()
+        self.output_format_input.setCurrentIndex(_combo_index(self.output_format_input, fmt, DEFAULT_OUTPUT_FORMAT))
+
+        self.output_date_folder_input.setChecked(load_bool_setting("output_date_folder_enabled", False))
+        self.output_filename_with_channel_input.setChecked(load_bool_setting("output_filename_with_channel", False))
         self.keep_ts_input.setChecked(load_bool_setting("keep_ts_file", False))
+
+    def _load_recording_settings(self) -> None:
+        quality = load_setting_value("recording_quality", DEFAULT_RECORDING_QUALITY, str)
+        self.recording_quality_input.setCurrentIndex(
+            _combo_index(self.recording_quality_input, quality, DEFAULT_RECORDING_QUALITY)
+        )
+        youtube_backend = load_setting_value(
+            "youtube_recording_backend",
+            DEFAULT_YOUTUBE_RECORDING_BACKEND,
+            str,
+        ).lower()
+        self.youtube_backend_input.setCurrentIndex(
+            _combo_index(self.youtube_backend_input, youtube_backend, DEFAULT_YOUTUBE_RECORDING_BACKEND)
+        )
         self.recording_max_size_input.setValue(load_setting_value("recording_max_size_mb", DEFAULT_RECORDING_MAX_SIZE_MB, int))
         self.recording_size_margin_input.setValue(load_setting_value("recording_size_margin_mb", DEFAULT_RECORDING_SIZE_MARGIN_MB, int))
         self.auto_compress_enabled_input.setChecked(load_bool_setting("auto_compress_enabled", False))
         profile = load_setting_value("auto_compress_profile", "custom", str).lower()
-        profile_index = self.auto_compress_profile_input.findData(profile)
-        if profile_index < 0:
-            profile_index = self.auto_compress_profile_input.findData("custom")
-        self.auto_compress_profile_input.setCurrentIndex(max(0, profile_index))
+        self.auto_compress_profile_input.setCurrentIndex(_combo_index(self.auto_compress_profile_input, profile, "custom"))
         codec = load_setting_value("auto_compress_codec", "libx265", str).lower()
-        codec_index = self.auto_compress_codec_input.findData(codec)
-        if codec_index < 0:
-            codec_index = 0
-        self.auto_compress_codec_input.setCurrentIndex(codec_index)
+        self.auto_compress_codec_input.setCurrentIndex(_combo_index(self.auto_compress_codec_input, codec))
         preset = load_setting_value("auto_compress_preset", "medium", str).lower()
-        preset_index = self.auto_compress_preset_input.findData(preset)
-        if preset_index < 0:
-            preset_index = 1
-        self.auto_compress_preset_input.setCurrentIndex(preset_index)
+        self.auto_compress_preset_input.setCurrentIndex(_combo_index(self.auto_compress_preset_input, preset, "medium"))
         max_height = load_setting_value("auto_compress_max_height", DEFAULT_AUTO_COMPRESS_MAX_HEIGHT, int)
-        height_index = self.auto_compress_resolution_input.findData(max_height)
-        if height_index < 0:
-            height_index = 0
-        self.auto_compress_resolution_input.setCurrentIndex(height_index)
+        self.auto_compress_resolution_input.setCurrentIndex(_combo_index(self.auto_compress_resolution_input, max_height))
         self.auto_compress_fps_input.setValue(load_setting_value("auto_compress_fps", DEFAULT_AUTO_COMPRESS_FPS, int))
         self.auto_compress_video_bitrate_input.setValue(load_setting_value("auto_compress_video_bitrate_kbps", 2500, int))
         self.auto_compress_audio_bitrate_input.setValue(load_setting_value("auto_compress_audio_bitrate_kbps", 128, int))
@@ -350,27 +521,23 @@ class SettingsIOMixin:
         if model_index < 0:
             model_index = self.transcribe_model_input.findText("small", QtCore.Qt.MatchFlag.MatchFixedString)
         self.transcribe_model_input.setCurrentIndex(max(0, model_index))
-        self.timeshift_segment_hours_input.setValue(
-            load_setting_value("timeshift_segment_hours", DEFAULT_TIMESHIFT_SEGMENT_HOURS, int)
-        )
-        self.timeshift_segment_minutes_input.setValue(
-            load_setting_value("timeshift_segment_minutes", DEFAULT_TIMESHIFT_SEGMENT_MINUTES, int)
-        )
-        self.timeshift_segment_seconds_input.setValue(
-            load_setting_value("timeshift_segment_seconds", DEFAULT_TIMESHIFT_SEGMENT_SECONDS, int)
-        )
-        
-        self.tray_enabled_input.setChecked(load_bool_setting("tray_enabled", False))
-        self.auto_start_input.setChecked(load_bool_setting("auto_start_enabled", False))
-        
+        self._update_auto_compress_option_state(bool(self.auto_compress_enabled_input.isChecked()))
+        self._update_transcribe_option_state(bool(self.transcribe_enabled_input.isChecked()))
+
+    def _load_network_settings(self) -> None:
+        self.retry_count_input.setValue(load_setting_value("retry_count", DEFAULT_RETRY_COUNT, int))
+        self.retry_wait_input.setValue(load_setting_value("retry_wait", DEFAULT_RETRY_WAIT_SEC, int))
+        self.http_timeout_input.setValue(load_setting_value("http_timeout", 20, int))
+        self.stream_timeout_input.setValue(load_setting_value("stream_timeout", 60, int))
+
+    def _load_automation_settings(self) -> None:
         self.auto_enabled_input.setChecked(load_bool_setting("auto_enabled", DEFAULT_AUTO_ENABLED))
         self.auto_startup_input.setChecked(load_bool_setting("auto_startup_recording", True))
         self.auto_notify_only_input.setChecked(load_bool_setting("auto_notify_only", False))
         self.auto_check_interval_input.setValue(load_setting_value("auto_check_interval", DEFAULT_AUTO_CHECK_INTERVAL_SEC, int))
         self._update_auto_record_option_state(bool(self.auto_enabled_input.isChecked()))
 
-        self.log_panel_visible_input.setChecked(load_bool_setting("log_panel_visible", False))
-
+    def _load_monitoring_settings(self) -> None:
         self.twitcasting_input.setPlainText(load_setting_value("twitcasting_entries", DEFAULT_TWITCASTING_ENTRIES, str))
         self.niconico_input.setPlainText(load_setting_value("niconico_entries", DEFAULT_NICONICO_ENTRIES, str))
         self.tiktok_input.setPlainText(load_setting_value("tiktok_entries", DEFAULT_TIKTOK_ENTRIES, str))
@@ -383,122 +550,73 @@ class SettingsIOMixin:
         self.bilibili_input.setPlainText(load_setting_value("bilibili_entries", DEFAULT_BILIBILI_ENTRIES, str))
         self.abema_input.setPlainText(load_setting_value("abema_entries", DEFAULT_ABEMA_ENTRIES, str))
         self.auto_notify_only_entries_input.setPlainText(load_setting_value("auto_notify_only_entries", "", str))
-        
-        self.youtube_api_key_input.setText(load_setting_value("youtube_api_key", "", str))
         self.youtube_channels_input.setPlainText(load_setting_value("youtube_channels", "", str))
-        
+        self.twitch_channels_input.setPlainText(load_setting_value("twitch_channels", "", str))
+
+    def _load_api_settings(self) -> None:
+        self.youtube_api_key_input.setText(load_setting_value("youtube_api_key", "", str))
         self.twitch_client_id_input.setText(load_setting_value("twitch_client_id", "", str))
         self.twitch_client_secret_input.setText(load_setting_value("twitch_client_secret", "", str))
-        self.twitch_channels_input.setPlainText(load_setting_value("twitch_channels", "", str))
-        quality = load_setting_value("recording_quality", DEFAULT_RECORDING_QUALITY, str)
-        quality_index = self.recording_quality_input.findData(quality)
-        if quality_index < 0:
-            quality_index = self.recording_quality_input.findData(DEFAULT_RECORDING_QUALITY)
-        self.recording_quality_input.setCurrentIndex(max(0, quality_index))
-        youtube_backend = load_setting_value(
-            "youtube_recording_backend",
-            DEFAULT_YOUTUBE_RECORDING_BACKEND,
-            str,
-        ).lower()
-        backend_index = self.youtube_backend_input.findData(youtube_backend)
-        if backend_index < 0:
-            backend_index = self.youtube_backend_input.findData(DEFAULT_YOUTUBE_RECORDING_BACKEND)
-        self.youtube_backend_input.setCurrentIndex(max(0, backend_index))
-        self._update_auto_compress_option_state(bool(self.auto_compress_enabled_input.isChecked()))
-        self._update_transcribe_option_state(bool(self.transcribe_enabled_input.isChecked()))
+
+    def _load_system_settings(self) -> None:
+        self.tray_enabled_input.setChecked(load_bool_setting("tray_enabled", False))
+        self.auto_start_input.setChecked(load_bool_setting("auto_start_enabled", False))
+        self.log_panel_visible_input.setChecked(load_bool_setting("log_panel_visible", False))
 
     def _save_settings(self) -> None:
-        save_setting_value("output_dir", self.output_dir_input.text().strip())
-        save_setting_value("output_format", str(self.output_format_input.currentData()))
-        save_setting_value("output_date_folder_enabled", int(self.output_date_folder_input.isChecked()))
-        save_setting_value("output_filename_with_channel", int(self.output_filename_with_channel_input.isChecked()))
-        save_setting_value("retry_count", int(self.retry_count_input.value()))
-        save_setting_value("retry_wait", int(self.retry_wait_input.value()))
-        save_setting_value("http_timeout", int(self.http_timeout_input.value()))
-        save_setting_value("stream_timeout", int(self.stream_timeout_input.value()))
-        save_setting_value("preview_volume", float(self.preview_volume_input.value()))
-        save_setting_value("ui_colors_enabled", int(self.ui_custom_colors_input.isChecked()))
-        for mode in ("light", "dark"):
-            colors: dict[str, str] = {}
-            for key, picker in self._ui_color_inputs[mode].items():
-                color = picker.color()
-                if color:
-                    colors[key] = color
-            save_setting_value(f"ui_colors_{mode}", serialize_ui_colors(colors))
-        if hasattr(self, "ui_font_combo"):
-            save_setting_value("ui_font_family", str(self.ui_font_combo.currentData() or ""))
+        # 未構築のページは保存済みの値から変わっていないため書き込まない
+        pending: list[tuple[str, object]] = []
+        for row in sorted(self._built_pages):
+            self._page_builders[row][2](pending)
+        # 全ページ分をまとめて書き込み、同期は1回で済ませる
+        save_settings_bulk(pending)
         save_ui_font_files(self._ui_font_files)
         self._apply_ui_font_to_app()
         self._ui_color_snapshot = self._capture_ui_color_snapshot()
         self._ui_font_snapshot = self._capture_ui_font_snapshot()
-        save_setting_value("keep_ts_file", int(self.keep_ts_input.isChecked()))
-        save_setting_value("recording_max_size_mb", int(self.recording_max_size_input.value()))
-        save_setting_value("recording_size_margin_mb", int(self.recording_size_margin_input.value()))
-        save_setting_value("auto_compress_enabled", int(self.auto_compress_enabled_input.isChecked()))
-        save_setting_value("auto_compress_profile", str(self.auto_compress_profile_input.currentData()))
-        save_setting_value("auto_compress_codec", str(self.auto_compress_codec_input.currentData()))
-        save_setting_value("auto_compress_preset", str(self.auto_compress_preset_input.currentData()))
-        save_setting_value("auto_compress_max_height", int(self.auto_compress_resolution_input.currentData()))
-        save_setting_value("auto_compress_fps", int(self.auto_compress_fps_input.value()))
-        save_setting_value("auto_compress_video_bitrate_kbps", int(self.auto_compress_video_bitrate_input.value()))
-        save_setting_value("auto_compress_audio_bitrate_kbps", int(self.auto_compress_audio_bitrate_input.value()))
-        save_setting_value("auto_compress_keep_original", int(self.auto_compress_keep_original_input.isChecked()))
-        save_setting_value("watermark_enabled", int(self.watermark_enabled_input.isChecked()))
-        save_setting_value("transcribe_enabled", int(self.transcribe_enabled_input.isChecked()))
-        save_setting_value("transcribe_model", str(self.transcribe_model_input.currentText()))
-        save_setting_value("timeshift_segment_hours", int(self.timeshift_segment_hours_input.value()))
-        save_setting_value("timeshift_segment_minutes", int(self.timeshift_segment_minutes_input.value()))
-        save_setting_value("timeshift_segment_seconds", int(self.timeshift_segment_seconds_input.value()))
-        
-        save_setting_value("tray_enabled", int(self.tray_enabled_input.isChecked()))
-        save_setting_value("auto_start_enabled", int(self.auto_start_input.isChecked()))
-        
-        save_setting_value("auto_enabled", int(self.auto_enabled_input.isChecked()))
-        save_setting_value("auto_startup_recording", int(self.auto_startup_input.isChecked()))
-        save_setting_value("auto_notify_only", int(self.auto_notify_only_input.isChecked()))
-        save_setting_value("auto_check_interval", int(self.auto_check_interval_input.value()))
-        
-        save_setting_value("log_panel_visible", int(self.log_panel_visible_input.isChecked()))
-        
-        save_setting_value("twitcasting_entries", self.twitcasting_input.toPlainText().strip())
-        save_setting_value("niconico_entries", self.niconico_input.toPlainText().strip())
-        save_setting_value("tiktok_entries", self.tiktok_input.toPlainText().strip())
-        save_setting_value("fuwatch_entries", self.fuwatch_input.toPlainText().strip())
-        save_setting_value("kick_entries", self.kick_input.toPlainText().strip())
-        save_setting_value("live17_entries", self.live17_input.toPlainText().strip())
-        save_setting_value("bigo_entries", self.bigo_input.toPlainText().strip())
-        save_setting_value("radiko_entries", self.radiko_input.toPlainText().strip())
-        save_setting_value("openrectv_entries", self.openrectv_input.toPlainText().strip())
-        save_setting_value("bilibili_entries", self.bilibili_input.toPlainText().strip())
-        save_setting_value("abema_entries", self.abema_input.toPlainText().strip())
-        save_setting_value("auto_notify_only_entries", self.auto_notify_only_entries_input.toPlainText().strip())
-        
-        save_setting_value("youtube_api_key", self.youtube_api_key_input.text().strip())
-        save_setting_value("youtube_channels", self.youtube_channels_input.toPlainText().strip())
-        
-        save_setting_value("twitch_client_id", self.twitch_client_id_input.text().strip())
-        save_setting_value("twitch_client_secret", self.twitch_client_secret_input.text().strip())
-        save_setting_value("twitch_channels", self.twitch_channels_input.toPlainText().strip())
-        save_setting_value("recording_quality", str(self.recording_quality_input.currentData()))
-        save_setting_value("youtube_recording_backend", str(self.youtube_backend_input.currentData()))
-        parent = self.parent()
-        if parent is not None:
-            if hasattr(parent, "_load_settings_to_ui"):
-                parent._load_settings_to_ui()
-            if hasattr(parent, "_configure_auto_monitor"):
-                parent._configure_auto_monitor()
-            if hasattr(parent, "_apply_tray_setting"):
-                parent._apply_tray_setting(True)
-            if hasattr(parent, "_apply_startup_setting"):
-                parent._apply_startup_setting(True)
-            if hasattr(parent, "_apply_log_panel_visibility"):
-                parent._apply_log_panel_visibility()
-            if hasattr(parent, "_apply_ui_theme"):
-                parent._apply_ui_theme()
+        # 反映処理は受け手側でまとめて行う
+        self.settingsChanged.emit()
         self._apply_global_style()
         self.update()
         QtWidgets.QMessageBox.information(self, "情報", "設定を保存しました。")
 
+    def _collect_save_fields(self, pending: list[tuple[str, object]], fields) -> None:
+        for key, attr, extract in fields:
+            pending.append((key, extract(getattr(self, attr))))
+
+    def _save_general_settings(self, pending: list[tuple[str, object]]) -> None:
+        self._collect_save_fields(pending, _GENERAL_SAVE_FIELDS)
+        for mode in ("light", "dark"):
+            colors: dict[str, str] = {}
+            for key, picker in self._ui_color_inputs[mode].items():
+                color = picker.color()
+                if color:
+                    colors[key] = color
+            pending.append((f"ui_colors_{mode}", serialize_ui_colors(colors)))
+        if hasattr(self, "ui_font_combo"):
+            pending.append(("ui_font_family", str(self.ui_font_combo.currentData() or "")))
+
+    def _save_storage_settings(self, pending: list[tuple[str, object]]) -> None:
+        self._collect_save_fields(pending, _STORAGE_SAVE_FIELDS)
+
+    def _save_recording_settings(self, pending: list[tuple[str, object]]) -> None:
+        self._collect_save_fields(pending, _RECORDING_SAVE_FIELDS)
+
+    def _save_network_settings(self, pending: list[tuple[str, object]]) -> None:
+        self._collect_save_fields(pending, _NETWORK_SAVE_FIELDS)
+
+    def _save_automation_settings(self, pending: list[tuple[str, object]]) -> None:
+        self._collect_save_fields(pending, _AUTOMATION_SAVE_FIELDS)
+
+    def _save_monitoring_settings(self, pending: list[tuple[str, object]]) -> None:
+        self._collect_save_fields(pending, _MONITORING_SAVE_FIELDS)
+
+    def _save_api_settings(self, pending: list[tuple[str, object]]) -> None:
+        self._collect_save_fields(pending, _API_SAVE_FIELDS)
+
+    def _save_system_settings(self, pending: list[tuple[str, object]]) -> None:
+        self._collect_save_fields(pending, _SYSTEM_SAVE_FIELDS)
+
     def _browse_output_dir(self) -> None:
         directory = QtWidgets.QFileDialog.getExistingDirectory(self, "出力フォルダを選択")
         if directory:
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+from functools import partial
+
 from PyQt6 import QtCore, QtGui, QtWidgets
 from core.config import (
     OUTPUT_FORMAT_FLV,
@@ -11,7 +13,130 @@ from core.config import (
     OUTPUT_FORMAT_TS,
     OUTPUT_FORMAT_WAV,
 )
-from ui.ui_settings_widgets import ColorPickerWidget, ModernSpinBox, ToggleSwitch
+from ui.ui_settings_widgets import ColorPickerWidget, ModernSpinBox, ToggleSwitch, get_pointer_cursor
+
+# サイドバーの (表示名, ページキー)。キーから _page_<key> / _load_<key>_settings / _save_<key>_settings を引く
+_SETTINGS_PAGES = (
+    ("一般", "general"),
+    ("保存・整理", "storage"),
+    ("録画", "recording"),
+    ("ネットワーク", "network"),
+    ("自動化・監視", "automation"),
+    ("監視リスト", "monitoring"),
+    ("API", "api"),
+    ("ログ・システム", "system"),
+)
+
+# コンボボックスの (表示名, 保存値) 定義
+_OUTPUT_FORMAT_ITEMS = (
+    ("TS", OUTPUT_FORMAT_TS),
+    ("MP4", OUTPUT_FORMAT_MP4_COPY),
+    ("MOV", OUTPUT_FORMAT_MOV),
+    ("FLV", OUTPUT_FORMAT_FLV),
+    ("MKV", OUTPUT_FORMAT_MKV),
+    ("MP3", OUTPUT_FORMAT_MP3),
+    ("WAV", OUTPUT_FORMAT_WAV),
+)
+
+_RECORDING_QUALITY_ITEMS = (
+    ("最高 (best)", "best"),
+    ("1080p", "1080p"),
+    ("720p", "720p"),
+    ("480p", "480p"),
+    ("360p", "360p"),
+    ("最低 (worst)", "worst"),
+    ("音声のみ (audio_only)", "audio_only"),
+)
+
+_YOUTUBE_BACKEND_ITEMS = (
+    ("Streamlink", "streamlink"),
+    ("yt-dlp", "ytdlp"),
+)
+
+_AUTO_COMPRESS_PROFILE_ITEMS = (
+    ("長時間用", "long"),
+    ("中時間用", "medium"),
+    ("短時間用", "short"),
+    ("カスタム", "custom"),
+)
+
+_AUTO_COMPRESS_CODEC_ITEMS = (
+    ("H.264 (libx264)", "libx264"),
+    ("H.265 (libx265)", "libx265"),
+)
+
+_AUTO_COMPRESS_PRESET_ITEMS = (
+    ("速い (fast)", "fast"),
+    ("標準 (medium)", "medium"),
+    ("高圧縮 (slow)", "slow"),
+)
+
+_AUTO_COMPRESS_RESOLUTION_ITEMS = (
+    ("元の解像度を維持", 0),
+    ("144p", 144),
+    ("240p", 240),
+    ("360p", 360),
+    ("480p", 480),
+    ("720p", 720),
+    ("1080p", 1080),
+)
+
+
+# スピンボックスカードの定義 (属性名, 種類, 最小値, 最大値, ラベル, 説明)
+_RECORDING_SIZE_SPINS = (
+    ("recording_max_size_input", 'int', 0, 1024 * 1024, "録画ファイルの最大サイズ (MB)", "0にすると無制限になります。"),
+    ("recording_size_margin_input", 'int', 0, 1024 * 1024, "録画サイズ切替の余裕 (MB)", "上限に達する前に切り替える余裕幅です。"),
+)
+
+_AUTO_COMPRESS_SPINS = (
+    ("auto_compress_fps_input", 'int', 0, 240, "圧縮のFPS (0は元のまま)", "フレームレートを固定して容量を抑えます。"),
+    ("auto_compress_video_bitrate_input", 'int', 100, 50000, "圧縮の映像ビットレート (kbps)", "数値が小さいほど容量が減ります。"),
+    ("auto_compress_audio_bitrate_input", 'int', 32, 320, "圧縮の音声ビットレート (kbps)", "音声の圧縮率を指定します。"),
+)
+
+_RETRY_SPINS = (
+    ("retry_count_input", 'int', 0, 99, "再接続リトライ回数", "切断時に再接続を試みる最大回数"),
+    ("retry_wait_input", 'int', 1, 3600, "リトライ待機時間 (秒)", "再接続までの待機時間"),
+)
+
+_TIMEOUT_SPINS = (
+    ("http_timeout_input", 'int', 1, 300, "HTTPタイムアウト (秒)", "通信応答がない場合のタイムアウト時間"),
+    ("stream_timeout_input", 'int', 1, 600, "ストリーム待機 (秒)", "映像データが途切れた際の待機時間"),
+)
+
+_AUTO_CHECK_SPINS = (
+    ("auto_check_interval_input", 'int', 20, 3600, "監視サイクル (秒)", "配信状態をチェックする間隔"),
+)
+
+
+# トグルスイッチカードの定義 (属性名, ラベル, 説明)
+_STORAGE_TOGGLES = (
+    ("output_date_folder_input", "日付フォルダで整理", "録画日ごとにフォルダ分けします。"),
+    ("output_filename_with_channel_input", "ファイル名に配信者名を付ける", "録画ファイル名に配信者名を付加します。"),
+    ("keep_ts_input", "TSファイルを残す", "MP4保存時でも元のTSファイルを残します。"),
+)
+
+_AUTO_RECORD_TOGGLES = (
+    ("auto_enabled_input", "自動録画機能", "監視リストの配信が開始されたら自動で録画します。"),
+    ("auto_startup_input", "アプリ起動時に監視開始", "アプリを起動した直後から監視をスタートします。"),
+    ("auto_notify_only_input", "通知のみで監視", "配信を検知しても録画せず、通知だけを行います。"),
+)
+
+_SYSTEM_TOGGLES = (
+    ("tray_enabled_input", "タスクトレイ常駐", "ウィンドウを閉じてもバックグラウンドで動作します。"),
+    ("auto_start_input", "PC起動時に自動実行", "PC起動時にソフトを自動で立ち上げます。"),
+)
+
+_LOG_TOGGLES = (
+    ("log_panel_visible_input", "ログパネル表示", "右側のログパネルを表示します。"),
+)
+
+
+def _fill_combo(combo: QtWidgets.QComboBox, items) -> None:
+    # (表示名, データ) の組をまとめて追加し、設定読み込み用にデータ→行番号の索引を持たせる
+    for text, data in items:
+        combo.addItem(text, data)
+    combo._data_index = {data: index for index, (_text, data) in enumerate(items)}
 
 
 class SettingsPagesMixin:
@@ -24,17 +149,11 @@ class SettingsPagesMixin:
         # 1. 左サイドバー
         self.sidebar = QtWidgets.QListWidget()
         self.sidebar.setFixedWidth(240)
-        self.sidebar.addItems([
-            "一般",
-            "保存・整理",
-            "録画",
-            "ネットワーク",
-            "自動化・監視",
-            "監視リスト",
-            "API",
-            "ログ・システム",
-        ])
+        # 項目追加ごとの再レイアウトを避けるため、まとめて追加してから描画を再開する
+        self.sidebar.setUpdatesEnabled(False)
+        self.sidebar.addItems([label for label, _key in _SETTINGS_PAGES])
         self.sidebar.setCurrentRow(0)
+        self.sidebar.setUpdatesEnabled(True)
         main_layout.addWidget(self.sidebar)
 
         # 2. 右コンテンツエリア
@@ -55,18 +174,15 @@ class SettingsPagesMixin:
         footer_layout.setSpacing(12)
         
         self.btn_cancel = QtWidgets.QPushButton("閉じる")
-        self.btn_cancel.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+        self.btn_cancel.setCursor(get_pointer_cursor())
         self.btn_cancel.setFixedSize(100, 40)
         self.btn_cancel.clicked.connect(self.reject)
         
         self.btn_save = QtWidgets.QPushButton("設定を保存")  # 保存ボタンを生成
         self.btn_save.setObjectName("PrimaryButton")  # 保存ボタン用のスタイルIDを設定
-        self.btn_save.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)  # カーソルを指アイコンにする
+        self.btn_save.setCursor(get_pointer_cursor())  # カーソルを指アイコンにする
         self.btn_save.setFixedSize(140, 40)  # ボタンサイズを固定する
         self.btn_save.clicked.connect(self._save_settings)  # 保存処理に接続する
-        self.btn_save.style().unpolish(self.btn_save)  # オブジェクト名変更後の再スタイル適用
-        self.btn_save.style().polish(self.btn_save)  # スタイルを再評価して描画する
-        self.btn_save.update()  # 見た目を即時更新する
 
         footer_layout.addStretch(1)
         footer_layout.addWidget(self.btn_cancel)
@@ -76,25 +192,54 @@ class SettingsPagesMixin:
         main_layout.addWidget(right_container)
 
         self._create_pages()
-        self.sidebar.currentRowChanged.connect(self.stack.setCurrentIndex)
+        self.sidebar.currentRowChanged.connect(self._on_sidebar_row_changed)
 
     def _create_pages(self):
-        self.stack.addWidget(self._page_general())
-        self.stack.addWidget(self._page_storage())
-        self.stack.addWidget(self._page_recording())
-        self.stack.addWidget(self._page_network())
-        self.stack.addWidget(self._page_automation())
-        self.stack.addWidget(self._page_monitoring())
-        self.stack.addWidget(self._page_api())
-        self.stack.addWidget(self._page_system())
-
-    def _make_scrollable_page(self, title):
-        page = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(page)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        scroll = QtWidgets.QScrollArea()
-        scroll.setWidgetResizable(True)
+        # (ページ構築, 設定読み込み, 設定保存) をサイドバーの並び順で登録
+        self._page_builders = tuple(
+            (
+                getattr(self, f"_page_{key}"),
+                getattr(self, f"_load_{key}_settings"),
+                getattr(self, f"_save_{key}_settings"),
+            )
+            for _label, key in _SETTINGS_PAGES
+        )
+        self._built_pages: set[int] = set()
+        self._settings_loaded = False
+        # 先頭ページ以外は空のウィジェットを置き、初めて選択されたときに構築する
+        for _ in self._page_builders:
+            self.stack.addWidget(QtWidgets.QWidget())
+        self._ensure_page_built(0)
+
+    def _ensure_page_built(self, row: int) -> None:
+        if row in self._built_pages or not 0 <= row < len(self._page_builders):
+            return
+        builder, loader, _saver = self._page_builders[row]
+        placeholder = self.stack.widget(row)
+        page = builder()
+        # 差し替えと値の反映が終わるまで再描画を止め、最後に1回だけ描画する
+        page.setUpdatesEnabled(False)
+        try:
+            self.stack.insertWidget(row, page)
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self._built_pages.add(row)
+            if self._settings_loaded:
+                # 初期読み込み後に構築したページは、その場で保存済みの値を反映する
+                suppress = self._suppress_auto_compress_profile_apply
+                self._suppress_auto_compress_profile_apply = True
+                try:
+                    self._run_settings_loaders([loader])
+                finally:
+                    self._suppress_auto_compress_profile_apply = suppress
+        finally:
+            page.setUpdatesEnabled(True)
+
+    def _on_sidebar_row_changed(self, row: int) -> None:
+        self._ensure_page_built(row)
+        self.stack.setCurrentIndex(row)
+
+    def _make_scrollable_page(self, title, scrollable=True):
         content = QtWidgets.QWidget()
         content.setObjectName("PageContent")
         c_layout = QtWidgets.QVBoxLayout(content)
@@ -105,53 +250,74 @@ class SettingsPagesMixin:
         lbl_title.setObjectName("PageTitle")
         lbl_title.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         c_layout.addWidget(lbl_title)
+
+        # 項目の少ないページはスクロール領域を挟まずそのままページにする
+        if not scrollable:
+            return content, c_layout
+
+        page = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
         
+        scroll = QtWidgets.QScrollArea()
+        scroll.setWidgetResizable(True)
         scroll.setWidget(content)
         layout.addWidget(scroll)
         
         return page, c_layout
 
-    def _add_card(self, layout, label_text, widget, description=None):
+    def _make_card(self, label_text, widget, description=None, stacked=False):
+        # カード共通の枠とラベルを生成する (stacked=True は入力欄を下段に置く縦型)
         container = QtWidgets.QFrame()
         container.setObjectName("Card")
-        row = QtWidgets.QHBoxLayout(container)
-        row.setContentsMargins(20, 16, 20, 16)
-        row.setSpacing(16)
-        
-        lbl_layout = QtWidgets.QVBoxLayout()
-        lbl_layout.setSpacing(4)
+        if stacked:
+            box = QtWidgets.QVBoxLayout(container)
+            box.setSpacing(10)
+            text_layout = box
+        else:
+            box = QtWidgets.QHBoxLayout(container)
+            box.setSpacing(16)
+            text_layout = QtWidgets.QVBoxLayout()
+            text_layout.setSpacing(4)
+        box.setContentsMargins(20, 16, 20, 16)
+
         lbl = QtWidgets.QLabel(label_text)
-        lbl.setStyleSheet(f"font-weight: bold; font-size: 14px; color: {self._label_color};")
-        lbl_layout.addWidget(lbl)
-        
+        lbl.setObjectName("CardLabel")
+        text_layout.addWidget(lbl)
+
         if description:
             desc = QtWidgets.QLabel(description)
             desc.setObjectName("Description")
-            desc.setWordWrap(True)
-            lbl_layout.addWidget(desc)
-        
-        row.addLayout(lbl_layout, 1)
-        row.addWidget(widget, 0)
-        layout.addWidget(container)
+            desc.setWordWrap(not stacked)
+            text_layout.addWidget(desc)
+
+        if not stacked:
+            box.addLayout(text_layout, 1)
+        # 複合入力は中継用のQWidgetを挟まず、レイアウトのまま直接組み込む
+        if isinstance(widget, QtWidgets.QLayout):
+            box.addLayout(widget)
+        else:
+            box.addWidget(widget)
+        return container
+
+    def _add_card(self, layout, label_text, widget, description=None):
+        layout.addWidget(self._make_card(label_text, widget, description))
 
     def _add_input_card(self, layout, label_text, widget, description=None):
-        container = QtWidgets.QFrame()
-        container.setObjectName("Card")
-        vbox = QtWidgets.QVBoxLayout(container)
-        vbox.setContentsMargins(20, 16, 20, 16)
-        vbox.setSpacing(10)
-        
-        lbl = QtWidgets.QLabel(label_text)
-        lbl.setStyleSheet(f"font-weight: bold; font-size: 14px; color: {self._label_color};")
-        vbox.addWidget(lbl)
-        
-        if description:
-            desc = QtWidgets.QLabel(description)
-            desc.setObjectName("Description")
-            vbox.addWidget(desc)
-            
-        vbox.addWidget(widget)
-        layout.addWidget(container)
+        layout.addWidget(self._make_card(label_text, widget, description, stacked=True))
+
+    def _add_spin_cards(self, layout, specs) -> None:
+        for attr, kind, minimum, maximum, label_text, description in specs:
+            spin = ModernSpinBox(kind)
+            spin.setRange(minimum, maximum)
+            setattr(self, attr, spin)
+            self._add_card(layout, label_text, spin, description)
+
+    def _add_toggle_cards(self, layout, specs) -> None:
+        for attr, label_text, description in specs:
+            toggle = ToggleSwitch()
+            setattr(self, attr, toggle)
+            self._add_card(layout, label_text, toggle, description)
 
     def _add_section_label(self, layout, text: str, with_separator: bool = True) -> None:
         if with_separator:
@@ -160,9 +326,7 @@ class SettingsPagesMixin:
             divider.setFixedHeight(1)
             layout.addWidget(divider)
         lbl = QtWidgets.QLabel(text)
-        lbl.setStyleSheet(
-            f"font-weight: bold; margin-top: 18px; font-size: 18px; color: {self._section_label_color};"
-        )
+        lbl.setObjectName("SectionLabel")
         layout.addWidget(lbl)
 
     def _build_ui_color_tab(self, mode: str) -> QtWidgets.QWidget:
@@ -243,7 +407,7 @@ class SettingsPagesMixin:
         reset_row.addStretch(1)
         self.ui_preset_reset_btn = QtWidgets.QPushButton("リセット")
         self.ui_preset_reset_btn.setObjectName("UiColorResetButton")
-        self.ui_preset_reset_btn.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+        self.ui_preset_reset_btn.setCursor(get_pointer_cursor())
         self.ui_preset_reset_btn.clicked.connect(self._reset_ui_colors_current_tab)
         reset_row.addWidget(self.ui_preset_reset_btn)
         reset_widget = QtWidgets.QWidget()
@@ -268,7 +432,7 @@ class SettingsPagesMixin:
             self.ui_preset_apply_btn,
             self.ui_preset_delete_btn,
         ):
-            btn.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+            btn.setCursor(get_pointer_cursor())
         self.ui_preset_save_btn.clicked.connect(self._save_ui_preset)
         self.ui_preset_apply_btn.clicked.connect(self._apply_ui_preset)
         self.ui_preset_delete_btn.clicked.connect(self._delete_ui_preset)
@@ -286,15 +450,13 @@ class SettingsPagesMixin:
         self._load_ui_font_options()
         self.ui_font_combo.currentIndexChanged.connect(self._apply_live_ui_font)
         self.ui_font_import_btn = QtWidgets.QPushButton("フォントを追加")
-        self.ui_font_import_btn.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+        self.ui_font_import_btn.setCursor(get_pointer_cursor())
         self.ui_font_import_btn.clicked.connect(self._import_ui_font)
         font_row = QtWidgets.QHBoxLayout()
+        font_row.setContentsMargins(0, 0, 0, 0)
         font_row.addWidget(self.ui_font_combo, 1)
         font_row.addWidget(self.ui_font_import_btn, 0)
-        font_wrapper = QtWidgets.QWidget()
-        font_wrapper.setLayout(font_row)
-        font_row.setContentsMargins(0, 0, 0, 0)
-        self._add_input_card(layout, "表示フォント", font_wrapper, "インストール済みフォントまたはインポートしたフォントを選択します。")
+        self._add_input_card(layout, "表示フォント", font_row, "インストール済みフォントまたはインポートしたフォントを選択します。")
 
         layout.addStretch(1)
         return page
@@ -306,49 +468,25 @@ class SettingsPagesMixin:
         self._add_section_label(layout, "保存先", with_separator=False)
         self.output_dir_input = QtWidgets.QLineEdit()
         self.output_browse = QtWidgets.QPushButton("参照")
-        self.output_browse.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+        self.output_browse.setCursor(get_pointer_cursor())
         self.output_browse.clicked.connect(self._browse_output_dir)
 
         h_box = QtWidgets.QHBoxLayout()
+        h_box.setContentsMargins(0, 0, 0, 0)
         h_box.addWidget(self.output_dir_input)
         h_box.addWidget(self.output_browse)
-        wrapper = QtWidgets.QWidget()
-        wrapper.setLayout(h_box)
-        h_box.setContentsMargins(0, 0, 0, 0)
 
-        self._add_input_card(layout, "保存先フォルダ", wrapper, "録画ファイルの保存先を指定します。")
+        self._add_input_card(layout, "保存先フォルダ", h_box, "録画ファイルの保存先を指定します。")
 
         # フォーマット
         self._add_section_label(layout, "保存形式")
         self.output_format_input = QtWidgets.QComboBox()
-        self.output_format_input.addItems([
-            "TS",
-            "MP4",
-            "MOV",
-            "FLV",
-            "MKV",
-            "MP3",
-            "WAV",
-        ])
-        self.output_format_input.setItemData(0, OUTPUT_FORMAT_TS)
-        self.output_format_input.setItemData(1, OUTPUT_FORMAT_MP4_COPY)
-        self.output_format_input.setItemData(2, OUTPUT_FORMAT_MOV)
-        self.output_format_input.setItemData(3, OUTPUT_FORMAT_FLV)
-        self.output_format_input.setItemData(4, OUTPUT_FORMAT_MKV)
-        self.output_format_input.setItemData(5, OUTPUT_FORMAT_MP3)
-        self.output_format_input.setItemData(6, OUTPUT_FORMAT_WAV)
+        _fill_combo(self.output_format_input, _OUTPUT_FORMAT_ITEMS)
         self.output_format_input.setMinimumHeight(40)
         self._add_input_card(layout, "保存フォーマット", self.output_format_input, "用途に合わせてファイル形式を選択してください。")
 
         self._add_section_label(layout, "保存ルール")
-        self.output_date_folder_input = ToggleSwitch()
-        self._add_card(layout, "日付フォルダで整理", self.output_date_folder_input, "録画日ごとにフォルダ分けします。")
-
-        self.output_filename_with_channel_input = ToggleSwitch()
-        self._add_card(layout, "ファイル名に配信者名を付ける", self.output_filename_with_channel_input, "録画ファイル名に配信者名を付加します。")
-
-        self.keep_ts_input = ToggleSwitch()
-        self._add_card(layout, "TSファイルを残す", self.keep_ts_input, "MP4保存時でも元のTSファイルを残します。")
+        self._add_toggle_cards(layout, _STORAGE_TOGGLES)
 
         layout.addStretch(1)
         return page
@@ -358,41 +496,15 @@ class SettingsPagesMixin:
 
         self._add_section_label(layout, "画質", with_separator=False)
         self.recording_quality_input = QtWidgets.QComboBox()
-        self.recording_quality_input.addItems([
-            "最高 (best)",
-            "1080p",
-            "720p",
-            "480p",
-            "360p",
-            "最低 (worst)",
-            "音声のみ (audio_only)",
-        ])
-        self.recording_quality_input.setItemData(0, "best")
-        self.recording_quality_input.setItemData(1, "1080p")
-        self.recording_quality_input.setItemData(2, "720p")
-        self.recording_quality_input.setItemData(3, "480p")
-        self.recording_quality_input.setItemData(4, "360p")
-        self.recording_quality_input.setItemData(5, "worst")
-        self.recording_quality_input.setItemData(6, "audio_only")
+        _fill_combo(self.recording_quality_input, _RECORDING_QUALITY_ITEMS)
         self._add_input_card(layout, "録画画質", self.recording_quality_input, "Streamlinkで取得する画質を選択します。")
 
         self.youtube_backend_input = QtWidgets.QComboBox()
-        self.youtube_backend_input.addItems([
-            "Streamlink",
-            "yt-dlp",
-        ])
-        self.youtube_backend_input.setItemData(0, "streamlink")
-        self.youtube_backend_input.setItemData(1, "ytdlp")
+        _fill_combo(self.youtube_backend_input, _YOUTUBE_BACKEND_ITEMS)
         self._add_input_card(layout, "YouTube録画方式", self.youtube_backend_input, "YouTubeの録画方法を選択します。※画質に差はありません※")
 
         self._add_section_label(layout, "サイズ設定")
-        self.recording_max_size_input = ModernSpinBox('int')
-        self.recording_max_size_input.setRange(0, 1024 * 1024)
-        self._add_card(layout, "録画ファイルの最大サイズ (MB)", self.recording_max_size_input, "0にすると無制限になります。")
-
-        self.recording_size_margin_input = ModernSpinBox('int')
-        self.recording_size_margin_input.setRange(0, 1024 * 1024)
-        self._add_card(layout, "録画サイズ切替の余裕 (MB)", self.recording_size_margin_input, "上限に達する前に切り替える余裕幅です。")
+        self._add_spin_cards(layout, _RECORDING_SIZE_SPINS)
 
         self._add_section_label(layout, "自動圧縮")
         self.auto_compress_enabled_input = ToggleSwitch()
@@ -400,71 +512,25 @@ class SettingsPagesMixin:
         self._add_card(layout, "録画後に自動圧縮", self.auto_compress_enabled_input, "録画後に再エンコードして容量を削減します。")
 
         self.auto_compress_profile_input = QtWidgets.QComboBox()
-        self.auto_compress_profile_input.addItems([
-            "長時間用",
-            "中時間用",
-            "短時間用",
-            "カスタム",
-        ])
-        self.auto_compress_profile_input.setItemData(0, "long")
-        self.auto_compress_profile_input.setItemData(1, "medium")
-        self.auto_compress_profile_input.setItemData(2, "short")
-        self.auto_compress_profile_input.setItemData(3, "custom")
+        _fill_combo(self.auto_compress_profile_input, _AUTO_COMPRESS_PROFILE_ITEMS)
         self.auto_compress_profile_input.currentIndexChanged.connect(
             self._on_auto_compress_profile_changed
         )
         self._add_input_card(layout, "圧縮プロファイル", self.auto_compress_profile_input, "時間に合わせた目安設定を一括で反映します。")
 
         self.auto_compress_codec_input = QtWidgets.QComboBox()
-        self.auto_compress_codec_input.addItems([
-            "H.264 (libx264)",
-            "H.265 (libx265)",
-        ])
-        self.auto_compress_codec_input.setItemData(0, "libx264")
-        self.auto_compress_codec_input.setItemData(1, "libx265")
+        _fill_combo(self.auto_compress_codec_input, _AUTO_COMPRESS_CODEC_ITEMS)
         self._add_input_card(layout, "圧縮コーデック", self.auto_compress_codec_input, "容量を抑えたい場合はH.265を選択してください。\n再生互換性を重視する場合はH.264をおすすめします。")
 
         self.auto_compress_preset_input = QtWidgets.QComboBox()
-        self.auto_compress_preset_input.addItems([
-            "速い (fast)",
-            "標準 (medium)",
-            "高圧縮 (slow)",
-        ])
-        self.auto_compress_preset_input.setItemData(0, "fast")
-        self.auto_compress_preset_input.setItemData(1, "medium")
-        self.auto_compress_preset_input.setItemData(2, "slow")
+        _fill_combo(self.auto_compress_preset_input, _AUTO_COMPRESS_PRESET_ITEMS)
         self._add_input_card(layout, "圧縮プリセット", self.auto_compress_preset_input, "速いほど処理が軽くなります。")
 
         self.auto_compress_resolution_input = QtWidgets.QComboBox()
-        self.auto_compress_resolution_input.addItems([
-            "元の解像度を維持",
-            "144p",
-            "240p",
-            "360p",
-            "480p",
-            "720p",
-            "1080p",
-        ])
-        self.auto_compress_resolution_input.setItemData(0, 0)
-        self.auto_compress_resolution_input.setItemData(1, 144)
-        self.auto_compress_resolution_input.setItemData(2, 240)
-        self.auto_compress_resolution_input.setItemData(3, 360)
-        self.auto_compress_resolution_input.setItemData(4, 480)
-        self.auto_compress_resolution_input.setItemData(5, 720)
-        self.auto_compress_resolution_input.setItemData(6, 1080)
+        _fill_combo(self.auto_compress_resolution_input, _AUTO_COMPRESS_RESOLUTION_ITEMS)
         self._add_input_card(layout, "圧縮の最大解像度", self.auto_compress_resolution_input, "元の解像度より高い値は適用されません。")
 
-        self.auto_compress_fps_input = ModernSpinBox('int')
-        self.auto_compress_fps_input.setRange(0, 240)
-        self._add_card(layout, "圧縮のFPS (0は元のまま)", self.auto_compress_fps_input, "フレームレートを固定して容量を抑えます。")
-
-        self.auto_compress_video_bitrate_input = ModernSpinBox('int')
-        self.auto_compress_video_bitrate_input.setRange(100, 50000)
-        self._add_card(layout, "圧縮の映像ビットレート (kbps)", self.auto_compress_video_bitrate_input, "数値が小さいほど容量が減ります。")
-
-        self.auto_compress_audio_bitrate_input = ModernSpinBox('int')
-        self.auto_compress_audio_bitrate_input.setRange(32, 320)
-        self._add_card(layout, "圧縮の音声ビットレート (kbps)", self.auto_compress_audio_bitrate_input, "音声の圧縮率を指定します。")
+        self._add_spin_cards(layout, _AUTO_COMPRESS_SPINS)
 
         self.auto_compress_keep_original_input = ToggleSwitch()
         self._add_card(layout, "圧縮前のファイルを残す", self.auto_compress_keep_original_input, "ONにすると元の録画ファイルを保持します。")
@@ -474,7 +540,7 @@ class SettingsPagesMixin:
         self._add_card(layout, "透かしを付ける", self.watermark_enabled_input, "録画ファイルに透かしを右下へ合成します。")
 
         self.watermark_open_dialog_button = QtWidgets.QPushButton("透かし設定を開く")
-        self.watermark_open_dialog_button.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+        self.watermark_open_dialog_button.setCursor(get_pointer_cursor())
         self.watermark_open_dialog_button.clicked.connect(self._open_watermark_dialog)
         self._add_input_card(layout, "透かし詳細", self.watermark_open_dialog_button, "プレビュー付きの専用ウィンドウを開きます。")
 
@@ -503,44 +569,23 @@ class SettingsPagesMixin:
         page, layout = self._make_scrollable_page("ネットワーク設定")
         
         self._add_section_label(layout, "再接続設定", with_separator=False)
-        self.retry_count_input = ModernSpinBox('int')
-        self.retry_count_input.setRange(0, 99)
-        self._add_card(layout, "再接続リトライ回数", self.retry_count_input, "切断時に再接続を試みる最大回数")
-
-        self.retry_wait_input = ModernSpinBox('int')
-        self.retry_wait_input.setRange(1, 3600)
-        self._add_card(layout, "リトライ待機時間 (秒)", self.retry_wait_input, "再接続までの待機時間")
+        self._add_spin_cards(layout, _RETRY_SPINS)
 
         self._add_section_label(layout, "タイムアウト")
-        self.http_timeout_input = ModernSpinBox('int')
-        self.http_timeout_input.setRange(1, 300)
-        self._add_card(layout, "HTTPタイムアウト (秒)", self.http_timeout_input, "通信応答がない場合のタイムアウト時間")
-
-        self.stream_timeout_input = ModernSpinBox('int')
-        self.stream_timeout_input.setRange(1, 600)
-        self._add_card(layout, "ストリーム待機 (秒)", self.stream_timeout_input, "映像データが途切れた際の待機時間")
+        self._add_spin_cards(layout, _TIMEOUT_SPINS)
 
         layout.addStretch(1)
         return page
 
     def _page_automation(self):
-        page, layout = self._make_scrollable_page("自動化・監視設定")
+        page, layout = self._make_scrollable_page("自動化・監視設定", scrollable=False)
         
         self._add_section_label(layout, "自動録画", with_separator=False)
-        self.auto_enabled_input = ToggleSwitch()
+        self._add_toggle_cards(layout, _AUTO_RECORD_TOGGLES)
         self.auto_enabled_input.toggled.connect(self._update_auto_record_option_state)
-        self._add_card(layout, "自動録画機能", self.auto_enabled_input, "監視リストの配信が開始されたら自動で録画します。")
-
-        self.auto_startup_input = ToggleSwitch()
-        self._add_card(layout, "アプリ起動時に監視開始", self.auto_startup_input, "アプリを起動した直後から監視をスタートします。")
-
-        self.auto_notify_only_input = ToggleSwitch()
-        self._add_card(layout, "通知のみで監視", self.auto_notify_only_input, "配信を検知しても録画せず、通知だけを行います。")
 
         self._add_section_label(layout, "監視サイクル")
-        self.auto_check_interval_input = ModernSpinBox('int')
-        self.auto_check_interval_input.setRange(20, 3600)
-        self._add_card(layout, "監視サイクル (秒)", self.auto_check_interval_input, "配信状態をチェックする間隔")
+        self._add_spin_cards(layout, _AUTO_CHECK_SPINS)
 
         layout.addStretch(1)
         return page
@@ -564,21 +609,18 @@ class SettingsPagesMixin:
             header.setAutoRaise(True)
             header.setCheckable(True)
             header.setChecked(False)
-            header.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+            header.setCursor(get_pointer_cursor())
             header.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonTextOnly)
-            header.setStyleSheet(f"font-weight: bold; color: {self._muted_label_color}; margin-top: 12px;")
 
             text_area = QtWidgets.QPlainTextEdit()
             text_area.setPlaceholderText(ph)
             text_area.setMinimumHeight(100)
 
-            def _toggle(checked: bool) -> None:
-                prefix = "▼ " if checked else "▶ "
-                header.setText(prefix + title)
-                text_area.setVisible(checked)
-
-            header.toggled.connect(_toggle)
-            _toggle(False)
+            # 開閉時の見出しは生成時に一度だけ組み立てておく
+            header.setProperty("labelOpen", "▼ " + title)
+            header.setProperty("labelClosed", "▶ " + title)
+            header.toggled.connect(partial(self._on_collapse_toggled, header, text_area))
+            self._on_collapse_toggled(header, text_area, False)
 
             container_layout.addWidget(header)
             container_layout.addWidget(text_area)
@@ -606,26 +648,25 @@ class SettingsPagesMixin:
         layout.addStretch(1)
         return page
 
+    def _on_collapse_toggled(self, header: QtWidgets.QToolButton, area: QtWidgets.QWidget, checked: bool) -> None:
+        header.setText(header.property("labelOpen" if checked else "labelClosed"))
+        area.setVisible(checked)
+
     def _page_system(self):
-        page, layout = self._make_scrollable_page("ログ・システム")
+        page, layout = self._make_scrollable_page("ログ・システム", scrollable=False)
         
         self._add_section_label(layout, "システム", with_separator=False)
-        self.tray_enabled_input = ToggleSwitch()
-        self._add_card(layout, "タスクトレイ常駐", self.tray_enabled_input, "ウィンドウを閉じてもバックグラウンドで動作します。")
-
-        self.auto_start_input = ToggleSwitch()
-        self._add_card(layout, "PC起動時に自動実行", self.auto_start_input, "PC起動時にソフトを自動で立ち上げます。")
+        self._add_toggle_cards(layout, _SYSTEM_TOGGLES)
 
         self._add_section_label(layout, "ログ表示設定")
 
-        self.log_panel_visible_input = ToggleSwitch()
-        self._add_card(layout, "ログパネル表示", self.log_panel_visible_input, "右側のログパネルを表示します。")
+        self._add_toggle_cards(layout, _LOG_TOGGLES)
 
         layout.addStretch(1)
         return page
 
     def _page_api(self):
-        page, layout = self._make_scrollable_page("APIキー設定")
+        page, layout = self._make_scrollable_page("APIキー設定", scrollable=False)
         
         self._add_section_label(layout, "YouTube", with_separator=False)
         self.youtube_api_key_input = QtWidgets.QLineEdit()
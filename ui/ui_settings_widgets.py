@@ -3,20 +3,35 @@ from __future__ import annotations
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
+_POINTER_CURSOR: list[QtGui.QCursor] = []  # 設定画面で共有する指カーソル
+
+
+def get_pointer_cursor() -> QtGui.QCursor:
+    # QCursorは暗黙共有なので、1つ作って各ウィジェットへ渡す (生成はQApplication作成後に遅延)
+    if not _POINTER_CURSOR:
+        _POINTER_CURSOR.append(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+    return _POINTER_CURSOR[0]
+
 
 class ToggleSwitch(QtWidgets.QWidget):
     """モダンなアニメーション付きトグルスイッチ"""
     toggled = QtCore.pyqtSignal(bool)
+    _COLOR_OFF = 0xFFCBD5E1  # Gray 300 (ARGB)
+    _COLOR_ON = 0xFF0EA5E9  # Sky 500 (ARGB)
+    _KNOB_COLOR = QtGui.QColor("white")
 
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self._checked = False
         self._pos_progress = 0.0
-        self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+        self.setCursor(get_pointer_cursor())
         self.setSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
-        self._anim = QtCore.QPropertyAnimation(self, b"pos_progress", self)
+        self._painted_state: tuple[int, int] | None = None
+        # プロパティ経由の書き込みを避け、値の通知を直接受け取る
+        self._anim = QtCore.QVariantAnimation(self)
         self._anim.setDuration(200)
         self._anim.setEasingCurve(QtCore.QEasingCurve.Type.InOutQuad)
+        self._anim.valueChanged.connect(self.set_pos_progress)
 
     def isChecked(self) -> bool: return self._checked
     def setChecked(self, checked: bool) -> None:
@@ -46,21 +61,27 @@ class ToggleSwitch(QtWidgets.QWidget):
 
     def set_pos_progress(self, p: float) -> None:  # アニメーション位置の更新
         self._pos_progress = float(p)  # 値を安全に反映する
+        # ノブ位置(px)と色の段階が前回描画から変わらないフレームは再描画しない
+        if self._painted_state == self._paint_state():
+            return
         self.update()  # 再描画を要求する
 
+    def _paint_state(self) -> tuple[int, int]:
+        h = self.height()
+        travel = max(0, self.width() - h)  # ノブの移動量(左右の余白は同じ)
+        return round(travel * self._pos_progress), int(self._pos_progress * 256)
+
     pos_progress = QtCore.pyqtProperty(float, get_pos_progress, set_pos_progress)  # プロパティ登録
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        self._painted_state = self._paint_state()
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
         rect = self.rect()
         h = rect.height()
         w = rect.width()
-        
-        c_off = QtGui.QColor("#cbd5e1") # Gray 300
-        c_on = QtGui.QColor("#0ea5e9")  # Sky 500
-        
-        current_color = self._interpolate_color(c_off, c_on, self._pos_progress)
+
+        current_color = self._interpolate_color(self._pos_progress)
         painter.setPen(QtCore.Qt.PenStyle.NoPen)
         painter.setBrush(current_color)
         painter.drawRoundedRect(rect, h/2, h/2)
@@ -71,14 +92,17 @@ class ToggleSwitch(QtWidgets.QWidget):
         x_on = w - knob_size - padding
         curr_x = x_off + (x_on - x_off) * self._pos_progress
         
-        painter.setBrush(QtGui.QColor("white"))
+        painter.setBrush(self._KNOB_COLOR)
         painter.drawEllipse(QtCore.QRectF(curr_x, padding, knob_size, knob_size))
 
-    def _interpolate_color(self, c1, c2, ratio):
-        r = c1.red() + (c2.red() - c1.red()) * ratio
-        g = c1.green() + (c2.green() - c1.green()) * ratio
-        b = c1.blue() + (c2.blue() - c1.blue()) * ratio
-        return QtGui.QColor(int(r), int(g), int(b))
+    def _interpolate_color(self, ratio: float) -> QtGui.QColor:
+        # R/BとGを詰めたまま整数の乗算とシフトで補間する
+        t = max(0, min(256, int(ratio * 256)))
+        c_off = self._COLOR_OFF
+        c_on = self._COLOR_ON
+        rb = (((c_on & 0x00FF00FF) * t + (c_off & 0x00FF00FF) * (256 - t)) >> 8) & 0x00FF00FF
+        g = (((c_on & 0x0000FF00) * t + (c_off & 0x0000FF00) * (256 - t)) >> 8) & 0x0000FF00
+        return QtGui.QColor.fromRgba(0xFF000000 | rb | g)
 
 
 class ModernSpinBox(QtWidgets.QWidget):
@@ -86,7 +110,9 @@ class ModernSpinBox(QtWidgets.QWidget):
     [ Value       ][ - ][ + ]
     入力欄の右側に操作ボタンをまとめた数値入力
     """
-    valueChanged = QtCore.pyqtSignal(object)
+    valueChanged = QtCore.pyqtSignal(object)  # 互換用: 型を問わず通知
+    valueChangedInt = QtCore.pyqtSignal(int)  # 'int' モード時の通知
+    valueChangedFloat = QtCore.pyqtSignal(float)  # 'float' モード時の通知
 
     def __init__(self, mode: str = 'int', parent=None):
         super().__init__(parent)
@@ -106,16 +132,22 @@ class ModernSpinBox(QtWidgets.QWidget):
         self.line_edit.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self.line_edit.setObjectName("SpinInput")
         self.line_edit.setFixedHeight(38)
+        if mode == 'int':
+            self._validator = _SpinIntValidator(self)
+        else:
+            self._validator = _SpinDoubleValidator(self)
+            self._validator.setDecimals(self._decimals)
+        self.line_edit.setValidator(self._validator)
         
         # 2. マイナスボタン (中)
         self.btn_minus = _SpinGlyphButton("minus")
-        self.btn_minus.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+        self.btn_minus.setCursor(get_pointer_cursor())
         self.btn_minus.setObjectName("SpinBtnMinus")
         self.btn_minus.setFixedSize(40, 38)
         
         # 3. プラスボタン (右)
         self.btn_plus = _SpinGlyphButton("plus")
-        self.btn_plus.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+        self.btn_plus.setCursor(get_pointer_cursor())
         self.btn_plus.setObjectName("SpinBtnPlus")
         self.btn_plus.setFixedSize(40, 38)
         
@@ -130,12 +162,14 @@ class ModernSpinBox(QtWidgets.QWidget):
         
         self._update_display()
 
-    def _update_display(self):
+    def _format_value(self) -> str:
         if self._mode == 'int':
-            self.line_edit.setText(str(int(self._value)))
-        else:
-            fmt = "{:." + str(self._decimals) + "f}"
-            self.line_edit.setText(fmt.format(self._value))
+            return str(int(self._value))
+        fmt = "{:." + str(self._decimals) + "f}"
+        return fmt.format(self._value)
+
+    def _update_display(self):
+        self.line_edit.setText(self._format_value())
 
     def _increment(self):
         self.setValue(self._value + self._step)
@@ -144,10 +178,15 @@ class ModernSpinBox(QtWidgets.QWidget):
         self.setValue(self._value - self._step)
 
     def _on_editing_finished(self):
-        try:
-            val = float(self.line_edit.text()) if self._mode == 'float' else int(self.line_edit.text())
+        # バリデータを通った入力だけが届くため、例外に頼らず変換結果で判定する
+        text = self.line_edit.text()
+        if self._mode == 'float':
+            val, ok = _SPIN_LOCALE.toDouble(text)
+        else:
+            val, ok = _SPIN_LOCALE.toInt(text)
+        if ok:
             self.setValue(val)
-        except ValueError:
+        else:
             self._update_display()
 
     def setValue(self, val):
@@ -156,13 +195,46 @@ class ModernSpinBox(QtWidgets.QWidget):
         val = max(self._min, min(self._max, val))
         if self._value != val:
             self._value = val
+            if self._mode == 'int':
+                self.valueChangedInt.emit(val)
+            else:
+                self.valueChangedFloat.emit(val)
             self.valueChanged.emit(val)
         self._update_display()
 
     def value(self): return self._value
     def setRange(self, mn, mx): self._min = mn; self._max = mx; self.setValue(self._value)
     def setSingleStep(self, s): self._step = s
-    def setDecimals(self, d): self._decimals = d; self._update_display()
+    def setDecimals(self, d):
+        self._decimals = d
+        if self._mode == 'float':
+            self._validator.setDecimals(d)
+        self._update_display()
+
+
+_SPIN_LOCALE = QtCore.QLocale.c()  # 表示書式(小数点は".")に合わせた数値変換
+
+
+# 数値にならない文字は入力時に拒否し、確定できない入力はフォーカス移動時に表示値へ戻す
+class _SpinIntValidator(QtGui.QIntValidator):
+    def __init__(self, spin: ModernSpinBox) -> None:
+        super().__init__(spin)
+        self._spin = spin
+        self.setLocale(_SPIN_LOCALE)
+
+    def fixup(self, text: str) -> str:
+        return self._spin._format_value()
+
+
+class _SpinDoubleValidator(QtGui.QDoubleValidator):
+    def __init__(self, spin: ModernSpinBox) -> None:
+        super().__init__(spin)
+        self._spin = spin
+        self.setLocale(_SPIN_LOCALE)
+        self.setNotation(QtGui.QDoubleValidator.Notation.StandardNotation)
+
+    def fixup(self, text: str) -> str:
+        return self._spin._format_value()
 
 
 # フォント依存を避けるため、＋／－を線で描画する
@@ -173,17 +245,33 @@ class _SpinGlyphButton(QtWidgets.QPushButton):
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
         super().paintEvent(event)
+        color = self.palette().color(QtGui.QPalette.ColorRole.ButtonText)
+        dpr = self.devicePixelRatioF()
+        # 記号は色・サイズ・倍率が同じなら共通の描画結果を使い回す
+        key = f"spinglyph:{self._glyph}:{color.rgba()}:{self.width()}x{self.height()}:{dpr}"
+        pixmap = QtGui.QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = self._render_glyph(color, dpr)
+            QtGui.QPixmapCache.insert(key, pixmap)
         painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+
+    def _render_glyph(self, color: QtGui.QColor, dpr: float) -> QtGui.QPixmap:
+        rect = self.rect()
+        pixmap = QtGui.QPixmap(max(1, round(rect.width() * dpr)), max(1, round(rect.height() * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        painter = QtGui.QPainter(pixmap)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        color = self.palette().color(QtGui.QPalette.ColorRole.ButtonText)
         painter.setPen(QtGui.QPen(color, 2))
-        rect = self.rect()
         cx = rect.center().x()
         cy = rect.center().y()
         size = min(rect.width(), rect.height()) * 0.18
         painter.drawLine(QtCore.QPointF(cx - size, cy), QtCore.QPointF(cx + size, cy))
         if self._glyph == "plus":
             painter.drawLine(QtCore.QPointF(cx, cy - size), QtCore.QPointF(cx, cy + size))
+        painter.end()
+        return pixmap
 
 
 class ColorPickerWidget(QtWidgets.QWidget):
@@ -203,7 +291,7 @@ class ColorPickerWidget(QtWidgets.QWidget):
 
         self.button = QtWidgets.QPushButton()
         self.button.setFixedSize(40, 30)
-        self.button.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
+        self.button.setCursor(get_pointer_cursor())
         self.button.clicked.connect(self._choose_color)
         layout.addWidget(self.button, 0)
 
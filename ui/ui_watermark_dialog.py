@@ -126,24 +126,24 @@ class WatermarkDialog(QtWidgets.QDialog):
         self.opacity_input = ModernSpinBox('float')
         self.opacity_input.setRange(0.0, 1.0)
         self.opacity_input.setSingleStep(0.05)
-        self.opacity_input.valueChanged.connect(self._update_preview_overlay)
-        self.opacity_input.valueChanged.connect(self._on_setting_changed)
+        self.opacity_input.valueChangedFloat.connect(self._update_preview_overlay)
+        self.opacity_input.valueChangedFloat.connect(self._on_setting_changed)
         control_layout.addWidget(field_label("透明度 (0.0 ~ 1.0)"))
         control_layout.addWidget(self.opacity_input)
 
         self.logo_width_input = ModernSpinBox('float')
         self.logo_width_input.setRange(1.0, 50.0)
         self.logo_width_input.setSingleStep(0.5)
-        self.logo_width_input.valueChanged.connect(self._update_preview_overlay)
-        self.logo_width_input.valueChanged.connect(self._on_setting_changed)
+        self.logo_width_input.valueChangedFloat.connect(self._update_preview_overlay)
+        self.logo_width_input.valueChangedFloat.connect(self._on_setting_changed)
         control_layout.addWidget(field_label("ロゴ幅 (% of 画面)"))
         control_layout.addWidget(self.logo_width_input)
 
         self.text_size_input = ModernSpinBox('float')
         self.text_size_input.setRange(1.0, 50.0)
         self.text_size_input.setSingleStep(0.5)
-        self.text_size_input.valueChanged.connect(self._update_preview_overlay)
-        self.text_size_input.valueChanged.connect(self._on_setting_changed)
+        self.text_size_input.valueChangedFloat.connect(self._update_preview_overlay)
+        self.text_size_input.valueChangedFloat.connect(self._on_setting_changed)
         control_layout.addWidget(field_label("テキストサイズ (% of 画面幅)"))
         control_layout.addWidget(self.text_size_input)
 
@@ -166,15 +166,15 @@ class WatermarkDialog(QtWidgets.QDialog):
         self.random_interval_input = ModernSpinBox('int')
         self.random_interval_input.setRange(1, 120)
         self.random_interval_input.setSingleStep(1)
-        self.random_interval_input.valueChanged.connect(self._update_preview_overlay)
-        self.random_interval_input.valueChanged.connect(self._on_setting_changed)
+        self.random_interval_input.valueChangedInt.connect(self._update_preview_overlay)
+        self.random_interval_input.valueChangedInt.connect(self._on_setting_changed)
         control_layout.addWidget(field_label("移動間隔 (秒)"))
         control_layout.addWidget(self.random_interval_input)
         self.margin_input = ModernSpinBox('int')
         self.margin_input.setRange(0, 500)
         self.margin_input.setSingleStep(4)
-        self.margin_input.valueChanged.connect(self._update_preview_overlay)
-        self.margin_input.valueChanged.connect(self._on_setting_changed)
+        self.margin_input.valueChangedInt.connect(self._update_preview_overlay)
+        self.margin_input.valueChangedInt.connect(self._on_setting_changed)
         control_layout.addWidget(field_label("余白 (px)"))
         control_layout.addWidget(self.margin_input)
 
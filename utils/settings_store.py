@@ -1,37 +1,143 @@
 # -*- coding: utf-8 -*-  # 文字コード指定
 from __future__ import annotations  # 型ヒントの将来互換対応
+import threading  # キャッシュの排他制御
 from PyQt6 import QtCore  # PyQt6の設定モジュール
 from core.config import SETTINGS_APP, SETTINGS_ORG  # 設定定数を読み込み
 
-def get_settings() -> QtCore.QSettings:  # 設定オブジェクト取得
-    return QtCore.QSettings(SETTINGS_ORG, SETTINGS_APP)  # 設定を返却
+_cache: dict[str, object] = {}  # キーごとの生の値 (プロセス存続中は保持し、保存時に更新)
+_cache_lock = threading.Lock()  # ワーカースレッドからの同時アクセス対策
+_all_loaded = [False]  # 全キー一括読み込み済みか (済みならキャッシュに無いキーは未設定)
+SETTINGS_FLUSH_DELAY_MS = 250  # 連続保存をまとめる待ち時間
+_pending_writes: dict[str, object] = {}  # 未反映の書き込み
+_flush_timer: list[QtCore.QTimer] = []  # 書き込み集約用タイマー (初回保存時に生成)
+_settings: list[QtCore.QSettings] = []  # プロセスで共有する設定オブジェクト
+
+def get_settings() -> QtCore.QSettings:  # 共有の設定オブジェクト取得 (操作は_cache_lockの下で行う)
+    if not _settings:  # 初回のみ生成
+        _settings.append(QtCore.QSettings(SETTINGS_ORG, SETTINGS_APP))  # 設定ファイルの解析を1回に抑える
+    return _settings[0]  # 設定を返却
+
+def _read_raw_value(key: str):  # 一度読んだキーはキャッシュから返す
+    with _cache_lock:  # キャッシュを排他参照
+        if key in _cache:  # 読み込み済みの場合
+            return _cache[key]  # キャッシュ値を返却
+        if _all_loaded[0]:  # 一括読み込み済みで存在しないキーの場合
+            return None  # 未設定として返却
+        value = get_settings().value(key)  # 未設定ならNone
+        _cache[key] = value  # 読み込み結果を保存
+    return value  # 生の値を返却
+
+def load_all_settings() -> dict[str, object]:  # 全設定を1回の走査で読み込む
+    with _cache_lock:  # キャッシュと設定を排他操作
+        if _all_loaded[0]:  # 読み込み済みの場合
+            return dict(_cache)  # キャッシュの写しを返却
+        settings = get_settings()  # 共有の設定オブジェクトを取得
+        values = {key: settings.value(key) for key in settings.allKeys()}  # 全キーの生の値を取得
+        for key, value in values.items():  # 読み込んだ値をキャッシュへ反映
+            _cache.setdefault(key, value)  # 読み込み中に保存された値は上書きしない
+        _all_loaded[0] = True  # 一括読み込み済みとして記録
+        return dict(_cache)  # キャッシュの写しを返却
 
 def load_setting_value(key: str, default_value, value_type):  # 設定値の読み込み
-    settings = get_settings()  # 設定オブジェクトを取得
-    value = settings.value(key, default_value)  # 設定値を取得
+    value = _read_raw_value(key)  # 設定値を取得
+    if value is None:  # 未設定の場合
+        value = default_value  # 既定値を使用
+    if type(value) is value_type:  # 既に目的の型の場合
+        return value  # 変換せずに返却
     try:  # 型変換の例外処理
         return value_type(value)  # 型変換して返却
     except (TypeError, ValueError):  # 変換失敗時の処理
         return default_value  # 既定値を返却
 
+def flush_pending_settings() -> None:  # 保留中の書き込みをまとめて反映
+    with _cache_lock:  # 保留分を排他取得
+        items = list(_pending_writes.items())  # 書き込み対象を取り出し
+        _pending_writes.clear()  # 保留をクリア
+    if not items:  # 書き込み対象が無い場合
+        return  # 何もしない
+    with _cache_lock:  # キャッシュと設定を排他操作
+        settings = get_settings()  # 共有の設定オブジェクトを取得
+        for key, value in items:  # 各設定を書き込み
+            settings.setValue(key, value)  # 設定を保存
+        settings.sync()  # 書き込みを1回にまとめて反映 (キャッシュは保留時に入れた値のまま、読み直して文字列に戻さない)
+
+def _schedule_flush() -> None:  # 書き込みの遅延反映を予約
+    app = QtCore.QCoreApplication.instance()  # アプリケーションを取得
+    if app is None or QtCore.QThread.currentThread() is not app.thread():  # タイマーが使えない場合
+        flush_pending_settings()  # その場で反映
+        return  # 処理終了
+    if not _flush_timer:  # 初回のみタイマーを生成
+        timer = QtCore.QTimer()  # 書き込み集約用タイマー
+        timer.setSingleShot(True)  # 1回だけ発火
+        timer.setInterval(SETTINGS_FLUSH_DELAY_MS)  # 集約する待ち時間
+        timer.timeout.connect(flush_pending_settings)  # 発火時にまとめて反映
+        app.aboutToQuit.connect(flush_pending_settings)  # 終了時に取りこぼしを反映
+        _flush_timer.append(timer)  # タイマーを保持
+    _flush_timer[0].start()  # 待ち時間をリセットして再始動
+
+def _is_same_value(stored, value) -> bool:  # 保存済みの値と同じか判定
+    if stored == value:  # そのまま一致する場合
+        return True  # 同じ値
+    if not isinstance(stored, str):  # 設定ファイルから読んだ文字列でない場合
+        return False  # 異なる値
+    # QSettingsは真偽値(全環境)や数値(INI形式)を文字列で返すため、保存する値の型に揃えて比べる
+    if isinstance(value, bool):  # 真偽値の場合
+        return to_bool(stored, not value) is value  # 解釈できない文字列は異なる値として扱う
+    if isinstance(value, (int, float)):  # 数値の場合
+        try:  # 型変換の例外処理
+            return type(value)(stored) == value  # 数値として比較
+        except ValueError:  # 変換失敗時
+            return False  # 異なる値
+    return False  # 異なる値
+
+def _queue_write(key: str, value) -> bool:  # 書き込みを保留へ追加 (_cache_lockの下で呼ぶ)
+    if key not in _pending_writes and key in _cache and _is_same_value(_cache[key], value):  # 保存済みの値と同じ場合
+        return False  # 設定ファイルを書き直さない
+    _pending_writes[key] = value  # 書き込みを保留
+    _cache[key] = value  # 読み込みには保存前でも新しい値を返す
+    return True  # 書き込みが必要
+
 def save_setting_value(key: str, value) -> None:  # 設定値の保存
-    settings = get_settings()  # 設定オブジェクトを取得
-    settings.setValue(key, value)  # 設定を保存
+    with _cache_lock:  # キャッシュを排他更新
+        queued = _queue_write(key, value)  # 変更がある場合のみ保留へ追加
+    if queued:  # 書き込みが必要な場合
+        _schedule_flush()  # 短時間の連続保存を1回の書き込みにまとめる
+
+def save_settings_bulk(items) -> None:  # 複数の設定値をまとめて保存
+    with _cache_lock:  # キャッシュを排他更新
+        for key, value in items:  # 各設定を保留へ追加
+            _queue_write(key, value)  # 変更がある場合のみ保留へ追加
+    flush_pending_settings()  # 保留中の分と合わせて即時に反映 (変更が無ければ同期しない)
+
+def _str_to_bool(value: str, default_value: bool) -> bool:  # 文字列の真偽値変換
+    text = value.strip().lower()  # 文字列を正規化
+    if text in _TRUE_TEXTS:  # 真に該当する場合
+        return True  # Trueを返却
+    if text in _FALSE_TEXTS:  # 偽に該当する場合
+        return False  # Falseを返却
+    return default_value  # 既定値を返却
+
+_TRUE_TEXTS = frozenset(("1", "true", "yes", "on"))  # 真とみなす文字列
+_FALSE_TEXTS = frozenset(("0", "false", "no", "off"))  # 偽とみなす文字列
+_BOOL_CONVERTERS = {  # 型ごとの真偽値変換 (QSettingsが返す型を1回の辞書参照で振り分け)
+    bool: lambda value, default_value: value,  # 既に真偽値の場合
+    int: lambda value, default_value: bool(value),  # 整数の場合
+    float: lambda value, default_value: bool(value),  # 小数の場合
+    str: _str_to_bool,  # 文字列の場合
+}
 
 def to_bool(value: object, default_value: bool = False) -> bool:  # 真偽値の変換
-    if isinstance(value, bool):  # 既に真偽値の場合
-        return value  # そのまま返却
-    if isinstance(value, (int, float)):  # 数値の場合
+    converter = _BOOL_CONVERTERS.get(type(value))  # 型に対応する変換を取得
+    if converter is not None:  # 対応する変換がある場合
+        return converter(value, default_value)  # 変換して返却
+    if isinstance(value, (int, float)):  # 数値の派生型の場合
         return bool(value)  # 数値を真偽値に変換
-    if isinstance(value, str):  # 文字列の場合
-        text = value.strip().lower()  # 文字列を正規化
-        if text in ("1", "true", "yes", "on"):  # 真に該当する場合
-            return True  # Trueを返却
-        if text in ("0", "false", "no", "off"):  # 偽に該当する場合
-            return False  # Falseを返却
+    if isinstance(value, str):  # 文字列の派生型の場合
+        return _str_to_bool(value, default_value)  # 文字列として変換
     return default_value  # 既定値を返却
 
 def load_bool_setting(key: str, default_value: bool) -> bool:  # 真偽値設定の読み込み
-    settings = get_settings()  # 設定オブジェクトを取得
-    value = settings.value(key, default_value)  # 設定値を取得
+    value = _read_raw_value(key)  # 設定値を取得
+    if value is None:  # 未設定の場合
+        value = default_value  # 既定値を使用
     return to_bool(value, default_value)  # 真偽値へ変換して返却
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-  # 文字コード指定
 from __future__ import annotations  # 型ヒントの将来互換対応
+from requests.adapters import HTTPAdapter  # 接続プールの調整
 from streamlink import Streamlink  # Streamlink本体
-from urllib.parse import urlparse  # URL解析
+from urllib.parse import urlsplit  # URL解析
 
 TWITCASTING_BASE_URL = "https://twitcasting.tv/"  # ツイキャスの基準URL
 TWITCASTING_UA = (
@@ -9,25 +10,58 @@ TWITCASTING_UA = (
     "AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/122.0.0.0 Safari/537.36"
 )  # ツイキャス用ユーザーエージェント
+STREAMLINK_HTTP_POOL_SIZE = 32  # ホストごとに保持するkeep-alive接続数
+_MISSING_HEADER = object()  # 変更前にヘッダーが無かったことを示す印
+_TWITCH_STREAMLINK_OPTIONS = (("twitch-disable-hosting", True), ("twitch-low-latency", True))  # Twitch向けのオプション
 
-def set_streamlink_headers_for_url(session: Streamlink, url: str) -> dict:  # URL別ヘッダー適用
-    original_headers = dict(session.http.headers)  # 元のヘッダーを退避
+def set_streamlink_headers_for_url(session: Streamlink, url: str) -> list[tuple[str, object]]:  # URL別ヘッダー適用
+    # ヘッダー全体を退避せず、書き換えたキーと元の値だけを復元用に返す
+    headers = session.http.headers  # セッションのヘッダー
+    patch: list[tuple[str, object]] = []  # 復元用の変更記録
     if "twitcasting.tv" in url:  # ツイキャスURLの場合
-        session.http.headers["User-Agent"] = TWITCASTING_UA  # UAを上書き
-        session.http.headers["Referer"] = TWITCASTING_BASE_URL  # リファラを追加
-    else:  # ツイキャス以外の場合
-        if session.http.headers.get("Referer") == TWITCASTING_BASE_URL:  # ツイキャス由来の場合
-            session.http.headers.pop("Referer", None)  # リファラを削除
-    return original_headers  # 元のヘッダーを返却
+        for key, value in (("User-Agent", TWITCASTING_UA), ("Referer", TWITCASTING_BASE_URL)):  # UAとリファラを上書き
+            patch.append((key, headers.get(key, _MISSING_HEADER)))  # 元の値を記録
+            headers[key] = value  # ヘッダーを設定
+    elif headers.get("Referer") == TWITCASTING_BASE_URL:  # ツイキャス由来のリファラが残っている場合
+        patch.append(("Referer", headers.pop("Referer")))  # リファラを削除して記録
+    return patch  # 変更記録を返却
 
-def restore_streamlink_headers(session: Streamlink, original_headers: dict) -> None:  # ヘッダー復元
-    session.http.headers.clear()  # 現在のヘッダーをクリア
-    session.http.headers.update(original_headers)  # 元のヘッダーを復元
+def restore_streamlink_headers(session: Streamlink, patch: list[tuple[str, object]]) -> None:  # ヘッダー復元
+    headers = session.http.headers  # セッションのヘッダー
+    for key, value in reversed(patch):  # 変更の逆順で戻す
+        if value is _MISSING_HEADER:  # 元々無かったキーの場合
+            headers.pop(key, None)  # キーを削除
+        else:  # 元の値がある場合
+            headers[key] = value  # 元の値を復元
 
-def apply_streamlink_options_for_url(session: Streamlink, url: str) -> None:  # URL別Streamlinkオプション調整
-    parsed = urlparse(url)  # URLを解析
-    host = parsed.netloc.lower()  # ホストを取得
-    if "twitch" not in host and "twitch" not in url:  # Twitch以外の場合
-        return  # 何もしない
-    session.set_option("twitch-disable-hosting", True)  # ホスティングを回避する
-    session.set_option("twitch-low-latency", True)  # 低遅延モードを有効化する
+def apply_streamlink_options_for_url(session: Streamlink, url: str) -> list[tuple[str, object]]:  # URL別Streamlinkオプション調整
+    # セッションを使い回す呼び出し元のため、書き換えたキーと元の値を復元用に返す
+    if not _is_twitch_target(url):  # Twitch以外の場合
+        return []  # 何もしない
+    patch = [(key, session.get_option(key)) for key, _ in _TWITCH_STREAMLINK_OPTIONS]  # 元の値を記録
+    for key, value in _TWITCH_STREAMLINK_OPTIONS:  # ホスティング回避と低遅延モード
+        session.set_option(key, value)  # オプションを反映
+    return patch  # 変更記録を返却
+
+def restore_streamlink_options(session: Streamlink, patch: list[tuple[str, object]]) -> None:  # オプション復元
+    for key, value in reversed(patch):  # 変更の逆順で戻す
+        session.set_option(key, value)  # 元の値を復元
+
+def create_streamlink_session(http_timeout: int, stream_timeout: int) -> Streamlink:  # タイムアウト設定済みセッション生成
+    # http-timeoutはセッションのHTTP設定へ反映する必要があるため、options.updateではなくset_optionで設定する
+    session = Streamlink()  # Streamlinkセッション生成
+    for key, value in (("http-timeout", int(http_timeout)), ("stream-timeout", int(stream_timeout))):  # タイムアウト設定
+        session.set_option(key, value)  # オプションを反映
+    for prefix in ("https://", "http://"):  # 通常のHTTP(S)アダプタ
+        adapter = session.http.adapters.get(prefix)  # Streamlinkが登録したアダプタ
+        if isinstance(adapter, HTTPAdapter):  # 接続プールを持つ場合
+            # 既定の10本では並行確認時に溢れた接続が捨てられるため広げる (アダプタ独自の設定は維持)
+            adapter.init_poolmanager(STREAMLINK_HTTP_POOL_SIZE, STREAMLINK_HTTP_POOL_SIZE, block=False)
+    return session  # セッションを返却
+
+def _is_twitch_target(url: str) -> bool:  # Twitch向けオプションが必要か判定
+    if "twitch" in url:  # 文字列検索だけで判定できる場合
+        return True  # URL解析を省略
+    if "twitch" not in url.lower():  # 大文字を含めても該当しない場合 (ホストにも含まれない)
+        return False  # URL解析を省略
+    return "twitch" in urlsplit(url).netloc.lower()  # 大文字表記のホストのみ解析して判定
@@ -23,6 +23,9 @@ _DEFAULT_UI_COLORS_DARK = {
     "border": "#1f2a44",
 }
 
+_PARSED_SETTINGS: dict[str, tuple[str, object]] = {}  # 設定キーごとの直近の生文字列と解析結果
+_REGISTERED_FONT_FAMILIES: dict[str, list[str]] = {}  # 登録済みフォントファイルごとのファミリー名
+
 
 def normalize_hex_color(value: str | None) -> str | None:
     if not value:
@@ -83,9 +86,18 @@ def _parse_ui_colors(raw: str | None) -> dict[str, str]:
     return colors
 
 
+def _load_parsed_setting(key: str, default_raw: str, parser):
+    # 生の文字列が前回と同じなら解析し直さない (ライブプレビューで書き換わった場合のみ再解析)
+    raw = load_setting_value(key, default_raw, str)
+    cached = _PARSED_SETTINGS.get(key)
+    if cached is None or cached[0] != raw:
+        cached = (raw, parser(raw))
+        _PARSED_SETTINGS[key] = cached
+    return cached[1]
+
+
 def get_ui_color_overrides(mode: str) -> dict[str, str]:
-    raw = load_setting_value(f"ui_colors_{mode}", "{}", str)
-    return _parse_ui_colors(raw)
+    return dict(_load_parsed_setting(f"ui_colors_{mode}", "{}", _parse_ui_colors))
 
 
 def get_ui_color_edit_values(mode: str) -> dict[str, str]:
@@ -99,8 +111,7 @@ def serialize_ui_colors(colors: dict[str, str]) -> str:
     return json.dumps(colors, ensure_ascii=True, sort_keys=True)
 
 
-def load_ui_font_files() -> list[str]:
-    raw = load_setting_value("ui_font_files", "[]", str)
+def _parse_ui_font_files(raw: str) -> list[str]:
     try:
         data = json.loads(raw)
     except json.JSONDecodeError:
@@ -110,6 +121,10 @@ def load_ui_font_files() -> list[str]:
     return [item for item in data if isinstance(item, str)]
 
 
+def load_ui_font_files() -> list[str]:
+    return list(_load_parsed_setting("ui_font_files", "[]", _parse_ui_font_files))
+
+
 def save_ui_font_files(files: list[str]) -> None:
     save_setting_value("ui_font_files", json.dumps(files, ensure_ascii=True))
 
@@ -117,10 +132,15 @@ def save_ui_font_files(files: list[str]) -> None:
 def register_ui_font_files(files: list[str]) -> list[str]:
     families: list[str] = []
     for path in files:
-        font_id = QtGui.QFontDatabase.addApplicationFont(path)
-        if font_id == -1:
-            continue
-        families.extend(QtGui.QFontDatabase.applicationFontFamilies(font_id))
+        # 登録はプロセスで1回だけ行い、以降は記録したファミリー名を返す
+        registered = _REGISTERED_FONT_FAMILIES.get(path)
+        if registered is None:
+            font_id = QtGui.QFontDatabase.addApplicationFont(path)
+            if font_id == -1:
+                continue
+            registered = QtGui.QFontDatabase.applicationFontFamilies(font_id)
+            _REGISTERED_FONT_FAMILIES[path] = registered
+        families.extend(registered)
     return families
 
 
@@ -146,8 +166,7 @@ def get_ui_font_css_family(default_families: list[str] | None = None) -> str:
     return ", ".join(_format_font_family(name) for name in families)
 
 
-def load_ui_color_presets(mode: str) -> dict[str, dict[str, str]]:
-    raw = load_setting_value(f"ui_color_presets_{mode}", "{}", str)
+def _parse_ui_color_presets(raw: str) -> dict[str, dict[str, str]]:
     try:
         data = json.loads(raw)
     except json.JSONDecodeError:
@@ -170,6 +189,11 @@ def load_ui_color_presets(mode: str) -> dict[str, dict[str, str]]:
     return presets
 
 
+def load_ui_color_presets(mode: str) -> dict[str, dict[str, str]]:
+    presets = _load_parsed_setting(f"ui_color_presets_{mode}", "{}", _parse_ui_color_presets)
+    return {name: dict(colors) for name, colors in presets.items()}
+
+
 def save_ui_color_presets(mode: str, presets: dict[str, dict[str, str]]) -> None:
     payload: dict[str, dict[str, str]] = {}
     for name, colors in presets.items():
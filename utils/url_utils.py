@@ -1,26 +1,38 @@
 # -*- coding: utf-8 -*-  # 文字コード指定
 from __future__ import annotations  # 型ヒントの将来互換対応
-import datetime as dt  # 日時操作
+import os  # フォルダ一覧の取得
 import re  # 文字列の正規化処理
+import time  # 現在時刻の取得
 from pathlib import Path  # パス操作
-from urllib.parse import parse_qs, urlparse  # URL解析
+from urllib.parse import parse_qs, urlsplit  # URL解析
+
+_UNSAFE_CHAR_TABLE = str.maketrans(  # 禁止文字と制御文字を1回の走査で"_"へ置換する変換表
+    {**{char: "_" for char in '\\/:*?"<>|'}, **{chr(code): "_" for code in range(0x20)}}
+)
+_WHITESPACE_RE = re.compile(r"\s+")  # 連続する空白
+_RECORDING_NAME_FORMAT = "%d年%02d月%02d日-%02d時%02d分%02d秒"  # 既定の録画名 (年月日-時分秒)
+_STREAMER_MAP_CACHE: dict[str, dict[str, str]] = {}  # 設定文字列 -> 解析済みマッピング (最新の1件のみ)
 
 def parse_auto_url_list(raw_text: str) -> list[str]:  # 自動録画URLの解析
     urls: list[str] = []  # URLリストを初期化
+    seen: set[str] = set()  # 追加済みURL (重複判定をリスト走査にしない)
     for line in raw_text.splitlines():  # 行ごとに処理
         candidate = line.strip()  # 空白を除去
         if not candidate:  # 空行の場合
             continue  # スキップ
-        if candidate in urls:  # 重複の場合
+        if candidate in seen:  # 重複の場合
             continue  # スキップ
+        seen.add(candidate)  # 追加済みとして記録
         urls.append(candidate)  # URLを追加
     return urls  # URL一覧を返却
 
 def merge_unique_urls(*url_lists: list[str]) -> list[str]:  # URL一覧の重複排除結合
     merged: list[str] = []  # 結果リストを初期化
+    seen: set[str] = set()  # 追加済みURL (重複判定をリスト走査にしない)
     for url_list in url_lists:  # 各一覧を処理
         for url in url_list:  # URLごとに処理
-            if url not in merged:  # 未登録の場合
+            if url not in seen:  # 未登録の場合
+                seen.add(url)  # 追加済みとして記録
                 merged.append(url)  # 追加
     return merged  # 結合済み一覧を返却
 
@@ -28,14 +40,13 @@ def safe_filename_component(text: str) -> str:  # ファイル名の安全化
     cleaned = text.strip()  # 文字列を正規化
     if not cleaned:  # 空の場合
         return "stream"  # 既定名を返却
-    replaced = re.sub(r'[\\/:*?"<>|]', "_", cleaned)  # 禁止文字を置換
-    replaced = re.sub(r"[\x00-\x1f]", "_", replaced)  # 制御文字を置換
-    collapsed = re.sub(r"\s+", " ", replaced).strip()  # 空白を整理
+    replaced = cleaned.translate(_UNSAFE_CHAR_TABLE)  # 禁止文字と制御文字を置換
+    collapsed = _WHITESPACE_RE.sub(" ", replaced).strip()  # 空白を整理
     collapsed = collapsed.rstrip(". ")  # 末尾のドットと空白を削除
     return collapsed if collapsed else "stream"  # 空の場合は既定名
 
 def derive_channel_label(url: str) -> str:  # URLからチャンネル名を推定
-    parsed = urlparse(url)  # URLを解析
+    parsed = urlsplit(url)  # URLを分解 (1件につき1回、使わないparamsは解析しない)
     host = parsed.netloc  # ホストを取得
     path = parsed.path  # パスを取得
     if not host and path:  # スキーム無しURLの場合
@@ -43,7 +54,7 @@ def derive_channel_label(url: str) -> str:  # URLからチャンネル名を推
         host = parts[0] if parts else ""  # 先頭をホストとして使用
         path = "/".join(parts[1:])  # 残りをパスとして扱う
     host = host.replace("www.", "")  # wwwを除去
-    query = parse_qs(parsed.query)  # クエリを解析
+    query = parse_qs(parsed.query) if "v=" in parsed.query else {}  # 動画IDがあり得る場合のみクエリを解析
     candidate = ""  # 候補文字列を初期化
     if "v" in query and query["v"]:  # 動画IDがある場合
         candidate = query["v"][0]  # 動画IDを使用
@@ -58,6 +69,17 @@ def derive_channel_label(url: str) -> str:  # URLからチャンネル名を推
     return safe_filename_component(label)  # 安全なラベルを返却
 
 def parse_streamer_filename_map(raw_text: str) -> dict[str, str]:  # 配信者別ファイル名の解析
+    return dict(_cached_streamer_filename_map(raw_text))  # 呼び出し側が変更してもキャッシュに影響しない写しを返却
+
+def _cached_streamer_filename_map(raw_text: str) -> dict[str, str]:  # 同じ設定文字列の再解析を避ける
+    mapping = _STREAMER_MAP_CACHE.get(raw_text)  # 解析済みの結果を取得
+    if mapping is None:  # 設定文字列が変わった場合
+        mapping = _parse_streamer_filename_map(raw_text)  # 解析し直す
+        _STREAMER_MAP_CACHE.clear()  # 古い結果を破棄
+        _STREAMER_MAP_CACHE[raw_text] = mapping  # 最新の結果を保持
+    return mapping  # 解析済みのマッピングを返却
+
+def _parse_streamer_filename_map(raw_text: str) -> dict[str, str]:  # マッピング文字列の解析本体
     mapping: dict[str, str] = {}  # マッピング辞書を初期化
     for line in raw_text.splitlines():  # 行ごとに処理
         entry = line.strip()  # 文字列を正規化
@@ -75,26 +97,29 @@ def parse_streamer_filename_map(raw_text: str) -> dict[str, str]:  # 配信者
     return mapping  # マッピングを返却
 
 def resolve_streamer_filename(url: str, raw_text: str) -> str | None:  # 配信者別ファイル名の取得
-    mapping = parse_streamer_filename_map(raw_text)  # マッピングを解析
+    mapping = _cached_streamer_filename_map(raw_text)  # 解析済みのマッピングを取得 (読み取りのみ)
     label = derive_channel_label(url)  # 配信者ラベルを生成
     filename = mapping.get(label)  # マッピングから取得
     return filename if filename else None  # ファイル名を返却
 
 def build_default_recording_name() -> str:  # 既定ファイル名を生成
-    now = dt.datetime.now()  # 現在時刻を取得
-    timestamp = (  # 日付時刻を生成
-        f"{now.year}年{now.month:02d}月{now.day:02d}日-"  # 年月日を生成
-        f"{now.hour:02d}時{now.minute:02d}分{now.second:02d}秒"  # 時分秒を生成
-    )  # 日付時刻生成の終了
-    return timestamp  # 既定名を返却
+    # 書式化は1回の%演算で行う (strftimeは環境によって日本語を含む書式を扱えないため使わない)
+    return _RECORDING_NAME_FORMAT % time.localtime()[:6]  # 年月日-時分秒を返却
 
 def ensure_unique_path(candidate: Path) -> Path:  # パスの重複回避
     if not candidate.exists():  # 未使用の場合
         return candidate  # そのまま返却
     base = candidate.with_suffix("")  # 拡張子を除いたベース
     suffix = candidate.suffix  # 拡張子を取得
+    try:  # フォルダの一覧を1回だけ取得し、連番ごとの存在確認を省く
+        existing = {os.path.normcase(name) for name in os.listdir(candidate.parent)}  # 既存の名前 (大文字小文字はOSに合わせる)
+    except OSError:  # 一覧を取得できない場合
+        existing = None  # 従来どおり1件ずつ確認
     for index in range(1, 1000):  # 連番を探索
         numbered = base.with_name(f"{base.name}_{index}").with_suffix(suffix)  # 連番パス生成
-        if not numbered.exists():  # 未使用の場合
+        if existing is not None:  # 一覧がある場合
+            if os.path.normcase(numbered.name) not in existing:  # 未使用の場合
+                return numbered  # 未使用パスを返却
+        elif not numbered.exists():  # 未使用の場合
             return numbered  # 未使用パスを返却
     return base.with_name(f"{base.name}_overflow").with_suffix(suffix)  # 最終手段のパス
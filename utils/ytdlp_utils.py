@@ -3,13 +3,167 @@ from __future__ import annotations  # 型ヒントの将来互換対応
 import json  # JSON解析
 import shutil  # 実行ファイル探索
 import subprocess  # 外部コマンド実行
+import sys  # 実行中のインタプリタ
 import threading  # 停止フラグ
-import time  # ポーリング待機
+import time  # 実行時間の上限
 from typing import Callable, Optional  # 型ヒント補助
 
+YTDLP_STOP_CHECK_INTERVAL_SEC = 0.2  # 停止フラグを確認する間隔 (待機中も出力は読み続ける)
+YTDLP_PROBE_TIMEOUT_SEC = 30.0  # 配信確認でyt-dlpの応答を待つ上限秒数 (応答しない場合は打ち切る)
+_YTDLP_COMMON_FLAGS = ("--no-playlist", "--no-warnings")  # 全コマンド共通の引数 (プレイリスト無効・警告抑制)
+_YTDLP_FORMAT_LIST_ARGS = ("-F",)  # フォーマット一覧用の引数
+_YTDLP_METADATA_ARGS = ("-J",)  # メタ情報(JSON)用の引数
+_YTDLP_PATH: list[str] = []  # 見つかったyt-dlpのパス (未発見なら空)
+_YTDLP_MODULE: list = []  # 読み込み済みのyt_dlpモジュール (未確認なら空、無ければNone)
+
+
+def find_ytdlp_path() -> Optional[str]:  # yt-dlpのパスを解決 (見つかった後はPATHを探索し直さない)
+    if _YTDLP_PATH:  # 発見済みの場合
+        return _YTDLP_PATH[0]  # 保持したパスを返却
+    path = shutil.which("yt-dlp")  # PATHを探索
+    if path:  # 見つかった場合のみ保持 (未導入の結果は保持せず、起動中に導入されても次の探索で見つける)
+        _YTDLP_PATH.append(path)  # 探索結果を保持
+    return path  # 探索結果を返却
+
 
 def is_ytdlp_available() -> bool:  # yt-dlpの有無を確認
-    return bool(shutil.which("yt-dlp"))  # 実行ファイルの有無を返却
+    return bool(find_ytdlp_path()) or _load_ytdlp_module() is not None  # 実行ファイルかモジュールの有無を返却
+
+
+def _load_ytdlp_module():  # yt_dlpモジュールを読み込む (導入されていない場合はNone)
+    if not _YTDLP_MODULE:  # 未確認の場合
+        try:  # 読み込みはアプリ起動時ではなく初回利用時に行う
+            import yt_dlp  # yt-dlp本体
+        except ImportError:  # 導入されていない場合 (配布版など)
+            yt_dlp = None  # 外部コマンドで実行する
+        _YTDLP_MODULE.append(yt_dlp)  # 結果を保持
+    return _YTDLP_MODULE[0]  # モジュールを返却
+
+
+class _SilentYtdlpLogger:  # yt-dlpの画面出力を捨てる (失敗内容は例外から取得する)
+    def debug(self, message: str) -> None:
+        pass
+
+    info = warning = error = debug
+
+
+def _extract_info_in_process(module, url: str, params: dict) -> dict:  # プロセスを起動せずにyt-dlpで解析
+    options = {
+        "quiet": True,
+        "no_warnings": True,
+        "noplaylist": True,
+        "skip_download": True,
+        "logger": _SilentYtdlpLogger(),
+        **params,
+    }
+    # YoutubeDLはスレッド間で共有できないため、呼び出しごとに生成する (生成はモジュール読み込みより十分軽い)
+    with module.YoutubeDL(options) as ydl:
+        return ydl.sanitize_info(ydl.extract_info(url, download=False))  # -Jと同じ形に整えて返却
+
+
+def _extract_info_until_deadline(  # 停止・時間切れで待機を打ち切れるプロセス内解析
+    module,  # yt_dlpモジュール
+    url: str,  # 対象URL
+    params: dict,  # 解析オプション
+    stop_event: Optional[threading.Event] = None,  # 停止フラグ
+    timeout: Optional[float] = None,  # 解析全体の上限秒数 (Noneなら終了まで待つ)
+) -> Optional[dict]:  # 解析結果を返却 (停止時・時間切れ時はNone)
+    if stop_event is None and timeout is None:  # 打ち切る条件が無い場合
+        return _extract_info_in_process(module, url, params)  # 呼び出し元のスレッドで解析
+    result: list = []  # 解析結果または例外
+    def _extract() -> None:  # 別スレッドでの解析
+        try:
+            result.append(_extract_info_in_process(module, url, params))
+        except Exception as exc:  # 解析失敗時は呼び出し元で扱う
+            result.append(exc)
+    worker = threading.Thread(target=_extract, name="ytdlp-extract", daemon=True)  # 打ち切り後は終了を待たない
+    worker.start()  # 解析開始
+    deadline = None if timeout is None else time.monotonic() + timeout  # 打ち切る時刻
+    while worker.is_alive():  # 解析中は停止フラグと期限を確認し続ける
+        if stop_event is not None and stop_event.is_set():  # 停止要求の場合
+            return None  # 待機を中止
+        wait = YTDLP_STOP_CHECK_INTERVAL_SEC  # 次の確認までの待機
+        if deadline is not None:  # 上限がある場合
+            remaining = deadline - time.monotonic()  # 残り時間
+            if remaining <= 0:  # 時間切れの場合
+                return None  # 待機を中止 (解析スレッドは応答後に自然に終了する)
+            wait = min(wait, remaining)  # 期限を越えて待たない
+        worker.join(wait)  # 解析の終了を待機
+    if isinstance(result[0], Exception):  # 解析失敗の場合
+        raise result[0]  # 呼び出し元へ伝える
+    return result[0]  # 解析結果を返却
+
+
+def _requested_stream_urls(info: dict) -> list[str]:  # -gと同じく選択されたフォーマットのURLを列挙
+    entries = info.get("entries")  # 複数動画の場合
+    if entries is not None:
+        return [stream_url for entry in entries if entry for stream_url in _requested_stream_urls(entry)]
+    formats = info.get("requested_formats") or [info]  # 映像と音声が別の場合はそれぞれ
+    return [fmt["url"] for fmt in formats if fmt.get("url")]
+
+
+def _run_ytdlp_command(  # 停止フラグに応じて中断できるyt-dlp実行
+    command: list[str],  # 実行コマンド
+    stop_event: Optional[threading.Event] = None,  # 停止フラグ
+    timeout: Optional[float] = None,  # 実行時間の上限秒数 (Noneなら終了まで待つ)
+) -> Optional[tuple[int, bytes, bytes]]:  # (終了コード, stdout, stderr)を返却 (停止時・時間切れ時はNone)
+    process = subprocess.Popen(  # 出力はバイト列のまま受け取り、必要な部分だけ呼び出し側で復号する
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    interval = None if stop_event is None else YTDLP_STOP_CHECK_INTERVAL_SEC  # 停止フラグが無ければ終了まで待つ
+    deadline = None if timeout is None else time.monotonic() + timeout  # 打ち切る時刻
+    while True:
+        wait = interval
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.monotonic())
+            wait = remaining if wait is None else min(wait, remaining)
+        try:
+            # 終了した時点で即座に戻り、待機中もパイプを読み切るため出力の詰まりで止まらない
+            stdout, stderr = process.communicate(timeout=wait)
+        except subprocess.TimeoutExpired:
+            stopped = stop_event is not None and stop_event.is_set()
+            if stopped or (deadline is not None and time.monotonic() >= deadline):
+                process.terminate()
+                try:
+                    process.wait(timeout=3)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                return None
+            continue
+        return process.returncode, stdout or b"", stderr or b""
+
+
+def _build_ytdlp_command(  # yt-dlpコマンドを組み立てる
+    args: tuple[str, ...],  # 用途別の引数
+    url: str,  # 対象URL
+    log_cb: Optional[Callable[[str], None]] = None,  # ログ出力
+) -> Optional[list[str]]:  # コマンドを返却 (yt-dlpが無い場合はNone)
+    yt_dlp_path = find_ytdlp_path()  # yt-dlpを探索
+    if yt_dlp_path:  # 実行ファイルがある場合
+        prefix = [yt_dlp_path]  # そのまま実行
+    elif not getattr(sys, "frozen", False) and _load_ytdlp_module() is not None:  # モジュールのみ導入されている場合
+        prefix = [sys.executable, "-m", "yt_dlp"]  # 同じインタプリタで別プロセスとして実行
+    else:  # 外部コマンドで実行できない場合
+        if log_cb is not None:  # ログがある場合
+            log_cb("yt-dlpが見つかりません。PATHに追加してください。")  # 通知
+        return None  # 実行不可
+    return [*prefix, *args, *_YTDLP_COMMON_FLAGS, url]  # 共通の引数を付けて組み立て
+
+
+def _log_ytdlp_failure(  # yt-dlp失敗時のstderr末尾を通知
+    log_cb: Optional[Callable[[str], None]],  # ログ出力
+    message: str,  # 通知文
+    stderr: bytes | str,  # stderrの内容 (プロセス内で解析した場合は例外の文言)
+) -> None:
+    if log_cb is None:  # ログが無い場合
+        return  # 何もしない
+    if isinstance(stderr, bytes):  # 外部コマンドの出力の場合
+        stderr = stderr.decode("utf-8", errors="replace")  # 失敗時のみ復号
+    stderr_text = stderr.strip()  # 前後の空白を除去
+    tail = "\n".join(stderr_text.splitlines()[-3:]) if stderr_text else "詳細不明"  # 末尾のみ
+    log_cb(f"{message}: {tail}")  # 通知
 
 
 def fetch_stream_urls_with_ytdlp(  # yt-dlpで配信URLを取得
@@ -17,47 +171,38 @@ def fetch_stream_urls_with_ytdlp(  # yt-dlpで配信URLを取得
     format_selector: str,  # フォーマット指定
     log_cb: Optional[Callable[[str], None]] = None,  # ログ出力
     stop_event: Optional[threading.Event] = None,  # 停止フラグ
+    timeout: Optional[float] = None,  # 応答を待つ上限秒数 (Noneなら終了まで待つ)
 ) -> list[str]:  # 取得結果を返却
-    yt_dlp_path = shutil.which("yt-dlp")  # yt-dlpを探索
-    if not yt_dlp_path:  # 見つからない場合
+    # 解析はCPUを使いGILを長く保持するため、同時に呼ばれる配信確認やUIから呼ぶ処理は外部コマンドで実行する
+    command = _build_ytdlp_command(("-g", "-f", format_selector), url)  # 直リンクを出力
+    module = _load_ytdlp_module() if command is None else None  # 外部コマンドで実行できない配布版のみプロセス内で解析
+    if command is None and module is None:  # yt-dlpが無い場合
         if log_cb is not None:  # ログがある場合
             log_cb("yt-dlpが見つかりません。PATHに追加してください。")  # 通知
         return []  # 取得不可
-    command = [  # yt-dlpコマンド
-        yt_dlp_path,  # yt-dlp本体
-        "-g",  # 直リンクを出力
-        "-f",  # フォーマット指定
-        format_selector,  # フォーマット
-        "--no-playlist",  # プレイリスト無効
-        "--no-warnings",  # 警告抑制
-        url,  # 対象URL
-    ]  # コマンド定義終了
-    process = subprocess.Popen(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        encoding="utf-8",
-        errors="replace",
-    )
-    while process.poll() is None:
-        if stop_event is not None and stop_event.is_set():
-            process.terminate()
-            try:
-                process.wait(timeout=3)
-            except subprocess.TimeoutExpired:
-                process.kill()
-            return []
-        time.sleep(0.1)
-    stdout, stderr = process.communicate()
-    result = subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
-    if result.returncode != 0:  # 失敗時
-        stderr_text = result.stderr.strip()  # stderrを取得
-        if log_cb is not None:  # ログがある場合
-            tail = "\n".join(stderr_text.splitlines()[-3:]) if stderr_text else "詳細不明"  # 末尾のみ
-            log_cb(f"yt-dlpで配信URLを取得できませんでした: {tail}")  # 通知
-        return []  # 取得不可
-    urls = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+    if module is not None:  # yt_dlpモジュールのみ使える場合
+        try:  # 上限時間と停止フラグは解析全体に対して適用する
+            info = _extract_info_until_deadline(module, url, {"format": format_selector}, stop_event, timeout)  # 解析
+        except Exception as exc:  # 解析失敗時
+            _log_ytdlp_failure(log_cb, "yt-dlpで配信URLを取得できませんでした", str(exc))  # 通知
+            return []  # 取得不可
+        if info is None:  # 停止または時間切れの場合
+            if log_cb is not None and not (stop_event is not None and stop_event.is_set()):  # 時間切れの場合
+                log_cb(f"yt-dlpが{timeout:g}秒以内に応答しないため打ち切りました。")  # 通知
+            return []  # 取得中止
+        urls = _requested_stream_urls(info)  # 選択されたURLを取得
+    else:  # 外部コマンドで実行する場合
+        completed = _run_ytdlp_command(command, stop_event, timeout)  # 停止可能な形で実行
+        if completed is None:  # 停止または時間切れの場合
+            if log_cb is not None and not (stop_event is not None and stop_event.is_set()):  # 時間切れの場合
+                log_cb(f"yt-dlpが{timeout:g}秒以内に応答しないため打ち切りました。")  # 通知
+            return []  # 取得中止
+        returncode, stdout, stderr = completed  # 実行結果を展開
+        if returncode != 0:  # 失敗時
+            _log_ytdlp_failure(log_cb, "yt-dlpで配信URLを取得できませんでした", stderr)  # 通知
+            return []  # 取得不可
+        # 成功時はstderrを復号せず、URLの行だけを復号する
+        urls = [line.decode("utf-8", errors="replace") for line in map(bytes.strip, stdout.splitlines()) if line]
     if urls:
         return urls
     if log_cb is not None:  # ログがある場合
@@ -71,42 +216,17 @@ def fetch_format_list_with_ytdlp(  # yt-dlpでフォーマット一覧を取得
     stop_event: Optional[threading.Event] = None,  # 停止フラグ
     max_lines: int = 80,  # 出力行数上限
 ) -> list[str]:  # フォーマット行一覧を返却
-    yt_dlp_path = shutil.which("yt-dlp")
-    if not yt_dlp_path:
-        if log_cb is not None:
-            log_cb("yt-dlpが見つかりません。PATHに追加してください。")
+    command = _build_ytdlp_command(_YTDLP_FORMAT_LIST_ARGS, url, log_cb)
+    if command is None:
         return []
-    command = [
-        yt_dlp_path,
-        "-F",
-        "--no-playlist",
-        "--no-warnings",
-        url,
-    ]
-    process = subprocess.Popen(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        encoding="utf-8",
-        errors="replace",
-    )
-    while process.poll() is None:
-        if stop_event is not None and stop_event.is_set():
-            process.terminate()
-            try:
-                process.wait(timeout=3)
-            except subprocess.TimeoutExpired:
-                process.kill()
-            return []
-        time.sleep(0.1)
-    stdout, stderr = process.communicate()
-    if process.returncode != 0:
-        if log_cb is not None:
-            tail = "\n".join((stderr or "").splitlines()[-3:]) if stderr else "詳細不明"
-            log_cb(f"yt-dlpのフォーマット取得に失敗しました: {tail}")
+    completed = _run_ytdlp_command(command, stop_event)
+    if completed is None:
+        return []
+    returncode, stdout, stderr = completed
+    if returncode != 0:
+        _log_ytdlp_failure(log_cb, "yt-dlpのフォーマット取得に失敗しました", stderr)
         return []
-    lines = [line.rstrip() for line in stdout.splitlines() if line.strip()]
+    lines = [line for line in map(str.rstrip, stdout.decode("utf-8", errors="replace").splitlines()) if line.lstrip()]
     if log_cb is not None and lines:
         clipped = lines[: max_lines]
         suffix = "\n...(省略)" if len(lines) > max_lines else ""
@@ -118,44 +238,45 @@ def fetch_stream_url_with_ytdlp(  # yt-dlpで配信URLを取得
     url: str,  # 配信URL
     log_cb: Optional[Callable[[str], None]] = None,  # ログ出力
     stop_event: Optional[threading.Event] = None,  # 停止フラグ
+    timeout: Optional[float] = None,  # 応答を待つ上限秒数 (Noneなら終了まで待つ)
 ) -> Optional[str]:  # 取得結果を返却
-    urls = fetch_stream_urls_with_ytdlp(url, "best", log_cb=log_cb, stop_event=stop_event)
+    urls = fetch_stream_urls_with_ytdlp(url, "best", log_cb=log_cb, stop_event=stop_event, timeout=timeout)
     return urls[0] if urls else None
 
 
 def fetch_metadata_with_ytdlp(  # yt-dlpでメタ情報を取得
     url: str,  # 配信URL
     log_cb: Optional[Callable[[str], None]] = None,  # ログ出力
+    timeout: Optional[float] = YTDLP_PROBE_TIMEOUT_SEC,  # 応答を待つ上限秒数 (Noneなら終了まで待つ)
 ) -> Optional[dict]:  # 取得結果を返却
-    yt_dlp_path = shutil.which("yt-dlp")  # yt-dlpを探索
-    if not yt_dlp_path:  # 見つからない場合
+    # 表示名の取得でGUIスレッドから呼ばれるため、GILを保持しない外部コマンドで実行する
+    command = _build_ytdlp_command(_YTDLP_METADATA_ARGS, url)  # JSON出力
+    module = _load_ytdlp_module() if command is None else None  # 外部コマンドで実行できない配布版のみプロセス内で解析
+    if command is None and module is None:  # yt-dlpが無い場合
         if log_cb is not None:  # ログがある場合
             log_cb("yt-dlpが見つかりません。PATHに追加してください。")  # 通知
         return None  # 取得不可
-    command = [  # yt-dlpコマンド
-        yt_dlp_path,  # yt-dlp本体
-        "-J",  # JSON出力
-        "--no-playlist",  # プレイリスト無効
-        "--no-warnings",  # 警告抑制
-        url,  # 対象URL
-    ]  # コマンド定義終了
-    result = subprocess.run(  # yt-dlp実行
-        command,  # コマンド指定
-        capture_output=True,  # 出力取得
-        text=True,  # テキストとして取得
-        encoding="utf-8",  # 文字コード指定
-        errors="replace",  # デコード失敗時は置換
-        check=False,  # 例外にしない
-    )  # 実行結果を取得
-    if result.returncode != 0:  # 失敗時
-        stderr_text = result.stderr.strip()  # stderrを取得
+    if module is not None:  # yt_dlpモジュールのみ使える場合
+        try:  # 上限時間は解析全体に対して適用する
+            info = _extract_info_until_deadline(module, url, {}, timeout=timeout)  # 解析
+        except Exception as exc:  # 解析失敗時
+            _log_ytdlp_failure(log_cb, "yt-dlpでメタ情報を取得できませんでした", str(exc))  # 通知
+            return None  # 取得不可
+        if info is None and log_cb is not None:  # 時間切れの場合
+            log_cb(f"yt-dlpが{timeout:g}秒以内に応答しないため打ち切りました。")  # 通知
+        return info  # メタ情報を返却
+    completed = _run_ytdlp_command(command, timeout=timeout)  # 上限時間付きで実行
+    if completed is None:  # 時間切れの場合
         if log_cb is not None:  # ログがある場合
-            tail = "\n".join(stderr_text.splitlines()[-3:]) if stderr_text else "詳細不明"  # 末尾のみ
-            log_cb(f"yt-dlpでメタ情報を取得できませんでした: {tail}")  # 通知
+            log_cb(f"yt-dlpが{timeout:g}秒以内に応答しないため打ち切りました。")  # 通知
+        return None  # 取得中止
+    returncode, stdout, stderr = completed  # 実行結果を展開
+    if returncode != 0:  # 失敗時
+        _log_ytdlp_failure(log_cb, "yt-dlpでメタ情報を取得できませんでした", stderr)  # 通知
         return None  # 取得不可
     try:  # JSON解析
-        return json.loads(result.stdout)  # JSONを返却
-    except ValueError:  # JSON解析失敗時
+        return json.loads(stdout)  # バイト列から直接JSONを解析して返却
+    except ValueError:  # JSON解析失敗時 (UTF-8として不正な場合も含む)
         if log_cb is not None:  # ログがある場合
             log_cb("yt-dlpのJSON解析に失敗しました。")  # 通知
         return None  # 取得不可